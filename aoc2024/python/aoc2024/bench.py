@@ -0,0 +1,158 @@
+"""Repeated timing of solvers with summary statistics."""
+
+import math
+import resource
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+DEFAULT_WARMUP = 1
+DEFAULT_REPEAT = 10
+
+
+class Sample(NamedTuple):
+    """Wall-clock and CPU time for one call, in seconds."""
+
+    wall: float
+    cpu: float
+
+
+class Memory(NamedTuple):
+    """Peak memory use during one call, in bytes."""
+
+    peak: int
+    rss: int
+
+
+@dataclass
+class Stats:
+    """Summary statistics over a set of timings, in seconds."""
+
+    n: int
+    min: float
+    median: float
+    p95: float
+    stddev: float
+
+
+def measure(
+    func: Callable[..., Any],
+    *args: Any,
+    warmup: int = 0,
+    repeat: int = 1,
+) -> tuple[Any, list[Sample]]:
+    """Call a function repeatedly, timing each call.
+
+    Args:
+        func: Function to time
+        *args: Arguments passed to every call
+        warmup: Number of untimed calls made first
+        repeat: Number of timed calls
+
+    Returns:
+        The answer from the last call and one sample per timed call
+    """
+    for _ in range(warmup):
+        func(*args)
+
+    answer = None
+    samples = []
+    for _ in range(max(repeat, 1)):
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        answer = func(*args)
+        cpu = time.process_time() - cpu_start
+        wall = time.perf_counter() - wall_start
+        samples.append(Sample(wall, cpu))
+    return answer, samples
+
+
+def reset_rss_peak() -> None:
+    """Reset the process's RSS high-water mark, where the OS allows it.
+
+    Only Linux supports this. Elsewhere the mark covers the whole life
+    of the process, so later parts report at least the earlier peaks.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def rss_peak() -> int:
+    """Get the process's RSS high-water mark in bytes."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, everything else kilobytes
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def measure_memory(func: Callable[..., Any], *args: Any) -> tuple[Any, Memory]:
+    """Call a function once, recording its peak memory use.
+
+    The traced peak counts Python objects and NumPy arrays, which report
+    their buffers to tracemalloc. The RSS peak is for the whole process,
+    so it includes the interpreter and everything already loaded. The
+    call is made separately from any timed runs, as tracing slows it
+    down considerably.
+
+    Returns:
+        The answer and the memory used
+    """
+    import tracemalloc
+
+    reset_rss_peak()
+    tracemalloc.start()
+    try:
+        answer = func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return answer, Memory(peak, rss_peak())
+
+
+def format_bytes(size: int) -> str:
+    """Format a size in bytes as kibibytes or mebibytes."""
+    if size < 2**20:
+        return f"{size / 2**10:.1f} KiB"
+    return f"{size / 2**20:.1f} MiB"
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile, which is always one of the values."""
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarise(values: list[float]) -> Stats:
+    """Compute summary statistics for a non-empty list of timings."""
+    import statistics
+
+    return Stats(
+        n=len(values),
+        min=min(values),
+        median=statistics.median(values),
+        p95=percentile(values, 95),
+        stddev=statistics.stdev(values) if len(values) > 1 else 0.0,
+    )
+
+
+def describe(samples: list[Sample]) -> str:
+    """Format a set of samples for display after an answer."""
+    wall = summarise([s.wall for s in samples])
+    cpu = summarise([s.cpu for s in samples])
+    return (
+        f"median {wall.median:.6f}s ± {wall.stddev:.6f}s, "
+        f"min {wall.min:.6f}s, p95 {wall.p95:.6f}s, "
+        f"cpu {cpu.median:.6f}s; {wall.n} runs"
+    )
@@ -1,11 +1,9 @@
-import time
-
 import click
 
-from aoc2024.utils import load_lines, save_answer, save_timing
+from aoc2024.harness import day_options, run_day
 
 
-def parse_input(lines: list[str]) -> tuple[list[int], list[int]]:
+def parse(lines: list[str]) -> tuple[list[int], list[int]]:
     """Parse the input lines into two lists of integers."""
     left_list = []
     right_list = []
@@ -18,9 +16,9 @@ def parse_input(lines: list[str]) -> tuple[list[int], list[int]]:
     return left_list, right_list
 
 
-def solve_part1(lines: list[str]) -> int:
+def solve_part1(input_data: tuple[list[int], list[int]]) -> int:
     """Solve part 1: total distance between sorted lists."""
-    left_list, right_list = parse_input(lines)
+    left_list, right_list = input_data
 
     left_sorted = sorted(left_list)
     right_sorted = sorted(right_list)
@@ -32,9 +30,9 @@ def solve_part1(lines: list[str]) -> int:
     return total_distance
 
 
-def solve_part2(lines: list[str]) -> int:
+def solve_part2(input_data: tuple[list[int], list[int]]) -> int:
     """Solve part 2: similarity score."""
-    left_list, right_list = parse_input(lines)
+    left_list, right_list = input_data
 
     # Count occurrences in right list
     right_counts = {}
@@ -47,37 +45,10 @@ def solve_part2(lines: list[str]) -> int:
 
 
 @click.command()
-@click.option(
-    "--test", is_flag=True, help="Run on example data instead of real input"
-)
-@click.option(
-    "--part",
-    type=click.Choice(["1", "2", "both"]),
-    default="both",
-    help="Which part to solve",
-)
-def main(test: bool, part: str) -> None:
+@day_options
+def main(**options) -> None:
     """Solve Advent of Code 2024 Day 1."""
-    day = 1
-    lines = load_lines(day, use_example=test)
-
-    if part in ("1", "both"):
-        start = time.perf_counter()
-        answer1 = solve_part1(lines)
-        elapsed1 = time.perf_counter() - start
-        print(f"Part 1: {answer1} ({elapsed1:.3f}s)")
-        save_answer(day, 1, answer1, use_example=test)
-        if not test:
-            save_timing(day, 1, elapsed1)
-
-    if part in ("2", "both"):
-        start = time.perf_counter()
-        answer2 = solve_part2(lines)
-        elapsed2 = time.perf_counter() - start
-        print(f"Part 2: {answer2} ({elapsed2:.3f}s)")
-        save_answer(day, 2, answer2, use_example=test)
-        if not test:
-            save_timing(day, 2, elapsed2)
+    run_day(1, **options)
 
 
 if __name__ == "__main__":
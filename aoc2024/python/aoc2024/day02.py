@@ -1,11 +1,9 @@
-import time
-
 import click
 
-from aoc2024.utils import load_lines, save_answer, save_timing
+from aoc2024.harness import day_options, run_day
 
 
-def parse_input(lines: list[str]):
+def parse(lines: list[str]) -> list[list[int]]:
     """Parse the input lines."""
     return [
         [int(number_string) for number_string in line.strip().split(" ")]
@@ -34,48 +32,21 @@ def is_safe_dampened(levels):
     return False
 
 
-def solve_part1(lines: list[str]) -> int:
+def solve_part1(input_data: list[list[int]]) -> int:
     """Solve part 1."""
-    input_data = parse_input(lines)
     return sum([is_safe(levels) for levels in input_data])
 
 
-def solve_part2(lines: list[str]) -> int:
+def solve_part2(input_data: list[list[int]]) -> int:
     """Solve part 2."""
-    input_data = parse_input(lines)
     return sum([is_safe_dampened(levels) for levels in input_data])
 
 
 @click.command()
-@click.option("--test", is_flag=True, help="Run on example data")
-@click.option(
-    "--part",
-    type=click.Choice(["1", "2", "both"]),
-    default="both",
-    help="Which part to solve",
-)
-def main(test: bool, part: str) -> None:
+@day_options
+def main(**options) -> None:
     """Solve Advent of Code 2024 Day 02."""
-    day = 2
-    lines = load_lines(day, use_example=test)
-
-    if part in ("1", "both"):
-        start = time.perf_counter()
-        answer1 = solve_part1(lines)
-        elapsed1 = time.perf_counter() - start
-        print(f"Part 1: {answer1} ({elapsed1:.3f}s)")
-        save_answer(day, 1, answer1, use_example=test)
-        if not test:
-            save_timing(day, 1, elapsed1)
-
-    if part in ("2", "both"):
-        start = time.perf_counter()
-        answer2 = solve_part2(lines)
-        elapsed2 = time.perf_counter() - start
-        print(f"Part 2: {answer2} ({elapsed2:.3f}s)")
-        save_answer(day, 2, answer2, use_example=test)
-        if not test:
-            save_timing(day, 2, elapsed2)
+    run_day(2, **options)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,148 @@
+"""Map a function over independent items with a pool of workers.
+
+On the free-threaded build of CPython (3.13t) threads run Python code in
+parallel, and share the items and anything they refer to, so nothing is
+pickled on the way in or out. With the GIL, threads only take turns, so
+by default `pmap` runs serially there rather than paying for a pool
+that cannot help. A process pool can be asked for instead, which scales
+on either build but pickles every item and result.
+
+The defaults can be set in pyproject.toml, where 0 workers means one
+per CPU on the free-threaded build and 1 with the GIL:
+
+    [tool.aoc2024.parallel]
+    workers = 0
+    executor = "thread"
+
+`configured` overrides them for a block, as the runner and the
+benchmark do. A pool's workers always map serially, so nested pools
+never multiply the number of workers.
+"""
+
+import os
+import sys
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+
+from aoc2024 import config
+
+EXECUTORS = ("thread", "process")
+# Chunks handed to each process, to spread the pickling over fewer calls
+CHUNKS_PER_WORKER = 4
+
+_local = threading.local()
+_overrides: dict[str, int | str] = {}
+
+
+def gil_enabled() -> bool:
+    """Whether the GIL is on, which is always the case before 3.13."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def build_name() -> str:
+    """Describe the running interpreter, e.g. "3.13.1t" when free-threaded."""
+    version = ".".join(map(str, sys.version_info[:3]))
+    return version if gil_enabled() else f"{version}t"
+
+
+def cpu_count() -> int:
+    return os.process_cpu_count() or 1
+
+
+def default_workers() -> int:
+    """The number of workers `pmap` uses by default."""
+    count = _overrides.get("workers")
+    if count is None:
+        count = config.section("parallel").get("workers", 0)
+    if not count:
+        count = 1 if gil_enabled() else cpu_count()
+    return int(count)
+
+
+def default_executor() -> str:
+    """The kind of pool `pmap` uses by default, "thread" or "process"."""
+    kind = _overrides.get("executor")
+    if kind is None:
+        kind = config.section("parallel").get("executor", "thread")
+    if kind not in EXECUTORS:
+        raise ValueError(f"Unknown executor {kind!r}")
+    return str(kind)
+
+
+@contextmanager
+def configured(
+    workers: int | None = None, executor: str | None = None
+) -> Iterator[None]:
+    """Override the default workers and executor within a block."""
+    previous = dict(_overrides)
+    if workers is not None:
+        _overrides["workers"] = workers
+    if executor is not None:
+        _overrides["executor"] = executor
+    try:
+        yield
+    finally:
+        _overrides.clear()
+        _overrides.update(previous)
+
+
+def _mark_worker() -> None:
+    _local.in_pool = True
+
+
+def in_pool() -> bool:
+    """Whether this thread is one of a pool's workers."""
+    return getattr(_local, "in_pool", False)
+
+
+def in_thread_pool() -> bool:
+    """Whether this thread is one of a thread pool's workers.
+
+    A process pool runs each call on its worker's main thread, so only a
+    thread pool's workers are other threads.
+    """
+    return (
+        in_pool() and threading.current_thread() is not threading.main_thread()
+    )
+
+
+def make_executor(kind: str, max_workers: int) -> Executor:
+    """Start a pool whose workers map serially if they call `pmap`."""
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers, initializer=_mark_worker)
+    return ThreadPoolExecutor(max_workers, initializer=_mark_worker)
+
+
+def pmap[T, R](
+    func: Callable[[T], R],
+    items: Iterable[T],
+    workers: int | None = None,
+    executor: str | None = None,
+) -> list[R]:
+    """Call a function on every item, in parallel where that can help.
+
+    Args:
+        func: Function of one item; for processes it must be picklable,
+            so defined at module level (or a partial of one)
+        items: Items to map over
+        workers: Number of workers (default: see `default_workers`)
+        executor: "thread" or "process" (default: see `default_executor`)
+
+    Returns:
+        The results in the same order as the items
+    """
+    items = list(items)
+    if workers is None:
+        workers = default_workers()
+    count = min(workers, len(items))
+    if count <= 1 or in_pool():
+        return [func(item) for item in items]
+    kind = executor or default_executor()
+    with make_executor(kind, count) as pool:
+        chunksize = 1
+        if kind == "process":
+            chunksize = max(len(items) // (count * CHUNKS_PER_WORKER), 1)
+        return list(pool.map(func, items, chunksize=chunksize))
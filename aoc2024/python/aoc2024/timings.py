@@ -0,0 +1,537 @@
+"""SQLite-backed store for timings and benchmark samples.
+
+The store lives next to the legacy `timings.csv`, which is imported the
+first time the store is opened. The Rust solutions still append to the
+CSV, so any rows added since the last import are picked up whenever the
+store is opened. Only the unread tail of the file is parsed, so opening
+the store does not get slower as the history grows.
+
+Writes happen in `BEGIN IMMEDIATE` transactions on a WAL-mode database,
+which serialises writers across processes while leaving readers free.
+
+Timings taken with `--memory` also carry the traced peak and the RSS
+high-water mark of the run, in bytes; other rows leave them NULL.
+
+A stage stopped by the watchdog is stored with its status (TIMEOUT or
+OOM) and the time it ran for. Those rows are left out of the latest
+timings and the history, which only cover stages that finished.
+"""
+
+import csv
+import io
+import json
+import sqlite3
+import statistics
+from collections.abc import Iterable, Iterator
+from contextlib import closing, contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple
+
+from aoc2024 import locations
+
+# Seconds to wait for another process to release the write lock
+BUSY_TIMEOUT = 30.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS timings (
+    id INTEGER PRIMARY KEY,
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    language TEXT NOT NULL,
+    time_seconds REAL NOT NULL,
+    timestamp TEXT NOT NULL,
+    peak_bytes INTEGER,
+    rss_bytes INTEGER,
+    status TEXT
+);
+CREATE INDEX IF NOT EXISTS timings_by_key
+    ON timings (day, part, language, timestamp);
+
+CREATE TABLE IF NOT EXISTS benchmarks (
+    id INTEGER PRIMARY KEY,
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    language TEXT NOT NULL,
+    warmup INTEGER NOT NULL,
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS benchmarks_by_key
+    ON benchmarks (day, part, language, timestamp);
+
+CREATE TABLE IF NOT EXISTS samples (
+    benchmark_id INTEGER NOT NULL REFERENCES benchmarks (id),
+    wall_seconds REAL NOT NULL,
+    cpu_seconds REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS samples_by_benchmark ON samples (benchmark_id);
+
+CREATE TABLE IF NOT EXISTS baselines (
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    language TEXT NOT NULL,
+    time_seconds REAL NOT NULL,
+    timestamp TEXT NOT NULL,
+    PRIMARY KEY (day, part, language)
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Tables whose rows are tracked by `changes_since`
+TRACKED_TABLES = ("timings",)
+
+# Columns added since the first release of the schema, by table
+ADDED_COLUMNS = {
+    "timings": {
+        "peak_bytes": "INTEGER",
+        "rss_bytes": "INTEGER",
+        "status": "TEXT",
+    },
+}
+
+
+class Timing(NamedTuple):
+    """A single timing row."""
+
+    day: int
+    part: int
+    language: str
+    time_seconds: float
+    timestamp: str
+    peak_bytes: int | None = None
+    rss_bytes: int | None = None
+    status: str | None = None
+
+
+class SampleSet(NamedTuple):
+    """Every (wall, cpu) sample from one benchmark of a part."""
+
+    day: int
+    part: int
+    language: str
+    warmup: int
+    samples: list[tuple[float, float]]
+    timestamp: str
+
+
+class Changes(NamedTuple):
+    """What was added to the store after a set of high-water marks."""
+
+    # The highest row id in each tracked table, to pass in next time
+    marks: dict[str, int]
+    days: set[int]
+    languages: set[str]
+    memory: bool
+
+
+def timing(
+    day: int,
+    part: int,
+    time_seconds: float,
+    language: str = "python",
+    peak_bytes: int | None = None,
+    rss_bytes: int | None = None,
+    status: str | None = None,
+) -> Timing:
+    """Build a timing row stamped with the current time."""
+    return Timing(
+        day,
+        part,
+        language,
+        time_seconds,
+        datetime.now().isoformat(),
+        peak_bytes,
+        rss_bytes,
+        status,
+    )
+
+
+def sample_set(
+    day: int,
+    part: int,
+    samples: list[tuple[float, float]],
+    warmup: int,
+    language: str = "python",
+) -> SampleSet:
+    """Build a benchmark sample set stamped with the current time."""
+    return SampleSet(
+        day, part, language, warmup, samples, datetime.now().isoformat()
+    )
+
+
+@contextmanager
+def open_store(path: Path | None = None) -> Iterator[sqlite3.Connection]:
+    """Open the timings database, creating and importing as needed.
+
+    Args:
+        path: Database file (default: locations.TIMINGS_DB)
+
+    Yields:
+        A connection in autocommit mode; use `transaction` to write
+    """
+    path = path or locations.TIMINGS_DB
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT, isolation_level=None)
+    with closing(conn):
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.executescript(SCHEMA)
+        add_missing_columns(conn)
+        import_legacy_files(conn)
+        yield conn
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Hold the database write lock until the block completes.
+
+    Taking the lock up front means concurrent writers queue instead of
+    failing part way through a batch.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _missing_columns(conn: sqlite3.Connection) -> list[tuple[str, str, str]]:
+    missing = []
+    for table, columns in ADDED_COLUMNS.items():
+        existing = {
+            row[1] for row in conn.execute(f"PRAGMA table_info({table})")
+        }
+        missing.extend(
+            (table, name, kind)
+            for name, kind in columns.items()
+            if name not in existing
+        )
+    return missing
+
+
+def add_missing_columns(conn: sqlite3.Connection) -> None:
+    """Bring a database created by an older schema up to date.
+
+    The columns are checked again once the write lock is held, in case
+    another process added them first.
+    """
+    if not _missing_columns(conn):
+        return
+    with transaction(conn):
+        for table, name, kind in _missing_columns(conn):
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {kind}")
+
+
+def _legacy_files() -> dict[str, Path]:
+    """Map the meta keys holding import offsets to their files."""
+    return {
+        "csv_offset": locations.TIMINGS_FILE,
+        "benchmarks_offset": locations.BENCHMARKS_FILE,
+    }
+
+
+def _offset(conn: sqlite3.Connection, key: str) -> int:
+    row = conn.execute(
+        "SELECT value FROM meta WHERE key = ?", (key,)
+    ).fetchone()
+    return int(row[0]) if row else 0
+
+
+def _has_unread(conn: sqlite3.Connection, key: str, path: Path) -> bool:
+    return path.exists() and path.stat().st_size > _offset(conn, key)
+
+
+def _unread_tail(
+    conn: sqlite3.Connection, key: str, path: Path
+) -> tuple[str, int]:
+    """Read whole lines appended to a file since it was last imported.
+
+    Returns:
+        The new text and the offset to record once it has been imported
+    """
+    offset = _offset(conn, key)
+    if not _has_unread(conn, key, path):
+        return "", offset
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    # A writer may be part way through a line, so leave it for next time
+    complete = data[: data.rfind(b"\n") + 1]
+    return complete.decode(), offset + len(complete)
+
+
+def _set_offset(conn: sqlite3.Connection, key: str, offset: int) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+        (key, str(offset)),
+    )
+
+
+def import_legacy_files(conn: sqlite3.Connection) -> None:
+    """Import rows added to timings.csv and benchmarks.jsonl.
+
+    The common case of nothing new is checked without taking the write
+    lock, so readers never queue behind writers.
+    """
+    if not any(
+        _has_unread(conn, key, path) for key, path in _legacy_files().items()
+    ):
+        return
+    with transaction(conn):
+        text, offset = _unread_tail(conn, "csv_offset", locations.TIMINGS_FILE)
+        if text:
+            reader = csv.reader(io.StringIO(text))
+            conn.executemany(
+                "INSERT INTO timings"
+                " (day, language, part, time_seconds, timestamp)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    (int(day), language, int(part), float(seconds), stamp)
+                    for day, language, part, seconds, stamp in reader
+                    if day != "day"
+                ),
+            )
+        _set_offset(conn, "csv_offset", offset)
+
+        text, offset = _unread_tail(
+            conn, "benchmarks_offset", locations.BENCHMARKS_FILE
+        )
+        for line in text.splitlines():
+            entry = json.loads(line)
+            samples = zip(
+                entry["wall_seconds"], entry["cpu_seconds"], strict=True
+            )
+            _insert_sample_set(
+                conn,
+                SampleSet(
+                    entry["day"],
+                    entry["part"],
+                    entry["language"],
+                    entry["warmup"],
+                    list(samples),
+                    entry["timestamp"],
+                ),
+            )
+        _set_offset(conn, "benchmarks_offset", offset)
+
+
+def _insert_sample_set(conn: sqlite3.Connection, sample_set: SampleSet) -> None:
+    cursor = conn.execute(
+        "INSERT INTO benchmarks (day, part, language, warmup, timestamp)"
+        " VALUES (?, ?, ?, ?, ?)",
+        (
+            sample_set.day,
+            sample_set.part,
+            sample_set.language,
+            sample_set.warmup,
+            sample_set.timestamp,
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO samples (benchmark_id, wall_seconds, cpu_seconds)"
+        " VALUES (?, ?, ?)",
+        ((cursor.lastrowid, wall, cpu) for wall, cpu in sample_set.samples),
+    )
+
+
+def record(
+    timings: Iterable[Timing] = (), sample_sets: Iterable[SampleSet] = ()
+) -> None:
+    """Save a batch of timings and sample sets in a single transaction."""
+    with open_store() as conn, transaction(conn):
+        conn.executemany(
+            "INSERT INTO timings (day, part, language, time_seconds,"
+            " timestamp, peak_bytes, rss_bytes, status)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            timings,
+        )
+        for item in sample_sets:
+            _insert_sample_set(conn, item)
+
+
+def _day_condition(days: Iterable[int] | None) -> tuple[str, list[int]]:
+    """Build a condition limiting a query to some days, or to none."""
+    if days is None:
+        return "1", []
+    selected = sorted(set(days))
+    return f"day IN ({', '.join('?' * len(selected))})", selected
+
+
+def changes_since(marks: dict[str, int]) -> Changes:
+    """Find what was added to the store since some high-water marks.
+
+    Row ids only grow, so only rows past each mark are read and the cost
+    does not grow with the history. A table whose highest id is below
+    its mark has been rebuilt, and every day it holds counts as changed.
+
+    Args:
+        marks: The highest row id already seen in each tracked table
+
+    Returns:
+        The new marks, and the days, languages and memory measurements
+        found in the new rows
+    """
+    new_marks = {}
+    days: set[int] = set()
+    with open_store() as conn:
+        for table in TRACKED_TABLES:
+            (top,) = conn.execute(
+                f"SELECT COALESCE(MAX(id), 0) FROM {table}"
+            ).fetchone()
+            mark = marks.get(table, 0)
+            if top < mark:
+                mark = 0
+            new_marks[table] = top
+            days.update(
+                day
+                for (day,) in conn.execute(
+                    f"SELECT DISTINCT day FROM {table} WHERE id > ?", (mark,)
+                )
+            )
+        mark = marks.get("timings", 0)
+        if new_marks["timings"] < mark:
+            mark = 0
+        languages = {
+            language
+            for (language,) in conn.execute(
+                "SELECT DISTINCT language FROM timings WHERE id > ?", (mark,)
+            )
+        }
+        (memory,) = conn.execute(
+            "SELECT EXISTS (SELECT 1 FROM timings"
+            " WHERE id > ? AND peak_bytes IS NOT NULL)",
+            (mark,),
+        ).fetchone()
+    return Changes(new_marks, days, languages, bool(memory))
+
+
+def latest_timings(
+    days: Iterable[int] | None = None,
+) -> dict[tuple[int, int, str], float]:
+    """Get the most recent timing for each day/part/language combination.
+
+    Args:
+        days: Only look at these days (default: all)
+
+    Returns:
+        Dict mapping (day, part, language) to time in seconds
+    """
+    condition, params = _day_condition(days)
+    with open_store() as conn:
+        # SQLite returns the other columns from the row holding the MAX
+        rows = conn.execute(
+            "SELECT day, part, language, time_seconds, MAX(timestamp)"
+            f" FROM timings WHERE status IS NULL AND {condition}"
+            " GROUP BY day, part, language",
+            params,
+        ).fetchall()
+    return {
+        (day, part, language): seconds
+        for day, part, language, seconds, _ in rows
+    }
+
+
+def latest_memory(
+    days: Iterable[int] | None = None,
+) -> dict[tuple[int, int, str], tuple[int, int]]:
+    """Get the most recent memory measurement for each part.
+
+    Args:
+        days: Only look at these days (default: all)
+
+    Returns:
+        Dict mapping (day, part, language) to (peak bytes, RSS bytes)
+    """
+    condition, params = _day_condition(days)
+    with open_store() as conn:
+        rows = conn.execute(
+            "SELECT day, part, language, peak_bytes, rss_bytes,"
+            " MAX(timestamp) FROM timings WHERE peak_bytes IS NOT NULL"
+            " AND status IS NULL"
+            f" AND {condition} GROUP BY day, part, language",
+            params,
+        ).fetchall()
+    return {
+        (day, part, language): (peak, rss)
+        for day, part, language, peak, rss, _ in rows
+    }
+
+
+def recent_timings(
+    day: int, part: int, language: str = "python", n: int = 10
+) -> list[float]:
+    """Get up to `n` of the most recent timings for a part, newest first."""
+    with open_store() as conn:
+        rows = conn.execute(
+            "SELECT time_seconds FROM timings"
+            " WHERE day = ? AND part = ? AND language = ? AND status IS NULL"
+            " ORDER BY timestamp DESC LIMIT ?",
+            (day, part, language, n),
+        ).fetchall()
+    return [seconds for (seconds,) in rows]
+
+
+def median_of_last(
+    day: int, part: int, language: str = "python", n: int = 10
+) -> float | None:
+    """Median of the last `n` timings for a part, if there are any."""
+    recent = recent_timings(day, part, language, n)
+    return statistics.median(recent) if recent else None
+
+
+def latest_samples(
+    day: int, part: int, language: str = "python"
+) -> list[tuple[float, float]]:
+    """Get the (wall, cpu) samples from the most recent benchmark."""
+    with open_store() as conn:
+        rows = conn.execute(
+            "SELECT wall_seconds, cpu_seconds FROM samples"
+            " WHERE benchmark_id = ("
+            "   SELECT id FROM benchmarks"
+            "   WHERE day = ? AND part = ? AND language = ?"
+            "   ORDER BY timestamp DESC LIMIT 1"
+            " )",
+            (day, part, language),
+        ).fetchall()
+    return [(wall, cpu) for wall, cpu in rows]
+
+
+def pin_baselines(rows: Iterable[Timing]) -> None:
+    """Pin baseline timings, replacing any existing pin for each part."""
+    with open_store() as conn, transaction(conn):
+        conn.executemany(
+            "INSERT OR REPLACE INTO baselines"
+            " (day, part, language, time_seconds, timestamp)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (
+                (
+                    row.day,
+                    row.part,
+                    row.language,
+                    row.time_seconds,
+                    row.timestamp,
+                )
+                for row in rows
+            ),
+        )
+
+
+def pinned_baselines() -> dict[tuple[int, int, str], float]:
+    """Get the pinned baseline for every part that has one.
+
+    Returns:
+        Dict mapping (day, part, language) to time in seconds
+    """
+    with open_store() as conn:
+        rows = conn.execute(
+            "SELECT day, part, language, time_seconds FROM baselines"
+        ).fetchall()
+    return {
+        (day, part, language): seconds for day, part, language, seconds in rows
+    }
@@ -1,33 +1,158 @@
-import csv
-from datetime import datetime
+import mmap
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
 
 from aoc2024 import locations
 
+# Bytes removed from each end of the input, as str.strip would for ASCII
+WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+# Bytes decoded at a time by iter_lines
+CHUNK_SIZE = 1 << 20
 
-def load_data(day: int, use_example: bool = False) -> str:
+
+def input_path(
+    day: int, use_example: bool = False, synthetic: str | None = None
+) -> Path:
+    """Get the path to the input data for a given day.
+
+    Args:
+        day: Day number (1-25)
+        use_example: If True, point at example data instead of real input
+        synthetic: Name of an input in data/synthetic to use instead
+
+    Returns:
+        Path to the input file, which may not exist yet
+    """
+    if synthetic:
+        return locations.SYNTHETIC_DIR / f"day{day:02d}_{synthetic}.txt"
+    if use_example:
+        return locations.EXAMPLES_DIR / f"day{day:02d}.txt"
+    return locations.INPUTS_DIR / f"day{day:02d}.txt"
+
+
+def load_data(
+    day: int, use_example: bool = False, synthetic: str | None = None
+) -> str:
     """Load input data for a given day.
 
     Args:
         day: Day number (1-25)
         use_example: If True, load example data instead of real input
+        synthetic: Name of an input in data/synthetic to load instead
 
     Returns:
         Raw input data as string
     """
-    if use_example:
-        file_path = locations.EXAMPLES_DIR / f"day{day:02d}.txt"
-    else:
-        file_path = locations.INPUTS_DIR / f"day{day:02d}.txt"
+    with map_input(day, use_example, synthetic) as data:
+        return str(data, "utf-8")
+
+
+def load_lines(
+    day: int, use_example: bool = False, synthetic: str | None = None
+) -> list[str]:
+    """Load input data as a list of lines."""
+    return load_data(day, use_example, synthetic).splitlines()
+
+
+@contextmanager
+def _mapped(
+    day: int, use_example: bool, synthetic: str | None
+) -> Iterator[mmap.mmap | bytes]:
+    """Map a day's input file read-only, or give empty bytes if it is empty.
+
+    Empty files are special-cased because they cannot be mapped.
+    """
+    file_path = input_path(day, use_example, synthetic)
 
     if not file_path.exists():
         raise FileNotFoundError(f"Data file not found: {file_path}")
 
-    return file_path.read_text().strip()
+    with open(file_path, "rb") as f:
+        if file_path.stat().st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
 
 
-def load_lines(day: int, use_example: bool = False) -> list[str]:
-    """Load input data as a list of lines."""
-    return load_data(day, use_example).splitlines()
+def _stripped_bounds(buffer: mmap.mmap | bytes) -> tuple[int, int]:
+    """Find the start and end of the data with surrounding space removed."""
+    start, end = 0, len(buffer)
+    while start < end and buffer[start] in WHITESPACE:
+        start += 1
+    while end > start and buffer[end - 1] in WHITESPACE:
+        end -= 1
+    return start, end
+
+
+@contextmanager
+def map_input(
+    day: int, use_example: bool = False, synthetic: str | None = None
+) -> Iterator[memoryview]:
+    """Map input data into memory without copying it.
+
+    The view covers the same bytes that `load_data` would return. It is
+    only valid inside the `with` block, and any slices taken from it
+    must be released (or dropped) before the block ends.
+
+    Args:
+        day: Day number (1-25)
+        use_example: If True, map example data instead of real input
+        synthetic: Name of an input in data/synthetic to map instead
+
+    Yields:
+        A read-only view of the input's bytes
+    """
+    with _mapped(day, use_example, synthetic) as buffer:
+        start, end = _stripped_bounds(buffer)
+        with memoryview(buffer) as view, view[start:end] as stripped:
+            yield stripped
+
+
+def iter_lines(
+    day: int, use_example: bool = False, synthetic: str | None = None
+) -> Iterator[str]:
+    """Lazily yield the lines of the input from a memory map.
+
+    Gives the same lines as `load_lines`, but only decodes the file a
+    chunk at a time, so memory use stays flat however large the input.
+    Chunks end at a newline, so no line is ever split between two.
+
+    Args:
+        day: Day number (1-25)
+        use_example: If True, read example data instead of real input
+        synthetic: Name of an input in data/synthetic to read instead
+
+    Yields:
+        Each line, without its line ending
+    """
+    with _mapped(day, use_example, synthetic) as buffer:
+        position, end = _stripped_bounds(buffer)
+        while position < end:
+            cut = buffer.rfind(b"\n", position, position + CHUNK_SIZE) + 1
+            if cut == 0 or position + CHUNK_SIZE >= end:
+                cut = end
+            yield from buffer[position:cut].decode().splitlines()
+            position = cut
+
+
+@dataclass(frozen=True)
+class InputLines:
+    """The lines of an input, streamed by `iter_lines` on every pass.
+
+    Unlike the list from `load_lines`, this never holds every line at
+    once, but it can still be iterated again, such as by each repeat of
+    a benchmarked parser.
+    """
+
+    day: int
+    use_example: bool = False
+    synthetic: str | None = None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter_lines(self.day, self.use_example, self.synthetic)
 
 
 def save_answer(
@@ -54,7 +179,7 @@ def save_answer(
 def save_timing(
     day: int, part: int, time_seconds: float, language: str = "python"
 ) -> None:
-    """Save timing data to CSV file.
+    """Save timing data to the timings store.
 
     Args:
         day: Day number (1-25)
@@ -62,26 +187,30 @@ def save_timing(
         time_seconds: Execution time in seconds
         language: Programming language used (default: "python")
     """
-    locations.TIMINGS_DIR.mkdir(exist_ok=True)
-    csv_file = locations.TIMINGS_FILE
-    file_exists = csv_file.exists()
-
-    with open(csv_file, "a", newline="") as f:
-        writer = csv.writer(f)
-
-        # Write header if file is new
-        if not file_exists:
-            writer.writerow(
-                ["day", "language", "part", "time_seconds", "timestamp"]
-            )
-
-        # Write timing data
-        writer.writerow(
-            [
-                f"{day:02d}",
-                language,
-                part,
-                f"{time_seconds:.6f}",
-                datetime.now().isoformat(),
-            ]
-        )
+    # Imported here, as only saving needs sqlite3 and it is slow to import
+    from aoc2024 import timings
+
+    timings.record([timings.timing(day, part, time_seconds, language)])
+
+
+def save_samples(
+    day: int,
+    part: int,
+    samples: list[tuple[float, float]],
+    warmup: int,
+    language: str = "python",
+) -> None:
+    """Save a full benchmark sample set to the timings store.
+
+    Args:
+        day: Day number (1-25)
+        part: Part number (1 or 2)
+        samples: (wall, cpu) seconds for each timed run
+        warmup: Number of untimed runs made before sampling
+        language: Programming language used (default: "python")
+    """
+    from aoc2024 import timings
+
+    timings.record(
+        sample_sets=[timings.sample_set(day, part, samples, warmup, language)]
+    )
@@ -0,0 +1,323 @@
+"""Compare the Python and Rust solutions under the same conditions.
+
+The Rust binary is built once up front, then both languages solve the
+same days with the same warmup and repeat counts, and two times are
+compared for each part:
+
+- solve: time spent in the solver, measured inside the process. Rust
+  parses inside its solvers, so Python's parse time is added to each
+  of its parts.
+- process: time to run a whole process that loads the input and solves
+  the part, including interpreter start up and imports for Python.
+  Neither process saves anything. Runs alternate between the languages,
+  so a change in machine load affects both alike.
+
+The speedup is the ratio of the Python median to the Rust median, with a
+bootstrap confidence interval from resampling both sets of runs. Each
+pair is stored in the timings database, where `generate_readme` takes
+its Rust speedup column from.
+"""
+
+import json
+import random
+import re
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+import click
+
+from aoc2025 import locations
+from aoc2025.bench import DEFAULT_REPEAT, DEFAULT_WARMUP
+from aoc2025.harness import PARSE_PART, PARTS, available_days, solve_day
+from aoc2025.timings import Comparison, record_comparisons
+
+RUST_DAY_PATTERN = re.compile(r"^day(\d{2})\.rs$")
+# Resamples drawn for each confidence interval
+DEFAULT_RESAMPLES = 2000
+CONFIDENCE = 0.95
+
+
+@dataclass
+class Runs:
+    """The answer and timed runs of one part in one language."""
+
+    answer: str
+    seconds: list[float]
+
+
+def rust_binary() -> str:
+    return str(locations.RUST_DIR / "target" / "release" / "aoc2025")
+
+
+def build_rust() -> None:
+    """Build the release binary, stopping if the build fails."""
+    print("Building Rust solutions...")
+    subprocess.run(
+        ["cargo", "build", "--release", "--quiet"],
+        cwd=locations.RUST_DIR,
+        check=True,
+    )
+
+
+def rust_days() -> list[int]:
+    """Find every day with a Rust solution."""
+    return sorted(
+        int(match.group(1))
+        for path in (locations.RUST_DIR / "src").iterdir()
+        if (match := RUST_DAY_PATTERN.match(path.name))
+    )
+
+
+def python_solve(day: int, warmup: int, repeat: int) -> dict[int, Runs]:
+    """Time each part's solver in this process, adding in parse time.
+
+    Stages stopped by the watchdog have no timings to compare, so they
+    are reported and left out.
+    """
+    results = solve_day(day, bench=True, warmup=warmup, repeat=repeat)
+    parse = [0.0] * max(repeat, 1)
+    runs = {}
+    for result in results:
+        if result.status:
+            part = "parse" if result.part == PARSE_PART else result.part
+            print(
+                f"{day:>3}  {part:>4}  {result.status} in Python after "
+                f"{result.elapsed:.3f}s; skipped"
+            )
+            continue
+        walls = [sample.wall for sample in result.samples]
+        if result.part == PARSE_PART:
+            parse = walls
+        else:
+            seconds = [a + b for a, b in zip(walls, parse, strict=True)]
+            runs[result.part] = Runs(str(result.answer), seconds)
+    return runs
+
+
+def rust_solve(day: int, warmup: int, repeat: int) -> dict[int, Runs]:
+    """Time each part's solver inside the Rust binary."""
+    output = subprocess.run(
+        [
+            rust_binary(),
+            "--day",
+            str(day),
+            "--warmup",
+            str(warmup),
+            "--repeat",
+            str(repeat),
+            "--json",
+        ],
+        cwd=locations.PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    runs = {}
+    for line in output.splitlines():
+        entry = json.loads(line)
+        runs[entry["part"]] = Runs(entry["answer"], entry["samples"])
+    return runs
+
+
+def process_commands(day: int, part: int) -> dict[str, list[str]]:
+    """Get the command each language runs to solve one part."""
+    return {
+        "python": [
+            sys.executable,
+            "-c",
+            "from aoc2025.harness import solve_day; "
+            f"solve_day({day}, part='{part}')",
+        ],
+        "rust": [
+            rust_binary(),
+            "--day",
+            str(day),
+            "--part",
+            str(part),
+            "--json",
+        ],
+    }
+
+
+def time_process(command: list[str]) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        command,
+        cwd=locations.PROJECT_ROOT,
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+    return time.perf_counter() - start
+
+
+def time_processes(
+    day: int, part: int, warmup: int, repeat: int
+) -> dict[str, list[float]]:
+    """Time whole processes for each language, alternating between them."""
+    commands = process_commands(day, part)
+    seconds: dict[str, list[float]] = {language: [] for language in commands}
+    for run in range(warmup + max(repeat, 1)):
+        for language, command in commands.items():
+            elapsed = time_process(command)
+            if run >= warmup:
+                seconds[language].append(elapsed)
+    return seconds
+
+
+def speedup_interval(
+    python: list[float],
+    rust: list[float],
+    rng: random.Random,
+    resamples: int = DEFAULT_RESAMPLES,
+) -> tuple[float, float]:
+    """Bootstrap a confidence interval for the ratio of the medians."""
+    ratios = sorted(
+        statistics.median(rng.choices(python, k=len(python)))
+        / statistics.median(rng.choices(rust, k=len(rust)))
+        for _ in range(resamples)
+    )
+    tail = (1 - CONFIDENCE) / 2
+    low = ratios[int(tail * (resamples - 1))]
+    high = ratios[int((1 - tail) * (resamples - 1))]
+    return low, high
+
+
+def pair(
+    day: int,
+    part: int,
+    mode: str,
+    python: list[float],
+    rust: list[float],
+    warmup: int,
+    repeat: int,
+    rng: random.Random,
+) -> Comparison:
+    """Pair up the Python and Rust runs of one part."""
+    python_median = statistics.median(python)
+    rust_median = statistics.median(rust)
+    low, high = speedup_interval(python, rust, rng)
+    return Comparison(
+        day,
+        part,
+        mode,
+        python_median,
+        rust_median,
+        python_median / rust_median,
+        low,
+        high,
+        warmup,
+        repeat,
+        datetime.now().isoformat(),
+    )
+
+
+def format_comparison(item: Comparison) -> str:
+    return (
+        f"{item.day:>3}  {item.part:>4}  {item.mode:>7}  "
+        f"{item.python_seconds:>10.6f}  {item.rust_seconds:>10.6f}  "
+        f"{item.speedup:>7.1f}x  ({item.speedup_low:.1f}-"
+        f"{item.speedup_high:.1f})"
+    )
+
+
+def compare_day(
+    day: int, warmup: int, repeat: int, rng: random.Random
+) -> list[Comparison]:
+    """Compare both languages on every part of a day."""
+    python = python_solve(day, warmup, repeat)
+    rust = rust_solve(day, warmup, repeat)
+    comparisons = []
+    for part in PARTS:
+        if part not in python or part not in rust:
+            continue
+        if python[part].answer != rust[part].answer:
+            print(
+                f"{day:>3}  {part:>4}  answers differ: Python "
+                f"{python[part].answer}, Rust {rust[part].answer}"
+            )
+        comparisons.append(
+            pair(
+                day,
+                part,
+                "solve",
+                python[part].seconds,
+                rust[part].seconds,
+                warmup,
+                repeat,
+                rng,
+            )
+        )
+        processes = time_processes(day, part, warmup, repeat)
+        comparisons.append(
+            pair(
+                day,
+                part,
+                "process",
+                processes["python"],
+                processes["rust"],
+                warmup,
+                repeat,
+                rng,
+            )
+        )
+        for item in comparisons[-2:]:
+            print(format_comparison(item))
+    return comparisons
+
+
+@click.command()
+@click.option(
+    "--day",
+    "days",
+    type=int,
+    multiple=True,
+    help="Day to compare; repeat for several (default: all in both)",
+)
+@click.option(
+    "--warmup",
+    type=int,
+    default=DEFAULT_WARMUP,
+    show_default=True,
+    help="Untimed runs before sampling, in each language",
+)
+@click.option(
+    "--repeat",
+    type=int,
+    default=DEFAULT_REPEAT,
+    show_default=True,
+    help="Timed runs per part, in each language and mode",
+)
+@click.option(
+    "--build/--no-build",
+    default=True,
+    show_default=True,
+    help="Build the Rust binary before comparing",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=0,
+    show_default=True,
+    help="Seed for the bootstrap resampling",
+)
+def main(
+    days: tuple[int, ...], warmup: int, repeat: int, build: bool, seed: int
+) -> None:
+    """Compare Advent of Code 2025 solutions in Python and Rust."""
+    if build:
+        build_rust()
+    selected = list(days) or sorted(set(available_days()) & set(rust_days()))
+    rng = random.Random(seed)
+    print("Day  Part     Mode      Python        Rust  Speedup  (95% CI)")
+    comparisons = []
+    for day in selected:
+        comparisons.extend(compare_day(day, warmup, repeat, rng))
+    record_comparisons(comparisons)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Compress a sparse grid of huge coordinates into a small dense one.
+
+Only the coordinates that appear in a puzzle matter, so each axis is cut
+into intervals: one for every coordinate, holding just that value, and
+one for each gap between neighbouring coordinates. Nothing changes
+inside a gap, so one cell stands for all of it, and a grid with
+coordinates in the billions but a few hundred corners fits in a few
+hundred cells a side. Coordinates map to cells with `np.searchsorted`.
+
+`CompressedGrid` keeps one byte per cell, and a summed-area table over
+the cells, so the number of cells set in any rectangle (and so whether
+all of them are) takes four lookups whatever its size.
+"""
+
+from functools import cached_property
+from typing import TYPE_CHECKING, Self
+
+# NumPy is imported by the methods that use it, so importing a day module
+# that uses this one stays fast
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
+
+
+class Axis:
+    """The intervals that one axis of coordinates is cut into.
+
+    Args:
+        coords: Every coordinate that needs a cell of its own
+    """
+
+    def __init__(self, coords: "ArrayLike") -> None:
+        import numpy as np
+
+        values = np.asarray(coords, dtype=np.int64).ravel()
+        # Interval i is [bounds[i], bounds[i + 1]), so each coordinate
+        # gets a cell to itself and each gap after it another
+        self.bounds = np.unique(np.concatenate([values, values + 1]))
+
+    def __len__(self) -> int:
+        return max(len(self.bounds) - 1, 0)
+
+    def index(self, coords: "ArrayLike") -> "np.ndarray":
+        """Find the cell holding each coordinate.
+
+        Coordinates before the first cell give -1, and those after the
+        last give the number of cells.
+        """
+        import numpy as np
+
+        return np.searchsorted(self.bounds, coords, side="right") - 1
+
+    @property
+    def sizes(self) -> "np.ndarray":
+        """The number of coordinates in each cell."""
+        import numpy as np
+
+        return np.diff(self.bounds)
+
+
+class CompressedGrid:
+    """A grid of one byte per cell over two compressed axes.
+
+    Args:
+        rows: The axis of row coordinates
+        cols: The axis of column coordinates
+    """
+
+    def __init__(self, rows: Axis, cols: Axis) -> None:
+        import numpy as np
+
+        self.rows = rows
+        self.cols = cols
+        self.cells = np.zeros((len(rows), len(cols)), dtype=np.uint8)
+
+    @classmethod
+    def from_points(cls, points: "ArrayLike") -> Self:
+        """Make an empty grid with a cell for every point's coordinates.
+
+        Args:
+            points: An array of shape (n, 2), each (row, column)
+        """
+        import numpy as np
+
+        coords = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+        return cls(Axis(coords[:, 0]), Axis(coords[:, 1]))
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.cells.shape
+
+    def index(self, points: "ArrayLike") -> "np.ndarray":
+        """Find the (row, column) cell holding each of some points."""
+        import numpy as np
+
+        coords = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+        return np.stack(
+            [self.rows.index(coords[:, 0]), self.cols.index(coords[:, 1])],
+            axis=1,
+        )
+
+    @cached_property
+    def summed_area(self) -> "np.ndarray":
+        """The number of cells set above and to the left of each corner.
+
+        Entry (i, j) counts the cells set in rows before i and columns
+        before j, so the table has an extra row and column of zeros.
+        Set the cells before first reading this, as it is not updated.
+        """
+        import numpy as np
+
+        rows, cols = self.shape
+        dtype = np.int32 if rows * cols < 2**31 else np.int64
+        table = np.zeros((rows + 1, cols + 1), dtype=dtype)
+        np.cumsum(self.cells != 0, axis=0, out=table[1:, 1:])
+        np.cumsum(table[1:, 1:], axis=1, out=table[1:, 1:])
+        return table
+
+    def count(
+        self,
+        top: "ArrayLike",
+        left: "ArrayLike",
+        bottom: "ArrayLike",
+        right: "ArrayLike",
+    ) -> "np.ndarray":
+        """Count the cells set in rectangles of cells, corners included.
+
+        Each argument may be an array, to count many rectangles at once.
+        """
+        import numpy as np
+
+        table = self.summed_area
+        bottom = np.asarray(bottom) + 1
+        right = np.asarray(right) + 1
+        return (
+            table[bottom, right]
+            - table[top, right]
+            - table[bottom, left]
+            + table[top, left]
+        )
+
+    def filled(
+        self,
+        top: "ArrayLike",
+        left: "ArrayLike",
+        bottom: "ArrayLike",
+        right: "ArrayLike",
+    ) -> "np.ndarray":
+        """Whether every cell is set in rectangles of cells."""
+        import numpy as np
+
+        height = np.asarray(bottom) - top + 1
+        width = np.asarray(right) - left + 1
+        return self.count(top, left, bottom, right) == height * width
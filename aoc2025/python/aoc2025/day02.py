@@ -1,9 +1,10 @@
-import time
+from functools import partial
 from itertools import chain
 
 import click
 
-from aoc2025.utils import load_lines, save_answer, save_timing
+from aoc2025.harness import day_options, run_day
+from aoc2025.parallel import pmap
 
 
 def proper_divisors(n: int) -> list[int]:
@@ -20,79 +21,67 @@ def proper_divisors(n: int) -> list[int]:
     return sorted(divisors)
 
 
-def parse_input(lines: list[str]):
+def parse(lines: list[str]) -> list[tuple[int, int]]:
     """Parse the input lines."""
     assert len(lines) == 1
     return [tuple(map(int, s.split("-"))) for s in lines[0].split(",")]
 
 
-def solve_part1(lines: list[str]) -> int:
+def doubled_sum(bounds: tuple[int, int]) -> int:
+    """Sum the ids in a range made of one sequence of digits twice."""
+    invalid_sum = 0
+    for id in range(bounds[0], bounds[1] + 1):
+        idstring = str(id)
+        num_digits = len(idstring)
+        # Any id with an odd number of digits will always be valid
+        if num_digits % 2 != 0:
+            continue
+        if idstring[: num_digits // 2] == idstring[num_digits // 2 :]:
+            invalid_sum += id
+    return invalid_sum
+
+
+def solve_part1(input_data: list[tuple[int, int]]) -> int:
     """Solve part 1."""
-    input_data = parse_input(lines)
+    return sum(pmap(doubled_sum, input_data))
+
+
+def repeated_sum(
+    bounds: tuple[int, int], all_proper_divisors: dict[int, list[int]]
+) -> int:
+    """Sum the ids in a range made of one sequence of digits repeated."""
     invalid_sum = 0
-    for bounds in input_data:
-        for id in range(bounds[0], bounds[1] + 1):
-            idstring = str(id)
-            num_digits = len(idstring)
-            # Any id with an odd number of digits will always be valid
-            if num_digits % 2 != 0:
-                continue
-            if idstring[: num_digits // 2] == idstring[num_digits // 2 :]:
+    for id in range(bounds[0], bounds[1] + 1):
+        idstring = str(id)
+        num_digits = len(idstring)
+        if num_digits < 2:
+            continue
+        for d in all_proper_divisors[num_digits]:
+            if idstring == idstring[:d] * (num_digits // d):
                 invalid_sum += id
+                break
     return invalid_sum
 
 
-def solve_part2(lines: list[str]) -> int:
+def solve_part2(input_data: list[tuple[int, int]]) -> int:
     """Solve part 2."""
-    input_data = parse_input(lines)
     max_length = len(str(max(chain.from_iterable(input_data))))
     all_proper_divisors = {
         n: proper_divisors(n) for n in range(2, max_length + 1)
     }
-    invalid_sum = 0
-    for bounds in input_data:
-        for id in range(bounds[0], bounds[1] + 1):
-            idstring = str(id)
-            num_digits = len(idstring)
-            if num_digits < 2:
-                continue
-            for d in all_proper_divisors[num_digits]:
-                if idstring == idstring[:d] * (num_digits // d):
-                    invalid_sum += id
-                    break
-    return invalid_sum
+    return sum(
+        pmap(
+            partial(repeated_sum, all_proper_divisors=all_proper_divisors),
+            input_data,
+        )
+    )
 
 
 @click.command()
-@click.option("--test", is_flag=True, help="Run on example data")
-@click.option(
-    "--part",
-    type=click.Choice(["1", "2", "both"]),
-    default="both",
-    help="Which part to solve",
-)
-def main(test: bool, part: str) -> None:
+@day_options
+def main(**options) -> None:
     """Solve Advent of Code 2025 Day 02."""
-    day = 2
-    lines = load_lines(day, use_example=test)
-
-    if part in ("1", "both"):
-        start = time.perf_counter()
-        answer1 = solve_part1(lines)
-        elapsed1 = time.perf_counter() - start
-        print(f"Part 1: {answer1} ({elapsed1:.3f}s)")
-        save_answer(day, 1, answer1, use_example=test)
-        if not test:
-            save_timing(day, 1, elapsed1)
-
-    if part in ("2", "both"):
-        start = time.perf_counter()
-        answer2 = solve_part2(lines)
-        elapsed2 = time.perf_counter() - start
-        print(f"Part 2: {answer2} ({elapsed2:.3f}s)")
-        save_answer(day, 2, answer2, use_example=test)
-        if not test:
-            save_timing(day, 2, elapsed2)
+    run_day(2, **options)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,13 @@
-import time
+from collections.abc import Iterable
 
 import click
 
-from aoc2025.utils import load_lines, save_answer, save_timing
+from aoc2025.harness import day_options, run_day
 
+STREAM_LINES = True
 
-def parse_input(lines: list[str]):
+
+def parse(lines: Iterable[str]) -> list[tuple[int, ...]]:
     """Parse the input lines."""
     return [tuple(map(int, s)) for s in lines]
 
@@ -14,9 +16,8 @@ def locate_max(batteries: tuple[int, ...]) -> tuple[int, int]:
     return max(enumerate(batteries), key=lambda x: x[1])
 
 
-def solve_part1(lines: list[str]) -> int:
+def solve_part1(input_data: list[tuple[int, ...]]) -> int:
     """Solve part 1."""
-    input_data = parse_input(lines)
     total = 0
     for bank in input_data:
         left = locate_max(bank[:-1])
@@ -25,9 +26,8 @@ def solve_part1(lines: list[str]) -> int:
     return total
 
 
-def solve_part2(lines: list[str]) -> int:
+def solve_part2(input_data: list[tuple[int, ...]]) -> int:
     """Solve part 2."""
-    input_data = parse_input(lines)
     slices = range(-11, 1)
     powers = [10 ** (-i) for i in slices]
     total = 0
@@ -42,35 +42,10 @@ def solve_part2(lines: list[str]) -> int:
 
 
 @click.command()
-@click.option("--test", is_flag=True, help="Run on example data")
-@click.option(
-    "--part",
-    type=click.Choice(["1", "2", "both"]),
-    default="both",
-    help="Which part to solve",
-)
-def main(test: bool, part: str) -> None:
+@day_options
+def main(**options) -> None:
     """Solve Advent of Code 2025 Day 03."""
-    day = 3
-    lines = load_lines(day, use_example=test)
-
-    if part in ("1", "both"):
-        start = time.perf_counter()
-        answer1 = solve_part1(lines)
-        elapsed1 = time.perf_counter() - start
-        print(f"Part 1: {answer1} ({elapsed1:.3f}s)")
-        save_answer(day, 1, answer1, use_example=test)
-        if not test:
-            save_timing(day, 1, elapsed1)
-
-    if part in ("2", "both"):
-        start = time.perf_counter()
-        answer2 = solve_part2(lines)
-        elapsed2 = time.perf_counter() - start
-        print(f"Part 2: {answer2} ({elapsed2:.3f}s)")
-        save_answer(day, 2, answer2, use_example=test)
-        if not test:
-            save_timing(day, 2, elapsed2)
+    run_day(3, **options)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,13 @@
-import time
+from collections.abc import Iterable
 
 import click
 
-from aoc2025.utils import load_lines, save_answer, save_timing
+from aoc2025.harness import day_options, run_day
 
+STREAM_LINES = True
 
-def parse_input(lines: list[str]) -> tuple[list[tuple[int, int]], list[int]]:
+
+def parse(lines: Iterable[str]) -> tuple[list[tuple[int, int]], list[int]]:
     """Parse the input lines."""
     fresh_ranges = []
     available = []
@@ -25,60 +27,35 @@ def parse_input(lines: list[str]) -> tuple[list[tuple[int, int]], list[int]]:
             current_range = (lower, upper)
     merged_ranges.append(current_range)
 
-    return sorted_ranges, available
+    return merged_ranges, available
 
 
-def solve_part1(lines: list[str]) -> int:
+def solve_part1(input_data: tuple[list[tuple[int, int]], list[int]]) -> int:
     """Solve part 1."""
-    sorted_ranges, available = parse_input(lines)
+    merged_ranges, available = input_data
     fresh_count = 0
     for item in available:
-        for lower, upper in sorted_ranges:
+        for lower, upper in merged_ranges:
             if lower <= item <= upper:
                 fresh_count += 1
                 break
     return fresh_count
 
 
-def solve_part2(lines: list[str]) -> int:
+def solve_part2(input_data: tuple[list[tuple[int, int]], list[int]]) -> int:
     """Solve part 2."""
-    sorted_ranges, _ = parse_input(lines)
+    merged_ranges, _ = input_data
     total = 0
-    for lower, upper in sorted_ranges:
+    for lower, upper in merged_ranges:
         total += upper - lower + 1
     return total
 
 
 @click.command()
-@click.option("--test", is_flag=True, help="Run on example data")
-@click.option(
-    "--part",
-    type=click.Choice(["1", "2", "both"]),
-    default="both",
-    help="Which part to solve",
-)
-def main(test: bool, part: str) -> None:
+@day_options
+def main(**options) -> None:
     """Solve Advent of Code 2025 Day 05."""
-    day = 5
-    lines = load_lines(day, use_example=test)
-
-    if part in ("1", "both"):
-        start = time.perf_counter()
-        answer1 = solve_part1(lines)
-        elapsed1 = time.perf_counter() - start
-        print(f"Part 1: {answer1} ({elapsed1:.3f}s)")
-        save_answer(day, 1, answer1, use_example=test)
-        if not test:
-            save_timing(day, 1, elapsed1)
-
-    if part in ("2", "both"):
-        start = time.perf_counter()
-        answer2 = solve_part2(lines)
-        elapsed2 = time.perf_counter() - start
-        print(f"Part 2: {answer2} ({elapsed2:.3f}s)")
-        save_answer(day, 2, answer2, use_example=test)
-        if not test:
-            save_timing(day, 2, elapsed2)
+    run_day(5, **options)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,9 @@
-import time
 from collections.abc import Callable
 from math import prod
 
 import click
 
-from aoc2025.utils import load_lines, save_answer, save_timing
+from aoc2025.harness import day_options, run_day
 
 
 def parse_input_human(
@@ -45,18 +44,28 @@ def parse_input_ceph(
     return operands, operators  # ty:ignore[invalid-return-type]
 
 
-def solve_part1(lines: list[str]) -> int:
+type Worksheet = tuple[
+    tuple[tuple[int, ...], ...], tuple[Callable[[tuple[int, ...]], int], ...]
+]
+
+
+def parse(lines: list[str]) -> tuple[Worksheet, Worksheet]:
+    """Parse the input both the human way and the cephalopod way."""
+    return parse_input_human(lines), parse_input_ceph(lines)
+
+
+def solve_part1(input_data: tuple[Worksheet, Worksheet]) -> int:
     """Solve part 1."""
-    all_operands, operators = parse_input_human(lines)
+    all_operands, operators = input_data[0]
     total = 0
     for operands, operator in zip(all_operands, operators, strict=True):
         total += operator(operands)
     return total
 
 
-def solve_part2(lines: list[str]) -> int:
+def solve_part2(input_data: tuple[Worksheet, Worksheet]) -> int:
     """Solve part 2."""
-    all_operands, operators = parse_input_ceph(lines)
+    all_operands, operators = input_data[1]
     total = 0
     for operands, operator in zip(all_operands, operators, strict=True):
         total += operator(operands)
@@ -64,35 +73,10 @@ def solve_part2(lines: list[str]) -> int:
 
 
 @click.command()
-@click.option("--test", is_flag=True, help="Run on example data")
-@click.option(
-    "--part",
-    type=click.Choice(["1", "2", "both"]),
-    default="both",
-    help="Which part to solve",
-)
-def main(test: bool, part: str) -> None:
+@day_options
+def main(**options) -> None:
     """Solve Advent of Code 2025 Day 06."""
-    day = 6
-    lines = load_lines(day, use_example=test)
-
-    if part in ("1", "both"):
-        start = time.perf_counter()
-        answer1 = solve_part1(lines)
-        elapsed1 = time.perf_counter() - start
-        print(f"Part 1: {answer1} ({elapsed1:.3f}s)")
-        save_answer(day, 1, answer1, use_example=test)
-        if not test:
-            save_timing(day, 1, elapsed1)
-
-    if part in ("2", "both"):
-        start = time.perf_counter()
-        answer2 = solve_part2(lines)
-        elapsed2 = time.perf_counter() - start
-        print(f"Part 2: {answer2} ({elapsed2:.3f}s)")
-        save_answer(day, 2, answer2, use_example=test)
-        if not test:
-            save_timing(day, 2, elapsed2)
+    run_day(6, **options)
 
 
 if __name__ == "__main__":
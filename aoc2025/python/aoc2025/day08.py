@@ -1,15 +1,23 @@
-import time
 from collections import Counter
+from collections.abc import Iterable
 from math import prod
+from typing import TYPE_CHECKING
 
 import click
-import numpy as np
 
-from aoc2025.utils import load_lines, save_answer, save_timing
+from aoc2025.harness import day_options, run_day
 
+if TYPE_CHECKING:
+    import numpy as np
 
-def parse_input(lines: list[str]):
+STREAM_LINES = True
+
+
+def parse(lines: Iterable[str]) -> "np.ndarray":
     """Parse the input lines."""
+    # NumPy is imported on first use, as it dominates this module's start up
+    import numpy as np
+
     return np.array([tuple(int(s) for s in line.split(",")) for line in lines])
 
 
@@ -32,9 +40,10 @@ def connect_boxes(x: int, y: int, parents: list[int]) -> int:
         return 0
 
 
-def solve_part1(lines: list[str], test: bool) -> int:
+def solve_part1(boxes: "np.ndarray", test: bool) -> int:
     """Solve part 1."""
-    boxes = parse_input(lines)
+    import numpy as np
+
     diffs = boxes[:, np.newaxis, :] - boxes[np.newaxis, :, :]
     distances = np.sqrt((diffs**2).sum(axis=2))
     rows, cols = np.triu_indices(len(boxes), k=1)
@@ -53,9 +62,10 @@ def solve_part1(lines: list[str], test: bool) -> int:
     return prod(v for _, v in circuit_sizes.most_common(3))
 
 
-def solve_part2(lines: list[str]) -> int | None:
+def solve_part2(boxes: "np.ndarray") -> int | None:
     """Solve part 2."""
-    boxes = parse_input(lines)
+    import numpy as np
+
     diffs = boxes[:, np.newaxis, :] - boxes[np.newaxis, :, :]
     distances = np.sqrt((diffs**2).sum(axis=2))
     rows, cols = np.triu_indices(len(boxes), k=1)
@@ -74,35 +84,10 @@ def solve_part2(lines: list[str]) -> int | None:
 
 
 @click.command()
-@click.option("--test", is_flag=True, help="Run on example data")
-@click.option(
-    "--part",
-    type=click.Choice(["1", "2", "both"]),
-    default="both",
-    help="Which part to solve",
-)
-def main(test: bool, part: str) -> None:
+@day_options
+def main(**options) -> None:
     """Solve Advent of Code 2025 Day 08."""
-    day = 8
-    lines = load_lines(day, use_example=test)
-
-    if part in ("1", "both"):
-        start = time.perf_counter()
-        answer1 = solve_part1(lines, test)
-        elapsed1 = time.perf_counter() - start
-        print(f"Part 1: {answer1} ({elapsed1:.3f}s)")
-        save_answer(day, 1, answer1, use_example=test)
-        if not test:
-            save_timing(day, 1, elapsed1)
-
-    if part in ("2", "both"):
-        start = time.perf_counter()
-        answer2 = solve_part2(lines)
-        elapsed2 = time.perf_counter() - start
-        print(f"Part 2: {answer2} ({elapsed2:.3f}s)")
-        save_answer(day, 2, answer2, use_example=test)
-        if not test:
-            save_timing(day, 2, elapsed2)
+    run_day(8, **options)
 
 
 if __name__ == "__main__":
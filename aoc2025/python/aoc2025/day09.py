@@ -15,19 +15,23 @@ seemed so impossible I just forgot about it.
 
 The lesson here was really about understanding the size of the problem,
 and that cool trick for 2d compression. Once it became possible to just
-lookup elements from a relatively small grid (i.e. a `list[list[str]]`)
-then the problem can complete v fast.
+lookup elements from a relatively small grid (now a summed-area table
+from `aoc2025.compress`) then the problem can complete v fast.
 """
 
-import time
+from collections.abc import Iterable
 from itertools import product
 
 import click
 
-from aoc2025.utils import load_lines, save_answer, save_timing
+from aoc2025.compress import CompressedGrid
+from aoc2025.grid import polygon_mask
+from aoc2025.harness import day_options, run_day
 
+STREAM_LINES = True
 
-def parse_input(lines: list[str]) -> list[tuple[int, int]]:
+
+def parse(lines: Iterable[str]) -> list[tuple[int, int]]:
     """Parse the input lines."""
     return [tuple(map(int, line.split(","))) for line in lines]  # ty:ignore[invalid-return-type]
 
@@ -36,156 +40,49 @@ def calculate_area(p1: tuple[int, int], p2: tuple[int, int]) -> int:
     return (abs(p1[0] - p2[0]) + 1) * (abs(p1[1] - p2[1]) + 1)
 
 
-def solve_part1(lines: list[str]) -> int:
+def solve_part1(red_tiles: list[tuple[int, int]]) -> int:
     """Solve part 1."""
-    red_tiles = parse_input(lines)
     all_pairs = product(red_tiles, red_tiles)
     all_areas = [calculate_area(first, second) for first, second in all_pairs]
     return max(all_areas)
 
 
-def solve_part2(lines: list[str]) -> int:
+def solve_part2(red_tiles: list[tuple[int, int]]) -> int:
     """Solve part 2."""
-    red_tiles = parse_input(lines)
-    all_x, all_y = zip(*red_tiles, strict=True)
-    sorted_x = sorted(set(all_x))
-    sorted_y = sorted(set(all_y))
-    # Start by compressing the 2d space
-    map_x = {coord: i for i, coord in enumerate(sorted_x)}
-    map_y = {coord: i for i, coord in enumerate(sorted_y)}
-    compressed_red = [(map_x[x], map_y[y]) for x, y in red_tiles]
-
-    # Create the grid
-    width = len(sorted_x)
-    height = len(sorted_y)
-    grid = [["." for _ in range(width)] for _ in range(height)]
-
-    # Now mark the red tiles
-    for x, y in compressed_red:
-        grid[y][x] = "#"
-
-    # Now we 'rasterise' the edges of the polygon, i.e. connect them
-    for i in range(len(compressed_red)):
-        x1, y1 = compressed_red[i]
-        x2, y2 = compressed_red[(i + 1) % len(compressed_red)]
-
-        # If the line is vertical fill along that y-axis, otheriwse
-        # fill along x-axis
-        if x1 == x2:
-            for y in range(min(y1, y2), max(y1, y2) + 1):
-                grid[y][x1] = "#"
-        elif y1 == y2:
-            for x in range(min(x1, x2), max(x1, x2) + 1):
-                grid[y1][x] = "#"
-
-    # Now we find some point on the inside of the polygon with
-    # with raycasting
-    inside_point = None
-    for y in range(height):
-        for x in range(width):
-            if grid[y][x] != ".":
-                continue
-
-            # Count transitions from this point to the left.
-            transitions = 0
-            prev = "."
-            for i in range(x, -1, -1):
-                cur = grid[y][i]
-                # This tests whether we have hit a polygon edge
-                if cur != prev:
-                    transitions += 1
-                prev = cur
-
-            # Odd number of transitions means we started inside
-            if transitions % 2 == 1:
-                inside_point = (x, y)
-                break
-        if inside_point:
-            break
-
-    # Now we flood fill from the inside point
-    if inside_point:
-        stack = [inside_point]
-        while stack:
-            x, y = stack.pop()
-            if 0 <= x < width and 0 <= y < height and grid[y][x] == ".":
-                grid[y][x] = "X"
-                stack.extend([(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)])
-
-    # Find the largest rectangle that is entirely inside the polygon
-    max_area = 0
+    import numpy as np
+
+    # Start by compressing the 2d space, with rows for y and columns for x
+    points = np.array(red_tiles, dtype=np.int64)[:, ::-1]
+    grid = CompressedGrid.from_points(points)
+    corners = grid.index(points)
 
-    for i, first in enumerate(red_tiles[:-1]):
-        x1, y1 = first
-        cx1, cy1 = map_x[x1], map_y[y1]
-        for second in red_tiles[i + 1 :]:
-            x2, y2 = second
-            cx2, cy2 = map_x[x2], map_y[y2]
-
-            # Calculate the actual area, ignore if it is smaller than
-            # current best
-            area = calculate_area(first, second)
-            if area <= max_area:
-                continue
-
-            # Check if the edges of the rectangle are entirely inside
-            # the polygon
-            min_cx = min(cx1, cx2)
-            max_cx = max(cx1, cx2)
-            min_cy = min(cy1, cy2)
-            max_cy = max(cy1, cy2)
-
-            enclosed = True
-
-            # First check top and bottom edges
-            for cx in range(min_cx, max_cx + 1):
-                if grid[min_cy][cx] == "." or grid[max_cy][cx] == ".":
-                    enclosed = False
-                    break
-
-            # Then the left and right
-            if enclosed:
-                for cy in range(min_cy, max_cy + 1):
-                    if grid[cy][min_cx] == "." or grid[cy][max_cx] == ".":
-                        enclosed = False
-                        break
-
-            if enclosed:
-                max_area = area
+    # Mark the tiles inside or on the edge of the polygon
+    grid.cells[:] = polygon_mask(grid.shape, corners.tolist())
+
+    # Find the largest rectangle that is entirely inside the polygon,
+    # checking each corner against all the corners after it at once
+    max_area = 0
+    for i in range(len(points) - 1):
+        (y, x), (row, col) = points[i], corners[i]
+        ys, xs = points[i + 1 :, 0], points[i + 1 :, 1]
+        rows, cols = corners[i + 1 :, 0], corners[i + 1 :, 1]
+        enclosed = grid.filled(
+            np.minimum(row, rows),
+            np.minimum(col, cols),
+            np.maximum(row, rows),
+            np.maximum(col, cols),
+        )
+        areas = (np.abs(ys - y) + 1) * (np.abs(xs - x) + 1)
+        max_area = max(max_area, int(areas[enclosed].max(initial=0)))
 
     return max_area
 
 
 @click.command()
-@click.option("--test", is_flag=True, help="Run on example data")
-@click.option(
-    "--part",
-    type=click.Choice(["1", "2", "both"]),
-    default="both",
-    help="Which part to solve",
-)
-def main(test: bool, part: str) -> None:
+@day_options
+def main(**options) -> None:
     """Solve Advent of Code 2025 Day 09."""
-    day = 9
-    lines = load_lines(day, use_example=test)
-
-    if part in ("1", "both"):
-        start = time.perf_counter()
-        answer1 = solve_part1(lines)
-        elapsed1 = time.perf_counter() - start
-        print(f"Part 1: {answer1} ({elapsed1:.3f}s)")
-        save_answer(day, 1, answer1, use_example=test)
-        if not test:
-            save_timing(day, 1, elapsed1)
-
-    if part in ("2", "both"):
-        start = time.perf_counter()
-        answer2 = solve_part2(lines)
-        elapsed2 = time.perf_counter() - start
-        print(f"Part 2: {answer2} ({elapsed2:.3f}s)")
-        save_answer(day, 2, answer2, use_example=test)
-        if not test:
-            save_timing(day, 2, elapsed2)
+    run_day(9, **options)
 
 
 if __name__ == "__main__":
@@ -6,21 +6,28 @@ whole input in one go and instead operated line-by-line.
 
 The second part I solved using an integer linear programming approach,
 with help from hyperhelios.
+
+Each machine is independent, so both parts map over them with `pmap`,
+which runs them in parallel on the free-threaded build.
 """
 
 import re
-import time
+from collections.abc import Iterable
 from itertools import combinations
 
 import click
-import z3
 
-from aoc2025.utils import load_lines, save_answer, save_timing
+from aoc2025.harness import day_options, run_day
+from aoc2025.parallel import in_thread_pool, pmap
 
+STREAM_LINES = True
 
-def solve_part1(lines: list[str]) -> int:
-    """Solve part 1."""
-    result: int = 0
+type Machine = tuple[set[int], list[set[int]], list[int]]
+
+
+def parse(lines: Iterable[str]) -> list[Machine]:
+    """Parse each machine's lights, buttons and joltages."""
+    machines = []
     for line in lines:
         match = re.match(r"^\[([#.]+)\] ([()\d, ]+) \{([\d,]+)\}$", line)
         if match:
@@ -29,82 +36,67 @@ def solve_part1(lines: list[str]) -> int:
                 for index, light in enumerate(match.groups()[0])
                 if light == "#"
             }
-            buttons: list[set[int]] = [
-                set(map(int, button[1:-1].split(",")))
-                for button in match.groups()[1].split()
-            ]
-            for r in range(1, len(buttons) + 1):
-                for combo in combinations(buttons, r=r):
-                    switched_on: set[int] = set()
-                    for button in combo:
-                        switched_on ^= button
-                    if switched_on == lights:
-                        result += r
-                        break
-                else:
-                    continue
-                break
-
-    return result
-
-
-def solve_part2(lines: list[str]) -> int:
-    """Solve part 2."""
-    result: int = 0
-    for line in lines:
-        match = re.match(r"^\[([#.]+)\] ([()\d, ]+) \{([\d,]+)\}$", line)
-        if match:
             buttons: list[set[int]] = [
                 set(map(int, button[1:-1].split(",")))
                 for button in match.groups()[1].split()
             ]
             joltages: list[int] = list(map(int, match.groups()[2].split(",")))
-            o = z3.Optimize()
-            vars = z3.Ints(f"n{i}" for i in range(len(buttons)))
-            for var in vars:
-                o.add(var >= 0)
-            for i, joltage in enumerate(joltages):
-                equation = 0
-                for b, button in enumerate(buttons):
-                    if i in button:
-                        equation += vars[b]
-                o.add(equation == joltage)
-            o.minimize(sum(vars))
-            o.check()
-            result += o.model().eval(sum(vars)).as_long()
-    return result
+            machines.append((lights, buttons, joltages))
+    return machines
+
+
+def fewest_toggles(machine: Machine) -> int:
+    """Find the fewest button presses that switch on a machine's lights."""
+    lights, buttons, _ = machine
+    for r in range(1, len(buttons) + 1):
+        for combo in combinations(buttons, r=r):
+            switched_on: set[int] = set()
+            for button in combo:
+                switched_on ^= button
+            if switched_on == lights:
+                return r
+    return 0
+
+
+def solve_part1(machines: list[Machine]) -> int:
+    """Solve part 1."""
+    return sum(pmap(fewest_toggles, machines))
+
+
+def fewest_joltage_presses(machine: Machine) -> int:
+    """Find the fewest button presses that reach a machine's joltages."""
+    # z3 takes far longer to import than part 1 takes to run
+    import z3
+
+    _, buttons, joltages = machine
+    # z3's shared context is not thread-safe, so calls on a thread pool
+    # each make their own; anywhere else the shared one is much faster
+    ctx = z3.Context() if in_thread_pool() else None
+    o = z3.Optimize(ctx=ctx)
+    vars = z3.Ints([f"n{i}" for i in range(len(buttons))], ctx=ctx)
+    for var in vars:
+        o.add(var >= 0)
+    for i, joltage in enumerate(joltages):
+        equation = 0
+        for b, button in enumerate(buttons):
+            if i in button:
+                equation += vars[b]
+        o.add(equation == joltage)
+    o.minimize(sum(vars))
+    o.check()
+    return o.model().eval(sum(vars)).as_long()
+
+
+def solve_part2(machines: list[Machine]) -> int:
+    """Solve part 2."""
+    return sum(pmap(fewest_joltage_presses, machines))
 
 
 @click.command()
-@click.option("--test", is_flag=True, help="Run on example data")
-@click.option(
-    "--part",
-    type=click.Choice(["1", "2", "both"]),
-    default="both",
-    help="Which part to solve",
-)
-def main(test: bool, part: str) -> None:
+@day_options
+def main(**options) -> None:
     """Solve Advent of Code 2025 Day 10."""
-    day = 10
-    lines: list[str] = load_lines(day, use_example=test)
-
-    if part in ("1", "both"):
-        start = time.perf_counter()
-        answer1 = solve_part1(lines)
-        elapsed1 = time.perf_counter() - start
-        print(f"Part 1: {answer1} ({elapsed1:.3f}s)")
-        save_answer(day, 1, answer1, use_example=test)
-        if not test:
-            save_timing(day, 1, elapsed1)
-
-    if part in ("2", "both"):
-        start = time.perf_counter()
-        answer2 = solve_part2(lines)
-        elapsed2 = time.perf_counter() - start
-        print(f"Part 2: {answer2} ({elapsed2:.3f}s)")
-        save_answer(day, 2, answer2, use_example=test)
-        if not test:
-            save_timing(day, 2, elapsed2)
+    run_day(10, **options)
 
 
 if __name__ == "__main__":
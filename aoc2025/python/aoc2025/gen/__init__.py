@@ -0,0 +1,133 @@
+"""Seeded generators for synthetic puzzle inputs.
+
+Each `gen.dayNN` module provides `generate(size, rng, **options)`, which
+returns the text of a valid input for that day. `size` is the day's
+natural measure of scale (ranges for day 2, points for day 8, vertices
+for day 9, and so on; see each module), and the options tune the rest of
+its shape. The same day, size, seed and options always give the same
+input. Each module also provides `input_size(lines)`, which measures an
+existing input in the same units, and sets `DIMENSIONS = 2` if `size`
+is a side length rather than a count.
+
+Inputs are written to `data/synthetic/dayNN_NAME.txt`, where NAME
+defaults to `n<size>-s<seed>`. A day's command line (or `load_data`)
+reads one with `--synthetic NAME`:
+
+    python -m aoc2025.gen --day 8 --size 5000
+    python -m aoc2025.day08 --synthetic n5000-s0
+"""
+
+import ast
+import importlib
+import pkgutil
+import random
+import re
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import click
+
+from aoc2025 import locations
+
+DAY_MODULE_PATTERN = re.compile(r"^day(\d{2})$")
+
+# An option given either as a fixed value or as an inclusive (low, high)
+# range to draw from
+type Span = int | tuple[int, int]
+
+
+def discover_generators() -> list[int]:
+    """Find the day number of every generator module.
+
+    Returns:
+        Sorted list of day numbers
+    """
+    return sorted(
+        int(match.group(1))
+        for module in pkgutil.iter_modules(__path__)
+        if (match := DAY_MODULE_PATTERN.match(module.name))
+    )
+
+
+def load_generator(day: int) -> ModuleType:
+    """Import the generator module for a given day."""
+    return importlib.import_module(f"aoc2025.gen.day{day:02d}")
+
+
+def draw(rng: random.Random, span: Span) -> int:
+    """Draw a value from a span, or return it if it is fixed."""
+    if isinstance(span, int):
+        return span
+    low, high = span
+    return rng.randint(low, high)
+
+
+def input_size(day: int, lines: list[str]) -> int:
+    """Measure an input for a day in its generator's units of size."""
+    return load_generator(day).input_size(lines)
+
+
+def scaled_size(day: int, size: int, factor: float) -> int:
+    """Scale a generator size so that its input grows by `factor`.
+
+    Where `size` is a side length the input grows with its square (or
+    higher power), so the size is scaled by the matching root instead.
+    """
+    dimensions = getattr(load_generator(day), "DIMENSIONS", 1)
+    return max(round(size * factor ** (1 / dimensions)), 1)
+
+
+def parse_option(text: str) -> tuple[str, Any]:
+    """Parse a KEY=VALUE generator option, reading VALUE as a literal.
+
+    Values that are not literals are kept as strings, so `digits=2,4,6`
+    gives a tuple and `mode=dense` gives a string.
+    """
+    key, sep, value = text.partition("=")
+    if not sep:
+        raise click.BadParameter(f"expected KEY=VALUE, got {text!r}")
+    try:
+        return key, ast.literal_eval(value)
+    except (SyntaxError, ValueError):
+        return key, value
+
+
+def synthetic_name(size: int, seed: int) -> str:
+    """Get the default name for a generated input."""
+    return f"n{size}-s{seed}"
+
+
+def generate(day: int, size: int, seed: int = 0, **options: Any) -> str:
+    """Generate the text of an input for a day.
+
+    Args:
+        day: Day number (1-25)
+        size: Scale of the input, in the day's own units
+        seed: Seed for the random number generator
+        **options: Day-specific settings passed to its generator
+
+    Returns:
+        The input text, ending with a newline
+    """
+    rng = random.Random(seed)
+    return load_generator(day).generate(size, rng, **options) + "\n"
+
+
+def write_input(
+    day: int,
+    size: int,
+    seed: int = 0,
+    name: str | None = None,
+    **options: Any,
+) -> Path:
+    """Generate an input and write it where `load_data` can find it.
+
+    Returns:
+        Path of the written file
+    """
+    name = name or synthetic_name(size, seed)
+    path = locations.SYNTHETIC_DIR / f"day{day:02d}_{name}.txt"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(generate(day, size, seed, **options))
+    return path
@@ -0,0 +1,46 @@
+"""Command line for writing synthetic inputs (see `aoc2025.gen`)."""
+
+import click
+
+from aoc2025.gen import discover_generators, parse_option, write_input
+
+
+@click.command()
+@click.option(
+    "--day",
+    "days",
+    type=int,
+    multiple=True,
+    help="Day to generate; repeat for several (default: all)",
+)
+@click.option("--size", type=int, required=True, help="Scale of the input")
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option(
+    "--name",
+    default=None,
+    help="Name to run the input with [default: n<size>-s<seed>]",
+)
+@click.option(
+    "--option",
+    "-o",
+    "options",
+    multiple=True,
+    metavar="KEY=VALUE",
+    help="Day-specific generator setting; repeat for several",
+)
+def main(
+    days: tuple[int, ...],
+    size: int,
+    seed: int,
+    name: str | None,
+    options: tuple[str, ...],
+) -> None:
+    """Write seeded synthetic inputs for Advent of Code 2025."""
+    settings = dict(parse_option(option) for option in options)
+    for day in list(days) or discover_generators():
+        path = write_input(day, size, seed, name, **settings)
+        print(f"Day {day:02d}: {path}")
+
+
+if __name__ == "__main__":
+    main()
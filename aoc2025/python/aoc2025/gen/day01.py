@@ -0,0 +1,17 @@
+"""Day 1: `size` rotations of the dial, each left or right."""
+
+import random
+
+from aoc2025.gen import Span, draw
+
+
+def generate(size: int, rng: random.Random, distance: Span = (1, 999)) -> str:
+    """Generate rotations of between 1 and 999 clicks by default."""
+    return "\n".join(
+        f"{rng.choice('LR')}{draw(rng, distance)}" for _ in range(size)
+    )
+
+
+def input_size(lines: list[str]) -> int:
+    """Count the rotations in an input."""
+    return len(lines)
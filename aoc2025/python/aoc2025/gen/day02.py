@@ -0,0 +1,31 @@
+"""Day 2: `size` ID ranges on a single line.
+
+The work done by both parts grows with the total width of the ranges,
+and part 2 also with the number of digits in each ID, so both can be
+set. `digits` is the mix of lengths that range starts are drawn from;
+repeat a length to make it more common.
+"""
+
+import random
+
+from aoc2025.gen import Span, draw
+
+
+def generate(
+    size: int,
+    rng: random.Random,
+    digits: tuple[int, ...] = (2, 3, 4, 5, 6, 7, 8, 9, 10),
+    width: Span = (1, 1000),
+) -> str:
+    """Generate ranges whose starts have a length drawn from `digits`."""
+    ranges = []
+    for _ in range(size):
+        length = rng.choice(digits)
+        start = rng.randint(10 ** (length - 1), 10**length - 1)
+        ranges.append(f"{start}-{start + draw(rng, width) - 1}")
+    return ",".join(ranges)
+
+
+def input_size(lines: list[str]) -> int:
+    """Count the ranges on an input's single line."""
+    return len(lines[0].split(","))
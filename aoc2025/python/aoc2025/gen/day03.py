@@ -0,0 +1,16 @@
+"""Day 3: `size` banks of batteries, each a string of digits 1-9."""
+
+import random
+
+
+def generate(size: int, rng: random.Random, length: int = 100) -> str:
+    """Generate banks of `length` batteries (at least 12 for part 2)."""
+    return "\n".join(
+        "".join(rng.choice("123456789") for _ in range(length))
+        for _ in range(size)
+    )
+
+
+def input_size(lines: list[str]) -> int:
+    """Count the banks in an input."""
+    return len(lines)
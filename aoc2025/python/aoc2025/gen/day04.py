@@ -0,0 +1,19 @@
+"""Day 4: a `size` by `size` grid with a roll of paper on some squares."""
+
+import random
+
+# `size` is a side length, so the input grows with its square
+DIMENSIONS = 2
+
+
+def generate(size: int, rng: random.Random, density: float = 0.6) -> str:
+    """Generate a grid where each square holds a roll with `density`."""
+    return "\n".join(
+        "".join("@" if rng.random() < density else "." for _ in range(size))
+        for _ in range(size)
+    )
+
+
+def input_size(lines: list[str]) -> int:
+    """Get the side length of an input's grid."""
+    return len(lines)
@@ -0,0 +1,26 @@
+"""Day 5: `size` fresh ingredient ranges, then the available IDs."""
+
+import random
+
+from aoc2025.gen import Span, draw
+
+
+def generate(
+    size: int,
+    rng: random.Random,
+    ids: int | None = None,
+    limit: int = 10**15,
+    width: Span = (1, 10**12),
+) -> str:
+    """Generate ranges below `limit` and `ids` IDs (default: `size`)."""
+    ranges = []
+    for _ in range(size):
+        start = rng.randint(1, limit)
+        ranges.append(f"{start}-{start + draw(rng, width) - 1}")
+    available = [str(rng.randint(1, limit)) for _ in range(ids or size)]
+    return "\n".join(ranges) + "\n\n" + "\n".join(available)
+
+
+def input_size(lines: list[str]) -> int:
+    """Count the fresh ranges above the blank line."""
+    return lines.index("")
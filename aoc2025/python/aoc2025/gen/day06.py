@@ -0,0 +1,30 @@
+"""Day 6: a worksheet of `size` problems side by side.
+
+Each problem has a number on each of `rows` rows, aligned to the left or
+the right of its column, and an operator underneath. One number in every
+problem is full width, so no column of a problem is entirely blank.
+"""
+
+import random
+
+
+def generate(
+    size: int, rng: random.Random, rows: int = 4, max_digits: int = 4
+) -> str:
+    """Generate problems with numbers of up to `max_digits` digits."""
+    lines = [[] for _ in range(rows + 1)]
+    for problem in range(size):
+        width = rng.randint(1, max_digits)
+        full = 0 if problem == 0 else rng.randrange(rows)
+        align = rng.choice((str.ljust, str.rjust))
+        for row in range(rows):
+            digits = width if row == full else rng.randint(1, width)
+            number = str(rng.randint(10 ** (digits - 1), 10**digits - 1))
+            lines[row].append(align(number, width))
+        lines[rows].append(rng.choice("+*").ljust(width))
+    return "\n".join(" ".join(line) for line in lines)
+
+
+def input_size(lines: list[str]) -> int:
+    """Count the problems, one per operator on the last row."""
+    return len(lines[-1].split())
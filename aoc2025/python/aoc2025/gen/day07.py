@@ -0,0 +1,34 @@
+"""Day 7: a manifold `size` columns wide, with the start in the middle.
+
+Splitters sit on every other row, as in the puzzle input.
+"""
+
+import random
+
+# `size` is a width, and the height follows it by default
+DIMENSIONS = 2
+
+
+def generate(
+    size: int,
+    rng: random.Random,
+    height: int | None = None,
+    density: float = 0.5,
+) -> str:
+    """Generate `height` rows (default: `size`) of the manifold."""
+    rows = ["." * (size // 2) + "S" + "." * (size - size // 2 - 1)]
+    for row in range(1, height or size):
+        if row % 2:
+            rows.append("." * size)
+        else:
+            rows.append(
+                "".join(
+                    "^" if rng.random() < density else "." for _ in range(size)
+                )
+            )
+    return "\n".join(rows)
+
+
+def input_size(lines: list[str]) -> int:
+    """Get the width of an input's manifold."""
+    return len(lines[0])
@@ -0,0 +1,22 @@
+"""Day 8: `size` distinct junction boxes in 3D space."""
+
+import random
+
+
+def generate(size: int, rng: random.Random, extent: int = 100_000) -> str:
+    """Generate points with coordinates below `extent`."""
+    # A dict rather than a set, so the order is the same on every run
+    points: dict[tuple[int, int, int], None] = {}
+    while len(points) < size:
+        point = (
+            rng.randrange(extent),
+            rng.randrange(extent),
+            rng.randrange(extent),
+        )
+        points[point] = None
+    return "\n".join(f"{x},{y},{z}" for x, y, z in points)
+
+
+def input_size(lines: list[str]) -> int:
+    """Count the junction boxes in an input."""
+    return len(lines)
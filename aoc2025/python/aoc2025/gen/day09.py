@@ -0,0 +1,33 @@
+"""Day 9: a rectilinear polygon with `size` red tiles at its corners.
+
+The polygon is a skyline: a flat base with a staircase of random heights
+above it, so it is always simple (no edge crosses another) and every
+corner turns through a right angle. `size` is rounded up to an even
+number of at least 4.
+"""
+
+import random
+
+
+def generate(size: int, rng: random.Random, extent: int = 100_000) -> str:
+    """Generate the corners in order, with coordinates below `extent`."""
+    steps = max(size, 4) // 2 + max(size, 4) % 2 - 1
+    xs = sorted(rng.sample(range(extent), steps + 1))
+    heights = [rng.randrange(1, extent)]
+    while len(heights) < steps:
+        # Neighbouring steps differ, or their shared corner would vanish
+        height = rng.randrange(1, extent)
+        if height != heights[-1]:
+            heights.append(height)
+
+    corners = [(xs[0], 0)]
+    for i, height in enumerate(heights):
+        corners.append((xs[i], height))
+        corners.append((xs[i + 1], height))
+    corners.append((xs[-1], 0))
+    return "\n".join(f"{x},{y}" for x, y in corners)
+
+
+def input_size(lines: list[str]) -> int:
+    """Count the red tiles in an input."""
+    return len(lines)
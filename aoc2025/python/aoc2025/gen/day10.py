@@ -0,0 +1,63 @@
+"""Day 10: `size` machines, each with indicator lights and buttons.
+
+Every machine is solvable in both parts. The target lights are those
+toggled by a random non-empty set of buttons, and the joltages are those
+reached by pressing each button a random number of times. Every light is
+wired to at least one button.
+"""
+
+import random
+
+from aoc2025.gen import Span, draw
+
+
+def machine(rng: random.Random, lights: int, buttons: int, presses: int) -> str:
+    wiring = [set() for _ in range(buttons)]
+    for light in range(lights):
+        wiring[rng.randrange(buttons)].add(light)
+    for button in wiring:
+        button.update(
+            rng.sample(range(lights), rng.randint(1, max(lights // 2, 1)))
+        )
+
+    target: set[int] = set()
+    while not target:
+        for button in rng.sample(wiring, rng.randint(1, buttons)):
+            target ^= button
+
+    counts = [rng.randint(0, presses) for _ in range(buttons)]
+    joltages = [
+        sum(
+            count
+            for count, button in zip(counts, wiring, strict=True)
+            if light in button
+        )
+        for light in range(lights)
+    ]
+
+    diagram = "".join(
+        "#" if light in target else "." for light in range(lights)
+    )
+    schematics = " ".join(
+        "(" + ",".join(map(str, sorted(button))) + ")" for button in wiring
+    )
+    return f"[{diagram}] {schematics} {{{','.join(map(str, joltages))}}}"
+
+
+def generate(
+    size: int,
+    rng: random.Random,
+    lights: Span = (4, 10),
+    buttons: Span = (3, 13),
+    presses: int = 20,
+) -> str:
+    """Generate machines, pressing each button up to `presses` times."""
+    return "\n".join(
+        machine(rng, draw(rng, lights), draw(rng, buttons), presses)
+        for _ in range(size)
+    )
+
+
+def input_size(lines: list[str]) -> int:
+    """Count the machines in an input."""
+    return len(lines)
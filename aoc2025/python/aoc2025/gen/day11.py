@@ -0,0 +1,68 @@
+"""Day 11: a network of `size` devices.
+
+Devices are arranged in `depth` layers and only connect to later ones,
+so the graph is acyclic. `svr` is in the first layer and `out` alone in
+the last, with `you`, `fft` and `dac` spread between them. Every device
+connects to the next layer, so every path leads to `out`, and a chain of
+devices guarantees a path from `svr` through `fft` and `dac`.
+"""
+
+import random
+from itertools import pairwise, product
+from string import ascii_lowercase
+
+RESERVED = ("svr", "you", "fft", "dac", "out")
+
+
+def generate(
+    size: int, rng: random.Random, depth: int = 16, fanout: int = 3
+) -> str:
+    """Generate devices with up to `fanout` outputs each."""
+    names = ["".join(letters) for letters in product(ascii_lowercase, repeat=3)]
+    names = [name for name in names if name not in RESERVED]
+    if size > len(names) + len(RESERVED):
+        raise ValueError(f"At most {len(names) + len(RESERVED)} devices")
+    others = max(size, depth) - len(RESERVED)
+    depth = max(min(depth, others + 2), 5)
+
+    layers: list[list[str]] = [["svr"]] + [[] for _ in range(depth - 2)]
+    layers.append(["out"])
+    # Fill every middle layer once, then place the rest anywhere
+    for i, name in enumerate(rng.sample(names, others)):
+        layer = i + 1 if i < depth - 2 else rng.randint(1, depth - 2)
+        layers[layer].append(name)
+    waypoints = {"you": depth // 4, "fft": depth // 3, "dac": 2 * depth // 3}
+    for name, layer in waypoints.items():
+        layers[max(layer, 1)].append(name)
+
+    outputs: dict[str, set[str]] = {}
+    for i, layer in enumerate(layers[:-1]):
+        for name in layer:
+            targets = {rng.choice(layers[i + 1])}
+            for _ in range(rng.randint(0, fanout - 1)):
+                later = rng.randint(i + 1, min(i + 3, depth - 1))
+                targets.add(rng.choice(layers[later]))
+            outputs[name] = targets
+
+    # Link svr -> fft -> dac -> out through one device per layer
+    chain = ["svr"]
+    for i in range(1, depth - 1):
+        if i == waypoints["fft"]:
+            chain.append("fft")
+        elif i == waypoints["dac"]:
+            chain.append("dac")
+        else:
+            chain.append(rng.choice(layers[i]))
+    chain.append("out")
+    for source, target in pairwise(chain):
+        outputs[source].add(target)
+
+    return "\n".join(
+        f"{name}: {' '.join(sorted(targets))}"
+        for name, targets in outputs.items()
+    )
+
+
+def input_size(lines: list[str]) -> int:
+    """Count the devices, including `out`, which has no line."""
+    return len(lines) + 1
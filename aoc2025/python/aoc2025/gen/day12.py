@@ -0,0 +1,38 @@
+"""Day 12: six 3x3 present shapes, then `size` regions under the trees.
+
+Some regions have room for their presents (at one per 3x3 block) and
+some are overfull, so the answer is neither 0 nor `size`.
+"""
+
+import random
+
+
+def shape(rng: random.Random) -> list[str]:
+    cells = ["#"] * 7 + ["."] * 2
+    rng.shuffle(cells)
+    return ["".join(cells[row * 3 : row * 3 + 3]) for row in range(3)]
+
+
+def generate(
+    size: int, rng: random.Random, low: int = 35, high: int = 50
+) -> str:
+    """Generate regions with sides between `low` and `high`."""
+    blocks = []
+    for index in range(6):
+        blocks.append("\n".join([f"{index}:", *shape(rng)]))
+
+    regions = []
+    for _ in range(size):
+        width, height = rng.randint(low, high), rng.randint(low, high)
+        capacity = (width // 3) * (height // 3)
+        total = rng.randint(capacity * 3 // 4, capacity * 5 // 4)
+        counts = [0] * 6
+        for _ in range(total):
+            counts[rng.randrange(6)] += 1
+        regions.append(f"{width}x{height}: {' '.join(map(str, counts))}")
+    return "\n\n".join(blocks) + "\n\n" + "\n".join(regions)
+
+
+def input_size(lines: list[str]) -> int:
+    """Count the regions, which follow the shapes."""
+    return sum("x" in line for line in lines)
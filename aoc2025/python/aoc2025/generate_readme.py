@@ -1,6 +1,41 @@
-import csv
+"""Generate README.md from the saved answers and timings.
+
+Generation is incremental. A manifest in data/cache records a
+fingerprint of every answer file (its mtime and size, and a hash of its
+contents), the highest row id seen in each timings table, and the
+rendered section for each day. On the next run only the days whose
+answer files changed, or that gained timings since those marks, are
+rendered again, so the cost stays flat however long the history grows.
+Everything is rendered again if the set of columns changes, or with
+`--force`. The trend column draws a sparkline of each part's Python
+timings (see `aoc2025.trends`), which only changes when its day gains
+timings. The README is written to a temporary file and renamed into
+place, so it is never left half written.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import click
 
 from aoc2025 import locations
+from aoc2025.bench import format_bytes
+from aoc2025.timings import (
+    Comparison,
+    changes_since,
+    latest_comparisons,
+    latest_memory,
+    latest_timings,
+    timing_history,
+)
+from aoc2025.trends import sparkline
+
+# Bump to discard manifests written by an older layout
+MANIFEST_VERSION = 2
+ANSWER_GLOB = "*/day*_part*.txt"
 
 
 def get_all_timings() -> dict[tuple[int, int, str], float]:
@@ -9,25 +44,21 @@ def get_all_timings() -> dict[tuple[int, int, str], float]:
     Returns:
         Dict mapping (day, part, language) to time in seconds
     """
-    timings_file = locations.TIMINGS_FILE
-
-    if not timings_file.exists():
-        return {}
+    return latest_timings()
 
-    timings = {}
-    with open(timings_file) as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            key = (int(row["day"]), int(row["part"]), row["language"])
-            # Always update with latest (CSV appends, so last is newest)
-            timings[key] = float(row["time_seconds"])
 
-    return timings
+def answer_key(output_file: Path) -> tuple[int, int]:
+    """Get the (day, part) of an answer file such as day01_part1.txt."""
+    day, part = output_file.stem.split("_")
+    return int(day.replace("day", "")), int(part.replace("part", ""))
 
 
-def get_answers() -> dict[tuple[int, int], str]:
+def get_answers(days: set[int] | None = None) -> dict[tuple[int, int], str]:
     """Get all answers from output files.
 
+    Args:
+        days: Only read the answers for these days (default: all)
+
     Returns:
         Dict mapping (day, part) to answer
     """
@@ -37,14 +68,10 @@ def get_answers() -> dict[tuple[int, int], str]:
         return {}
 
     answers = {}
-    for output_file in sorted(outputs_dir.glob("*/day*_part*.txt")):
-        # Parse filename: day01_part1.txt
-        parts = output_file.stem.split("_")
-        day = int(parts[0].replace("day", ""))
-        part = int(parts[1].replace("part", ""))
-
-        answer = output_file.read_text().strip()
-        answers[(day, part)] = answer
+    for output_file in sorted(outputs_dir.glob(ANSWER_GLOB)):
+        key = answer_key(output_file)
+        if days is None or key[0] in days:
+            answers[key] = output_file.read_text().strip()
 
     return answers
 
@@ -61,87 +88,266 @@ def get_available_languages(timings: dict) -> list[str]:
     return sorted(languages)
 
 
-def generate_readme() -> str:
-    """Generate the complete README content."""
-    answers = get_answers()
-    timings = get_all_timings()
-    languages = get_available_languages(timings)
+def format_speedup(comparison: Comparison) -> str:
+    """Format a speedup with its confidence interval."""
+    return (
+        f"{comparison.speedup:.1f}x ({comparison.speedup_low:.1f}-"
+        f"{comparison.speedup_high:.1f})"
+    )
 
-    # Find all completed days
-    completed_days = set()
-    for day, _ in answers.keys():
-        completed_days.add(day)
 
-    # Header
-    readme = """# Advent of Code 2025
+def render_header() -> str:
+    return """# Advent of Code 2025
 
 Solutions for [Advent of Code 2025](https://adventofcode.com/2025).
 
 """
 
-    # Generate section for each completed day
-    for day in sorted(completed_days):
-        # Count stars
-        has_part1 = (day, 1) in answers
-        has_part2 = (day, 2) in answers
-        stars = ""
-        if has_part1 and has_part2:
-            stars = " ⭐⭐"
-        elif has_part1:
-            stars = " ⭐"
-
-        readme += f"## Day {day:02d}{stars}\n\n"
-
-        # Create table header with columns for each language
-        readme += "| Part | Answer |"
+
+def format_row(cells: list[str]) -> str:
+    """Format a table row, leaving a single space in empty cells."""
+    return "|" + "".join(f" {cell} |" if cell else " |" for cell in cells)
+
+
+def render_day(
+    day: int,
+    answers: dict[tuple[int, int], str],
+    timings: dict[tuple[int, int, str], float],
+    languages: list[str],
+    memory: dict[tuple[int, int, str], tuple[int, int]] | None,
+    comparisons: dict[tuple[int, int, str], Comparison] | None,
+    trends: dict[tuple[int, int], str],
+) -> str:
+    """Render the section for one day.
+
+    Args:
+        day: Day number (1-25)
+        answers: Answers, which must include this day's
+        timings: Latest timings, which must include this day's
+        languages: Languages to give a timing column
+        memory: Latest memory use, or None to leave out those columns
+        comparisons: Latest comparisons, or None to leave out the
+            process speedup column
+        trends: Sparklines of the Python timings, by (day, part)
+    """
+    # Count stars
+    has_part1 = (day, 1) in answers
+    has_part2 = (day, 2) in answers
+    stars = ""
+    if has_part1 and has_part2:
+        stars = " ⭐⭐"
+    elif has_part1:
+        stars = " ⭐"
+
+    # Table header and separator, with columns for each language
+    header = ["Part", "Answer"]
+    header += [f"{lang.capitalize()} (s)" for lang in languages]
+    header += ["Trend", "Rust speedup"]
+    separator = ["------", "--------"] + ["----------"] * len(languages)
+    separator += ["-------", "---------"]
+    if comparisons is not None:
+        header.append("Process speedup")
+        separator.append("-----------------")
+    if memory is not None:
+        header += ["Peak memory", "Peak RSS"]
+        separator += ["-------------", "----------"]
+    lines = [format_row(header), "|" + "|".join(separator) + "|"]
+
+    # Add rows for each part
+    for part in [1, 2]:
+        if (day, part) not in answers:
+            continue
+        row = [str(part), answers[(day, part)]]
+
+        # Add timing for each language
         for lang in languages:
-            readme += f" {lang.capitalize()} (s) |"
-        readme += " Rust speedup |"
-        readme += "\n"
-
-        # Table separator
-        readme += "|------|--------|"
-        for _ in languages:
-            readme += "----------|"
-        readme += "---------|"
-        readme += "\n"
-
-        # Add rows for each part
-        for part in [1, 2]:
-            if (day, part) in answers:
-                answer = answers[(day, part)]
-                readme += f"| {part} | {answer} |"
-
-                # Add timing for each language
-                for lang in languages:
-                    time_key = (day, part, lang)
-                    if time_key in timings:
-                        readme += f" {timings[time_key]:.6f} |"
-                    else:
-                        readme += " N/A |"
-
-                # Calculate speedup (Python / Rust)
-                python_time = timings.get((day, part, "python"))
-                rust_time = timings.get((day, part, "rust"))
-                if python_time and rust_time:
-                    speedup = python_time / rust_time
-                    readme += f" {speedup:.1f}x |"
-                else:
-                    readme += " |"
-
-                readme += "\n"
-
-        readme += "\n---\n\n"
-
-    return readme
-
-
-def main():
+            time_key = (day, part, lang)
+            if time_key in timings:
+                row.append(f"{timings[time_key]:.6f}")
+            else:
+                row.append("N/A")
+        row.append(trends.get((day, part), ""))
+
+        # Calculate speedup (Python / Rust)
+        python_time = timings.get((day, part, "python"))
+        rust_time = timings.get((day, part, "rust"))
+        solve = (comparisons or {}).get((day, part, "solve"))
+        if solve:
+            row.append(format_speedup(solve))
+        elif python_time and rust_time:
+            row.append(f"{python_time / rust_time:.1f}x")
+        else:
+            row.append("")
+
+        if comparisons is not None:
+            process = comparisons.get((day, part, "process"))
+            row.append(format_speedup(process) if process else "")
+
+        if memory is not None:
+            usage = memory.get((day, part, "python"))
+            if usage:
+                row += [format_bytes(size) for size in usage]
+            else:
+                row += ["N/A", "N/A"]
+
+        lines.append(format_row(row))
+
+    table = "\n".join(lines)
+    return f"## Day {day:02d}{stars}\n\n{table}\n\n---\n\n"
+
+
+def render_days(
+    days: set[int], languages: list[str], memory: bool, comparisons: bool
+) -> dict[int, str]:
+    """Render the sections for some days, reading only their data."""
+    answers = get_answers(days)
+    timings = latest_timings(days)
+    usage = latest_memory(days) if memory else None
+    compared = latest_comparisons(days) if comparisons else None
+    trends = {
+        (day, part): sparkline([seconds for _, seconds in history])
+        for (day, part, _), history in timing_history(days, "python").items()
+    }
+    return {
+        day: render_day(
+            day, answers, timings, languages, usage, compared, trends
+        )
+        for day in sorted({day for day, _ in answers})
+    }
+
+
+def generate_readme() -> str:
+    """Generate the complete README content from scratch."""
+    timings = get_all_timings()
+    languages = get_available_languages(timings)
+    sections = render_days(
+        {day for day, _ in get_answers()},
+        languages,
+        # Memory columns only appear once something has run with --memory
+        memory=bool(latest_memory()),
+        # Speedups from `aoc2025.compare`, which replace the single-run
+        # ratio, add a column once there are any
+        comparisons=bool(latest_comparisons()),
+    )
+    return render_header() + "".join(sections.values())
+
+
+def fingerprint(path: Path, previous: dict[str, Any] | None) -> dict[str, Any]:
+    """Fingerprint a file, only hashing it if its mtime or size changed."""
+    stat = path.stat()
+    if (
+        previous
+        and previous["mtime_ns"] == stat.st_mtime_ns
+        and previous["size"] == stat.st_size
+    ):
+        return previous
+    return {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": hashlib.sha256(path.read_bytes()).hexdigest(),
+    }
+
+
+def load_manifest() -> dict[str, Any]:
+    """Load the manifest, or an empty one if it is missing or stale."""
+    path = locations.README_MANIFEST
+    try:
+        manifest = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """Write a file by renaming a temporary copy over it."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f".{path.name}.tmp")
+    partial.write_text(text)
+    os.replace(partial, path)
+
+
+def update_readme(force: bool = False) -> list[int]:
+    """Bring README.md up to date, rendering only what has changed.
+
+    Args:
+        force: If True, ignore the manifest and render every day
+
+    Returns:
+        The days whose sections were rendered again
+    """
+    manifest = {} if force else load_manifest()
+    changes = changes_since(manifest.get("marks", {}))
+    # The columns only ever gain languages, memory and comparisons
+    seen_languages, seen_memory, seen_comparisons = manifest.get(
+        "layout", ([], False, False)
+    )
+    languages = sorted(set(seen_languages) | changes.languages)
+    memory = seen_memory or changes.memory
+    comparisons = seen_comparisons or bool(changes.marks.get("comparisons"))
+
+    # Fingerprint every answer file, noting the days whose files changed
+    previous_files = manifest.get("files", {})
+    files = {}
+    changed = set(changes.days)
+    outputs_dir = locations.OUTPUTS_DIR
+    paths = (
+        sorted(outputs_dir.glob(ANSWER_GLOB)) if outputs_dir.exists() else []
+    )
+    for path in paths:
+        name = path.relative_to(outputs_dir).as_posix()
+        previous = previous_files.get(name)
+        files[name] = fingerprint(path, previous)
+        # A touch changes the mtime, but only new contents need a render
+        if previous is None or files[name]["sha256"] != previous["sha256"]:
+            changed.add(answer_key(path)[0])
+    for name in previous_files.keys() - files.keys():
+        changed.add(answer_key(Path(name))[0])
+
+    sections = {
+        int(day): text for day, text in manifest.get("sections", {}).items()
+    }
+    layout = [languages, memory, comparisons]
+    if layout != manifest.get("layout"):
+        # A new column changes every table
+        changed = {answer_key(path)[0] for path in paths} | sections.keys()
+    rendered = render_days(changed, languages, memory, comparisons)
+    for day in changed:
+        sections.pop(day, None)
+    sections.update(rendered)
+
+    readme = render_header() + "".join(
+        sections[day] for day in sorted(sections)
+    )
+    readme_path = locations.PROJECT_ROOT / "README.md"
+    if not readme_path.exists() or readme_path.read_text() != readme:
+        write_atomic(readme_path, readme)
+    write_atomic(
+        locations.README_MANIFEST,
+        json.dumps(
+            {
+                "version": MANIFEST_VERSION,
+                "marks": changes.marks,
+                "layout": layout,
+                "files": files,
+                "sections": {str(day): text for day, text in sections.items()},
+            },
+            indent=1,
+        ),
+    )
+    return sorted(rendered)
+
+
+@click.command()
+@click.option(
+    "--force", is_flag=True, help="Render every day, ignoring the manifest"
+)
+def main(force: bool) -> None:
     """Generate and write README.md."""
-    readme_content = generate_readme()
+    rendered = update_readme(force)
     readme_path = locations.PROJECT_ROOT / "README.md"
-    readme_path.write_text(readme_content)
-    print(f"Generated {readme_path}")
+    print(f"Generated {readme_path} ({len(rendered)} day(s) rendered)")
 
 
 if __name__ == "__main__":
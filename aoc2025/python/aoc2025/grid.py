@@ -1,4 +1,48 @@
+"""Helpers for puzzles set on a rectangular grid of cells.
+
+`Grid` keeps the cells in a compact NumPy array, so whole-grid steps are
+array operations rather than Python loops over cells. Neighbour counts
+are sums of the grid shifted by each neighbour's offset, which is a
+convolution with a 3x3 kernel of ones (and no centre). Cells beyond the
+edge count as the grid's `fill` value, so boundaries need no special
+cases.
+
+`BitGrid` packs a grid of on and off cells into one Python int, for
+cellular-automaton style rounds where every cell is updated at once.
+Neighbour counts are then kept as bit-sliced counters: one int per bit
+of the count, each built from shifted copies of the board with a few
+bitwise ops, with no work per cell in Python.
+
+For regions, `flood_fill` fills a span of a row at a time, `label_regions`
+numbers connected regions by joining runs of cells row by row, and
+`polygon_mask` finds the cells in or on a rectilinear polygon by parity
+of edge crossings, counted with cumulative sums over the whole grid.
+"""
+
+from collections.abc import Iterable
+from functools import cached_property
 from itertools import product
+from typing import TYPE_CHECKING, Any, Self
+
+# NumPy is imported by the functions that use it, so importing a day
+# module that uses this one stays fast
+if TYPE_CHECKING:
+    import numpy as np
+
+# The (row, column) offsets of a cell's neighbours, by connectivity
+OFFSETS = {
+    4: ((-1, 0), (0, -1), (0, 1), (1, 0)),
+    8: (
+        (-1, -1),
+        (-1, 0),
+        (-1, 1),
+        (0, -1),
+        (0, 1),
+        (1, -1),
+        (1, 0),
+        (1, 1),
+    ),
+}
 
 
 def find_neighbours(i: int, j: int, m: int, n: int) -> list[tuple[int, int]]:
@@ -9,3 +53,421 @@ def find_neighbours(i: int, j: int, m: int, n: int) -> list[tuple[int, int]]:
     return [
         (row, col) for row, col in all_indices if not (row == i and col == j)
     ]
+
+
+def expand_ranges(starts: "np.ndarray", lengths: "np.ndarray") -> "np.ndarray":
+    """Join `range(start, start + length)` for each pair into one array."""
+    import numpy as np
+
+    ends = np.cumsum(lengths)
+    # Shift each range's run of positions so it begins at its start
+    steps = np.repeat(starts - (ends - lengths), lengths)
+    return steps + np.arange(ends[-1] if len(ends) else 0)
+
+
+class Grid:
+    """A grid of small integers backed by a 2D NumPy array.
+
+    Args:
+        cells: The values of the cells, by row then column
+        fill: The value of every cell beyond the edge of the grid
+    """
+
+    def __init__(self, cells: "np.ndarray", fill: int = 0) -> None:
+        import numpy as np
+
+        if cells.ndim != 2:
+            raise ValueError(f"A grid needs 2 dimensions, not {cells.ndim}")
+        self.cells = np.ascontiguousarray(cells)
+        self.fill = fill
+
+    @classmethod
+    def from_lines(
+        cls,
+        lines: Iterable[str],
+        values: dict[str, int],
+        fill: int = 0,
+        dtype: Any = "uint8",
+    ) -> Self:
+        """Build a grid from lines of characters of the same length.
+
+        Args:
+            lines: One string per row
+            values: The value of each character; any others are 0
+            fill: The value of every cell beyond the edge of the grid
+            dtype: The NumPy type of the cells
+        """
+        import numpy as np
+
+        rows = list(lines)
+        if len({len(row) for row in rows}) > 1:
+            raise ValueError("Every line of a grid must be the same length")
+        width = len(rows[0]) if rows else 0
+        raw = np.frombuffer("".join(rows).encode("latin-1"), dtype=np.uint8)
+        # Map every byte through a lookup table in one step
+        table = np.zeros(256, dtype=dtype)
+        for char, value in values.items():
+            table[ord(char)] = value
+        return cls(table[raw].reshape(len(rows), width), fill)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.cells.shape
+
+    @property
+    def rows(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def cols(self) -> int:
+        return self.cells.shape[1]
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.cells[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.cells[key] = value
+
+    def copy(self) -> Self:
+        return type(self)(self.cells.copy(), self.fill)
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def count(self, value: int = 1) -> int:
+        """Count the cells holding a value."""
+        import numpy as np
+
+        return int(np.count_nonzero(self.cells == value))
+
+    def padded(self, width: int = 1) -> "np.ndarray":
+        """Get the cells with a border of `fill` around them."""
+        import numpy as np
+
+        return np.pad(self.cells, width, constant_values=self.fill)
+
+    def shifted(self, d_row: int, d_col: int) -> "np.ndarray":
+        """Get the value at (row + d_row, col + d_col) for every cell.
+
+        Offsets reaching past the edge give the grid's `fill` value.
+        """
+        width = max(abs(d_row), abs(d_col))
+        padded = self.padded(width)
+        top, left = width + d_row, width + d_col
+        return padded[top : top + self.rows, left : left + self.cols]
+
+    def neighbour_counts(
+        self, connectivity: int = 8, value: int | None = None
+    ) -> "np.ndarray":
+        """Sum the neighbours of every cell.
+
+        Args:
+            connectivity: 4 for orthogonal neighbours, 8 to add diagonals
+            value: If given, count the neighbours holding this value
+                instead of adding up their values
+
+        Returns:
+            An array of the same shape as the grid
+        """
+        import numpy as np
+
+        if connectivity not in OFFSETS:
+            raise ValueError(f"Connectivity must be 4 or 8, not {connectivity}")
+        source = self.cells if value is None else self.cells == value
+        fill = self.fill if value is None else self.fill == value
+        # Wide enough that eight of the largest value cannot overflow
+        padded = np.pad(
+            source.astype(np.result_type(source.dtype, np.int16)),
+            1,
+            constant_values=fill,
+        )
+        counts = np.zeros_like(padded[1:-1, 1:-1])
+        for d_row, d_col in OFFSETS[connectivity]:
+            counts += padded[
+                1 + d_row : 1 + d_row + self.rows,
+                1 + d_col : 1 + d_col + self.cols,
+            ]
+        return counts
+
+    def where(self, mask: "np.ndarray", value: int) -> int:
+        """Set every cell picked out by a boolean mask to a value.
+
+        Returns:
+            The number of cells picked out
+        """
+        import numpy as np
+
+        self.cells[mask] = value
+        return int(np.count_nonzero(mask))
+
+
+class BitGrid:
+    """A grid of on and off cells packed into the bits of one int.
+
+    Cell (row, col) is bit `row * stride + col`, where each row has a
+    spare bit after its last cell. That bit is always off, so shifting
+    the board by a column never carries a cell into the next row.
+
+    Args:
+        bits: The board, with only cells' bits on
+        rows: Number of rows
+        cols: Number of columns
+    """
+
+    def __init__(self, bits: int, rows: int, cols: int) -> None:
+        self.bits = bits
+        self.rows = rows
+        self.cols = cols
+        self.stride = cols + 1
+
+    @classmethod
+    def from_grid(cls, grid: Grid, value: int = 1) -> Self:
+        """Pack the cells of a grid holding a value."""
+        import numpy as np
+
+        # A column of zeros on the right gives each row its spare bit
+        cells = np.zeros((grid.rows, grid.cols + 1), dtype=bool)
+        cells[:, :-1] = grid.cells == value
+        packed = np.packbits(cells.ravel(), bitorder="little")
+        return cls(int.from_bytes(packed.tobytes(), "little"), *grid.shape)
+
+    def to_array(self) -> "np.ndarray":
+        """Unpack the board into a boolean array of the grid's shape."""
+        import numpy as np
+
+        size = self.rows * self.stride
+        packed = np.frombuffer(
+            self.bits.to_bytes((size + 7) // 8, "little"), dtype=np.uint8
+        )
+        cells = np.unpackbits(packed, count=size, bitorder="little")
+        return cells.reshape(self.rows, self.stride)[:, :-1].astype(bool)
+
+    def with_bits(self, bits: int) -> Self:
+        """Make a board of the same shape with other cells on."""
+        return type(self)(bits, self.rows, self.cols)
+
+    @cached_property
+    def mask(self) -> int:
+        """Every cell of the grid, without the spare bits."""
+        return self.row_mask(0) * self.col_mask(0)
+
+    def row_mask(self, row: int) -> int:
+        """Every cell in one row."""
+        return ((1 << self.cols) - 1) << (row * self.stride)
+
+    def col_mask(self, col: int) -> int:
+        """Every cell in one column."""
+        # 1 + 2**stride + 2**(2 * stride) + ... puts a bit in every row
+        size = self.rows * self.stride
+        return ((1 << size) - 1) // ((1 << self.stride) - 1) << col
+
+    def count(self) -> int:
+        """Count the cells that are on."""
+        return self.bits.bit_count()
+
+    def shifted(self, d_row: int, d_col: int) -> int:
+        """Get the value at (row + d_row, col + d_col) for every cell.
+
+        Offsets reaching past the edge give cells that are off.
+        """
+        return self._shift(d_row, d_col) & self.mask
+
+    def _shift(self, d_row: int, d_col: int) -> int:
+        # Leaves stray bits outside the grid, for callers to mask off
+        shift = d_row * self.stride + d_col
+        return self.bits >> shift if shift >= 0 else self.bits << -shift
+
+    def neighbour_counts(self, connectivity: int = 8) -> list[int]:
+        """Count the neighbours that are on, as bit-sliced counters.
+
+        Returns:
+            One board per bit of the count, least significant first, so
+            a cell's count is the sum of `2**i` over the boards it is on in
+        """
+        if connectivity not in OFFSETS:
+            raise ValueError(f"Connectivity must be 4 or 8, not {connectivity}")
+        slices = [0] * connectivity.bit_length()
+        for d_row, d_col in OFFSETS[connectivity]:
+            # Add one board to the counters, rippling the carry upwards
+            carry = self._shift(d_row, d_col)
+            for i, counter in enumerate(slices):
+                slices[i] = counter ^ carry
+                carry &= counter
+                if not carry:
+                    break
+        # Each bit's count only ever mixes with itself, so stray bits
+        # outside the grid can all be cleared at the end
+        return [counter & self.mask for counter in slices]
+
+    def at_least(self, slices: list[int], threshold: int) -> int:
+        """Find the cells whose bit-sliced count is at least a threshold."""
+        if threshold >= 1 << len(slices):
+            return 0
+        # Compare from the top bit down: cells already above the
+        # threshold, and cells matching it on every bit so far
+        above, equal = 0, self.mask
+        for i in reversed(range(len(slices))):
+            if threshold >> i & 1:
+                equal &= slices[i]
+            else:
+                above |= equal & slices[i]
+                equal &= ~slices[i]
+        return above | equal
+
+
+def runs(line: "np.ndarray") -> "tuple[np.ndarray, np.ndarray]":
+    """Find the runs of true values in a 1D boolean array.
+
+    Returns:
+        The start of each run, and the index just past its end
+    """
+    import numpy as np
+
+    edges = np.flatnonzero(np.diff(line, prepend=False, append=False))
+    return edges[::2], edges[1::2]
+
+
+def flood_fill(cells: "np.ndarray", start: tuple[int, int], value: Any) -> int:
+    """Fill the region of cells around a start cell with a value, in place.
+
+    The region is every cell holding the start cell's value that can be
+    reached from it in orthogonal steps. It is filled a span at a time:
+    the run of matching cells through a seed is filled in one step, and
+    each run of matching cells just above or below it seeds another.
+
+    Returns:
+        The number of cells filled
+    """
+    import numpy as np
+
+    target = cells[start]
+    if target == value:
+        return 0
+    filled = 0
+    seeds = [start]
+    while seeds:
+        row, col = seeds.pop()
+        line = cells[row]
+        if line[col] != target:
+            continue
+        # Widen the seed to the span of matching cells it is part of
+        before = np.flatnonzero(line[:col] != target)
+        after = np.flatnonzero(line[col:] != target)
+        left = before[-1] + 1 if len(before) else 0
+        right = col + after[0] if len(after) else len(line)
+        line[left:right] = value
+        filled += right - left
+        for next_row in (row - 1, row + 1):
+            if 0 <= next_row < len(cells):
+                starts, _ = runs(cells[next_row, left:right] == target)
+                seeds.extend((next_row, left + s) for s in starts.tolist())
+    return filled
+
+
+def label_regions(
+    mask: "np.ndarray", connectivity: int = 4
+) -> "tuple[np.ndarray, int]":
+    """Number the connected regions of true cells in a boolean array.
+
+    Each row is split into runs of true cells, and runs in neighbouring
+    rows that touch are joined with a union-find, so the Python work is
+    per run rather than per cell.
+
+    Args:
+        mask: The cells to label
+        connectivity: 4 for orthogonal neighbours, 8 to add diagonals
+
+    Returns:
+        The label of every cell (0 outside the mask, regions from 1) and
+        the number of regions
+    """
+    import numpy as np
+
+    if connectivity not in OFFSETS:
+        raise ValueError(f"Connectivity must be 4 or 8, not {connectivity}")
+    # Diagonal neighbours let runs touch corner to corner
+    reach = 1 if connectivity == 8 else 0
+    parent: list[int] = []
+
+    def find(run: int) -> int:
+        while parent[run] != run:
+            parent[run] = parent[parent[run]]
+            run = parent[run]
+        return run
+
+    all_starts, all_lengths = [], []
+    above_starts = above_ends = np.zeros(0, dtype=np.intp)
+    above_first = 0
+    for row, line in enumerate(mask):
+        starts, ends = runs(line)
+        first = len(parent)
+        parent.extend(range(first, first + len(starts)))
+        # The runs above that overlap each run, as a range of run numbers
+        lows = np.searchsorted(above_ends, starts - reach, side="right")
+        highs = np.searchsorted(above_starts, ends + reach, side="left")
+        pairs = zip(lows.tolist(), highs.tolist(), strict=True)
+        for run, (low, high) in enumerate(pairs, start=first):
+            for other in range(above_first + low, above_first + high):
+                root, other_root = find(run), find(other)
+                if root != other_root:
+                    parent[max(root, other_root)] = min(root, other_root)
+        all_starts.append(starts + row * mask.shape[1])
+        all_lengths.append(ends - starts)
+        above_starts, above_ends, above_first = starts, ends, first
+
+    roots = np.array([find(run) for run in range(len(parent))], dtype=np.intp)
+    # Number the regions 1, 2, ... in the order their first runs appear
+    unique_roots, run_labels = np.unique(roots, return_inverse=True)
+    labels = np.zeros(mask.shape, dtype=np.int32)
+    if parent:
+        lengths = np.concatenate(all_lengths)
+        labels.ravel()[expand_ranges(np.concatenate(all_starts), lengths)] = (
+            np.repeat(run_labels + 1, lengths)
+        )
+    return labels, len(unique_roots)
+
+
+def polygon_mask(
+    shape: tuple[int, int], corners: Iterable[tuple[int, int]]
+) -> "np.ndarray":
+    """Find the cells inside or on the edge of a rectilinear polygon.
+
+    Args:
+        shape: The number of rows and columns of the grid
+        corners: The (row, column) of each corner in order around the
+            polygon, which closes back to the first; every edge must be
+            horizontal or vertical
+
+    Returns:
+        A boolean array of the grid's shape
+    """
+    import numpy as np
+
+    rows, cols = shape
+    first = np.array(list(corners), dtype=np.intp).reshape(-1, 2)
+    second = np.roll(first, -1, axis=0)
+    (r1, c1), (r2, c2) = first.T, second.T
+    if np.any((r1 != r2) & (c1 != c2)):
+        raise ValueError("Every edge of the polygon must be straight")
+    vertical = c1 == c2
+    top, bottom = np.minimum(r1, r2), np.maximum(r1, r2)
+    left, right = np.minimum(c1, c2), np.maximum(c1, c2)
+
+    # Mark each edge's cells with +1 at its start and -1 just past its
+    # end, so a cumulative sum covers the cells in between
+    down = np.zeros((rows + 1, cols), dtype=np.int32)
+    np.add.at(down, (top[vertical], c1[vertical]), 1)
+    np.add.at(down, (bottom[vertical] + 1, c1[vertical]), -1)
+    across = np.zeros((rows, cols + 1), dtype=np.int32)
+    np.add.at(across, (r1[~vertical], left[~vertical]), 1)
+    np.add.at(across, (r1[~vertical], right[~vertical] + 1), -1)
+    edges = (down.cumsum(axis=0)[:-1] > 0) | (across.cumsum(axis=1)[:, :-1] > 0)
+
+    # A cell is inside if an odd number of vertical edges lie to its
+    # left. Each edge covers its rows from the top up to but not
+    # including the bottom, so a row through a corner crosses once.
+    crossings = np.zeros((rows + 1, cols + 1), dtype=np.int32)
+    np.add.at(crossings, (top[vertical], c1[vertical] + 1), 1)
+    np.add.at(crossings, (bottom[vertical], c1[vertical] + 1), -1)
+    parity = crossings.cumsum(axis=0).cumsum(axis=1)[:rows, :cols] % 2
+    return edges | (parity == 1)
@@ -1,9 +1,21 @@
-"""Central location for all project paths."""
+"""Central location for all project paths.
 
+The project root is found on first use rather than at import time, and
+is then cached. Set AOC2025_ROOT to use a different root, or to skip
+the search entirely.
+"""
+
+import os
+from functools import cache
 from pathlib import Path
 
 # Configuration constants
 TIMINGS_FILENAME = "timings.csv"
+BENCHMARKS_FILENAME = "benchmarks.jsonl"
+TIMINGS_DB_FILENAME = "timings.sqlite3"
+SCALING_FILENAME = "scaling.csv"
+PARALLEL_FILENAME = "parallel.csv"
+ROOT_ENV_VAR = "AOC2025_ROOT"
 
 
 def find_project_root() -> Path:
@@ -23,13 +35,40 @@ def find_project_root() -> Path:
     raise RuntimeError("Could not find project root (no .venv found)")
 
 
-# Project paths
-PROJECT_ROOT = find_project_root()
-DATA_DIR = PROJECT_ROOT / "data"
-INPUTS_DIR = DATA_DIR / "inputs"
-EXAMPLES_DIR = DATA_DIR / "examples"
-OUTPUTS_DIR = DATA_DIR / "outputs"
-PYTHON_OUTPUTS_DIR = OUTPUTS_DIR / "python"
-EXAMPLE_OUTPUTS_DIR = DATA_DIR / "example_outputs"
-TIMINGS_DIR = DATA_DIR / "timings"
-TIMINGS_FILE = TIMINGS_DIR / TIMINGS_FILENAME
+@cache
+def project_root() -> Path:
+    """Get the project root, from the environment if it is set there."""
+    if root := os.environ.get(ROOT_ENV_VAR):
+        return Path(root)
+    return find_project_root()
+
+
+# Project paths, relative to the project root
+PATHS = {
+    "PROJECT_ROOT": "",
+    "DATA_DIR": "data",
+    "INPUTS_DIR": "data/inputs",
+    "EXAMPLES_DIR": "data/examples",
+    "EXAMPLE_ANSWERS": "data/examples/answers.toml",
+    "OUTPUTS_DIR": "data/outputs",
+    "PYTHON_OUTPUTS_DIR": "data/outputs/python",
+    "EXAMPLE_OUTPUTS_DIR": "data/example_outputs",
+    "TIMINGS_DIR": "data/timings",
+    "TIMINGS_FILE": f"data/timings/{TIMINGS_FILENAME}",
+    "BENCHMARKS_FILE": f"data/timings/{BENCHMARKS_FILENAME}",
+    "TIMINGS_DB": f"data/timings/{TIMINGS_DB_FILENAME}",
+    "SCALING_FILE": f"data/timings/{SCALING_FILENAME}",
+    "PARALLEL_FILE": f"data/timings/{PARALLEL_FILENAME}",
+    "PROFILES_DIR": "data/profiles",
+    "SYNTHETIC_DIR": "data/synthetic",
+    "CACHE_DIR": "data/cache",
+    "README_MANIFEST": "data/cache/readme.json",
+    "SERVE_SOCKET": "data/cache/serve.sock",
+    "RUST_DIR": "rust",
+}
+
+
+def __getattr__(name: str) -> Path:
+    if name in PATHS:
+        return project_root() / PATHS[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,239 @@
+"""Compare thread and process pools on the days that use `pmap`.
+
+Each part is timed three ways in the running interpreter: serially, with
+a thread pool and with a process pool, all with the same warmup, repeat
+count and number of workers. The medians are appended to
+data/timings/parallel.csv along with the build they ran on, so running
+this once under the free-threaded build (3.13t) and once under the
+standard one (3.13) fills in both sides:
+
+    uv run --python 3.13t python -m aoc2025.parallel_bench
+    uv run --python 3.13 python -m aoc2025.parallel_bench
+    uv run python -m aoc2025.parallel_bench --summary
+
+`--summary` sets the best thread pool time on a free-threaded build
+against the best process pool time on a build with the GIL, for each
+part that has both.
+"""
+
+import csv
+import statistics
+from dataclasses import astuple, dataclass, fields
+from datetime import datetime
+from pathlib import Path
+
+import click
+
+from aoc2025 import locations, parallel
+from aoc2025.bench import DEFAULT_REPEAT, DEFAULT_WARMUP, measure
+from aoc2025.cache import imported_modules, module_path
+from aoc2025.harness import PARTS, available_days, load_day, solver_call
+from aoc2025.utils import load_lines
+
+MODES = {
+    "serial": ("thread", False),
+    "thread": ("thread", True),
+    "process": ("process", True),
+}
+
+
+@dataclass
+class Result:
+    """The median time of one part under one kind of pool."""
+
+    build: str
+    gil: bool
+    day: int
+    part: int
+    mode: str
+    workers: int
+    seconds: float
+    timestamp: str
+
+
+def parallel_days() -> list[int]:
+    """Find the days whose modules map over their items with `pmap`."""
+    days = []
+    for day in available_days():
+        path = module_path(f"aoc2025.day{day:02d}")
+        if path and "aoc2025.parallel" in imported_modules(path.read_text()):
+            days.append(day)
+    return days
+
+
+def bench_day(
+    day: int,
+    workers: int,
+    warmup: int,
+    repeat: int,
+    test: bool,
+    synthetic: str | None,
+) -> list[Result]:
+    """Time each part of a day serially, with threads and with processes."""
+    module = load_day(day)
+    lines = load_lines(day, use_example=test, synthetic=synthetic)
+    parser = getattr(module, "parse", None)
+    data = parser(lines) if parser else lines
+    results = []
+    for part in PARTS:
+        solver, args = solver_call(module, part, data, test)
+        for mode, (executor, pooled) in MODES.items():
+            count = workers if pooled else 1
+            with parallel.configured(count, executor):
+                _, samples = measure(
+                    solver, *args, warmup=warmup, repeat=repeat
+                )
+            results.append(
+                Result(
+                    parallel.build_name(),
+                    parallel.gil_enabled(),
+                    day,
+                    part,
+                    mode,
+                    count,
+                    statistics.median(sample.wall for sample in samples),
+                    datetime.now().isoformat(),
+                )
+            )
+    return results
+
+
+def format_result(result: Result, serial: float) -> str:
+    return (
+        f"{result.day:>3}  {result.part:>4}  {result.mode:>7}  "
+        f"{result.workers:>7}  {result.seconds:>10.6f}  "
+        f"{serial / max(result.seconds, 1e-9):>7.2f}x"
+    )
+
+
+def append_csv(results: list[Result], path: Path) -> None:
+    """Add results to the CSV file, writing a header if it is new."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    new = not path.exists()
+    with open(path, "a", newline="") as f:
+        writer = csv.writer(f)
+        if new:
+            writer.writerow(field.name for field in fields(Result))
+        writer.writerows(astuple(result) for result in results)
+
+
+def read_csv(path: Path) -> list[Result]:
+    with open(path, newline="") as f:
+        return [
+            Result(
+                row["build"],
+                row["gil"] == "True",
+                int(row["day"]),
+                int(row["part"]),
+                row["mode"],
+                int(row["workers"]),
+                float(row["seconds"]),
+                row["timestamp"],
+            )
+            for row in csv.DictReader(f)
+        ]
+
+
+def summarise(results: list[Result]) -> None:
+    """Print the best free-threaded thread pool against the best GIL
+    process pool for each part."""
+    best: dict[tuple[int, int, str], Result] = {}
+    for result in results:
+        if result.mode == "thread" and not result.gil:
+            side = "threads"
+        elif result.mode == "process" and result.gil:
+            side = "processes"
+        else:
+            continue
+        key = (result.day, result.part, side)
+        if key not in best or result.seconds < best[key].seconds:
+            best[key] = result
+    print("Day  Part  Threads (3.13t)  Processes (GIL)  Speedup")
+    for day, part in sorted({(day, part) for day, part, _ in best}):
+        threads = best.get((day, part, "threads"))
+        processes = best.get((day, part, "processes"))
+        if threads is None or processes is None:
+            missing = "free-threaded" if threads is None else "GIL"
+            print(f"{day:>3}  {part:>4}  no runs on a {missing} build")
+            continue
+        print(
+            f"{day:>3}  {part:>4}  {threads.seconds:>15.6f}  "
+            f"{processes.seconds:>15.6f}  "
+            f"{processes.seconds / threads.seconds:>6.2f}x"
+        )
+
+
+@click.command()
+@click.option(
+    "--day",
+    "days",
+    type=int,
+    multiple=True,
+    help="Day to benchmark; repeat for several (default: all using pmap)",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Workers in each pool [default: one per CPU]",
+)
+@click.option(
+    "--warmup",
+    type=int,
+    default=DEFAULT_WARMUP,
+    show_default=True,
+    help="Untimed runs before sampling",
+)
+@click.option(
+    "--repeat",
+    type=int,
+    default=DEFAULT_REPEAT,
+    show_default=True,
+    help="Timed runs per part and mode",
+)
+@click.option("--test", is_flag=True, help="Run on example data")
+@click.option(
+    "--synthetic",
+    metavar="NAME",
+    default=None,
+    help="Run on data/synthetic/dayNN_NAME.txt instead of the input",
+)
+@click.option(
+    "--summary",
+    is_flag=True,
+    help="Compare the results saved so far instead of running",
+)
+def main(
+    days: tuple[int, ...],
+    workers: int | None,
+    warmup: int,
+    repeat: int,
+    test: bool,
+    synthetic: str | None,
+    summary: bool,
+) -> None:
+    """Compare thread and process pools on Advent of Code 2025 days."""
+    path = locations.PARALLEL_FILE
+    if summary:
+        if not path.exists():
+            raise click.ClickException(f"No results yet in {path}")
+        summarise(read_csv(path))
+        return
+
+    workers = workers or parallel.cpu_count()
+    gil = "GIL" if parallel.gil_enabled() else "free-threaded"
+    print(f"Python {parallel.build_name()} ({gil}), {workers} worker(s)")
+    print("Day  Part     Mode  Workers     Seconds  Speedup")
+    results = []
+    for day in list(days) or parallel_days():
+        day_results = bench_day(day, workers, warmup, repeat, test, synthetic)
+        serial = {r.part: r.seconds for r in day_results if r.mode == "serial"}
+        for result in day_results:
+            print(format_result(result, serial[result.part]))
+        results.extend(day_results)
+    append_csv(results, path)
+    print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
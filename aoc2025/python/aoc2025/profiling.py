@@ -0,0 +1,146 @@
+"""Profile a single run of a solver.
+
+Two profilers are available:
+
+- `cprofile` records every call with cProfile. It writes the raw stats
+  to `dayNN_partP.pstats`, for use with `pstats` or snakeviz, and the
+  top functions by cumulative time to `dayNN_partP.txt`.
+- `sample` snapshots the solver's stack at a fixed interval from a
+  background thread. It writes `dayNN_partP.collapsed`, with one line
+  per distinct stack followed by its sample count, which flamegraph.pl,
+  inferno and speedscope all read. Sampling adds far less overhead than
+  cProfile, so the shape of the run stays closer to an unprofiled one.
+
+Files are written to `data/profiles`.
+"""
+
+import sys
+import threading
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+from aoc2025 import locations
+
+PROFILERS = ("cprofile", "sample")
+DEFAULT_TOP = 25
+# Seconds between stack samples
+DEFAULT_INTERVAL = 0.001
+
+
+def profile_path(day: int, part: int) -> Path:
+    """Get the path, without a suffix, for a part's profile files."""
+    return locations.PROFILES_DIR / f"day{day:02d}_part{part}"
+
+
+def run_cprofile(
+    func: Callable[..., Any], args: tuple[Any, ...], path: Path, top: int
+) -> list[Path]:
+    """Run a function under cProfile, writing its stats and a summary.
+
+    Returns:
+        The paths written
+    """
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.runcall(func, *args)
+
+    stats_path = path.with_suffix(".pstats")
+    profiler.dump_stats(stats_path)
+    summary_path = path.with_suffix(".txt")
+    with open(summary_path, "w") as f:
+        stats = pstats.Stats(profiler, stream=f)
+        stats.strip_dirs().sort_stats("cumulative").print_stats(top)
+    return [stats_path, summary_path]
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    filename = Path(code.co_filename).name
+    return f"{code.co_qualname} ({filename}:{code.co_firstlineno})"
+
+
+def _stack(frame: FrameType | None, stop: FrameType) -> str:
+    """Join the frames above `stop` into a root-first collapsed stack."""
+    names = []
+    while frame is not None and frame is not stop:
+        names.append(_frame_name(frame))
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+def run_sampler(
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    path: Path,
+    interval: float = DEFAULT_INTERVAL,
+) -> list[Path]:
+    """Run a function while sampling its stack, writing collapsed stacks.
+
+    The thread switch interval is lowered to match the sampling interval
+    while the function runs, so the sampler gets a chance to run.
+
+    Returns:
+        The paths written
+    """
+    target = threading.get_ident()
+    caller = sys._getframe()
+    counts: Counter[str] = Counter()
+    done = threading.Event()
+
+    def sample() -> None:
+        while not done.wait(interval):
+            frame = sys._current_frames().get(target)
+            if stack := _stack(frame, caller):
+                counts[stack] += 1
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(interval, switch_interval))
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        func(*args)
+    finally:
+        done.set()
+        sampler.join()
+        sys.setswitchinterval(switch_interval)
+
+    collapsed_path = path.with_suffix(".collapsed")
+    with open(collapsed_path, "w") as f:
+        for stack, count in counts.most_common():
+            f.write(f"{stack} {count}\n")
+    return [collapsed_path]
+
+
+def profile(
+    mode: str,
+    day: int,
+    part: int,
+    func: Callable[..., Any],
+    *args: Any,
+    top: int = DEFAULT_TOP,
+) -> list[Path]:
+    """Profile one call of a solver and write the results.
+
+    Args:
+        mode: One of `PROFILERS`
+        day: Day number, used to name the files
+        part: Part number, used to name the files
+        func: Solver to profile
+        *args: Arguments for the solver
+        top: Number of functions in the cProfile summary
+
+    Returns:
+        The paths written
+    """
+    path = profile_path(day, part)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if mode == "cprofile":
+        return run_cprofile(func, args, path, top)
+    if mode == "sample":
+        return run_sampler(func, args, path)
+    raise ValueError(f"Unknown profiler: {mode}")
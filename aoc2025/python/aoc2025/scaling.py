@@ -0,0 +1,342 @@
+"""Measure how each day's time and memory grow with the size of its input.
+
+Each day is run on synthetic inputs (see `aoc2025.gen`) at 1x, 2x, 4x
+and so on of its real input, and every stage (parse and each part) is
+timed and has its peak memory measured at each size. The exponent k in
+time ∝ n^k, where n is the length of the input in bytes, is then fitted
+by least squares on a log-log scale, and likewise for memory. A linear
+stage has k near 1, and an all-pairs scan k near 2.
+
+A day stops growing once any of its stages takes longer than the time
+limit. Limits on the fitted exponents make the run fail, which catches
+a solution that has become quadratic before it meets a larger input:
+
+    [tool.aoc2025.scaling]
+    limit = 5.0
+
+    [tool.aoc2025.scaling.budgets]
+    day08 = { part1 = 2.2 }
+"""
+
+import csv
+import math
+import statistics
+import sys
+from dataclasses import astuple, dataclass, fields
+from pathlib import Path
+from typing import Any
+
+import click
+
+from aoc2025 import config, gen, locations
+from aoc2025.bench import format_bytes
+from aoc2025.harness import (
+    PARSE_PART,
+    PARTS,
+    discover_days,
+    load_day,
+    parse_input,
+    solve_part,
+)
+from aoc2025.utils import input_path, load_lines
+
+DEFAULT_BASE = 100
+DEFAULT_MAX_FACTOR = 64
+DEFAULT_REPEAT = 3
+DEFAULT_LIMIT = 5.0
+
+
+@dataclass
+class Point:
+    """The time and memory used by one stage of a day at one size."""
+
+    day: int
+    part: int
+    factor: int
+    size: int
+    input_bytes: int
+    seconds: float
+    peak_bytes: int | None
+    rss_bytes: int | None
+
+
+@dataclass
+class Fit:
+    """The fitted growth of one stage of a day."""
+
+    day: int
+    part: int
+    time_exponent: float | None
+    memory_exponent: float | None
+    budget: float | None
+
+    @property
+    def over_budget(self) -> bool:
+        return (
+            self.budget is not None
+            and self.time_exponent is not None
+            and self.time_exponent > self.budget
+        )
+
+
+def fit_exponent(xs: list[float], ys: list[float]) -> float | None:
+    """Fit k in y = c * x^k by least squares on the logs of x and y.
+
+    Returns:
+        The exponent, or None without two distinct positive points
+    """
+    pairs = [(math.log(x), math.log(y)) for x, y in zip(xs, ys, strict=True)]
+    if len({x for x, _ in pairs}) < 2:
+        return None
+    log_xs, log_ys = zip(*pairs, strict=True)
+    return statistics.linear_regression(log_xs, log_ys).slope
+
+
+def base_size(day: int, base: int | None) -> tuple[int, str]:
+    """Choose the size that counts as 1x, and say where it came from."""
+    if base is not None:
+        return base, "--base"
+    if input_path(day).exists():
+        return gen.input_size(day, load_lines(day)), "input"
+    return DEFAULT_BASE, "default"
+
+
+def factors(max_factor: int) -> list[int]:
+    """Get the powers of two from 1 up to `max_factor`."""
+    return [2**i for i in range(max(max_factor, 1).bit_length())]
+
+
+def measure_size(
+    day: int,
+    factor: int,
+    size: int,
+    seed: int,
+    repeat: int,
+    memory: bool,
+    options: dict[str, Any],
+) -> list[Point]:
+    """Run every stage of a day on a generated input of a given size."""
+    text = gen.generate(day, size, seed, **options)
+    lines = text.splitlines()
+    module = load_day(day)
+    data, parsed = parse_input(module, lines, repeat=repeat, memory=memory)
+    results = [
+        solve_part(module, part, data, False, repeat=repeat, memory=memory)
+        for part in PARTS
+    ]
+    return [
+        Point(
+            day,
+            result.part,
+            factor,
+            size,
+            len(text.encode()),
+            result.elapsed,
+            result.memory.peak if result.memory else None,
+            result.memory.rss if result.memory else None,
+        )
+        for result in [parsed, *results]
+        if result is not None
+    ]
+
+
+def fit_stages(day: int, points: list[Point]) -> list[Fit]:
+    """Fit the growth in time and memory of each stage of a day."""
+    fits = []
+    for part in sorted({point.part for point in points}):
+        stage = [point for point in points if point.part == part]
+        sizes = [point.input_bytes for point in stage]
+        peaks = [point.peak_bytes for point in stage]
+        fits.append(
+            Fit(
+                day,
+                part,
+                fit_exponent(sizes, [max(p.seconds, 1e-9) for p in stage]),
+                None
+                if None in peaks
+                else fit_exponent(sizes, [max(peak, 1) for peak in peaks]),
+                config.part_budget("scaling", day, part),
+            )
+        )
+    return fits
+
+
+def stage_name(part: int) -> str:
+    return "parse" if part == PARSE_PART else f"part{part}"
+
+
+def format_point(point: Point) -> str:
+    peak = "-" if point.peak_bytes is None else format_bytes(point.peak_bytes)
+    rss = "-" if point.rss_bytes is None else format_bytes(point.rss_bytes)
+    return (
+        f"{point.factor:>6}x  {point.size:>8}  {point.input_bytes:>10}  "
+        f"{stage_name(point.part):>5}  {point.seconds:>10.6f}  "
+        f"{peak:>11}  {rss:>11}"
+    )
+
+
+def format_fit(fit: Fit) -> str:
+    time_k = "-" if fit.time_exponent is None else f"{fit.time_exponent:.2f}"
+    memory_k = (
+        "-" if fit.memory_exponent is None else f"{fit.memory_exponent:.2f}"
+    )
+    budget = "-" if fit.budget is None else f"{fit.budget:g}"
+    status = "over budget" if fit.over_budget else "ok"
+    return (
+        f"  {stage_name(fit.part):>5}  time n^{time_k:<5}  "
+        f"memory n^{memory_k:<5}  budget {budget:>4}  {status}"
+    )
+
+
+def scale_day(
+    day: int,
+    base: int | None,
+    max_factor: int,
+    seed: int,
+    repeat: int,
+    limit: float,
+    memory: bool,
+    options: dict[str, Any],
+) -> tuple[list[Point], list[Fit]]:
+    """Measure a day at growing sizes until it reaches the time limit."""
+    size, source = base_size(day, base)
+    print(f"Day {day:02d}: 1x is size {size} ({source})")
+    print(
+        "  Factor      Size       Bytes  Stage     Seconds         Peak"
+        "          RSS"
+    )
+    points: list[Point] = []
+    previous = None
+    for factor in factors(max_factor):
+        scaled = gen.scaled_size(day, size, factor)
+        if scaled == previous:
+            continue
+        previous = scaled
+        try:
+            measured = measure_size(
+                day, factor, scaled, seed, repeat, memory, options
+            )
+        except ValueError as e:
+            print(f"  Stopped at {factor}x: {e}")
+            break
+        for point in measured:
+            print(format_point(point))
+        points.extend(measured)
+        if any(point.seconds > limit for point in measured):
+            print(f"  Stopped at {factor}x: over the {limit:g}s limit")
+            break
+    fits = fit_stages(day, points)
+    for fit in fits:
+        print(format_fit(fit))
+    return points, fits
+
+
+def write_csv(points: list[Point], path: Path) -> None:
+    """Write every measured point to a CSV file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(field.name for field in fields(Point))
+        writer.writerows(astuple(point) for point in points)
+
+
+@click.command()
+@click.option(
+    "--day",
+    "days",
+    type=int,
+    multiple=True,
+    help="Day to measure; repeat for several (default: all)",
+)
+@click.option(
+    "--base",
+    type=int,
+    default=None,
+    help="Generator size counted as 1x [default: that of the real input, "
+    f"or {DEFAULT_BASE}]",
+)
+@click.option(
+    "--max-factor",
+    type=int,
+    default=DEFAULT_MAX_FACTOR,
+    show_default=True,
+    help="Largest multiple of the base size to run",
+)
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option(
+    "--repeat",
+    type=int,
+    default=DEFAULT_REPEAT,
+    show_default=True,
+    help="Timed runs of each stage at each size",
+)
+@click.option(
+    "--limit",
+    type=float,
+    default=None,
+    help="Stop growing a day once a stage takes this many seconds "
+    f"[default: {DEFAULT_LIMIT}]",
+)
+@click.option(
+    "--memory/--no-memory",
+    default=True,
+    show_default=True,
+    help="Measure peak memory at each size",
+)
+@click.option(
+    "--option",
+    "-o",
+    "options",
+    multiple=True,
+    metavar="KEY=VALUE",
+    help="Generator setting (see aoc2025.gen); repeat for several",
+)
+@click.option(
+    "--csv",
+    "csv_path",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Where to write the results [default: data/timings/scaling.csv]",
+)
+def main(
+    days: tuple[int, ...],
+    base: int | None,
+    max_factor: int,
+    seed: int,
+    repeat: int,
+    limit: float | None,
+    memory: bool,
+    options: tuple[str, ...],
+    csv_path: Path | None,
+) -> None:
+    """Measure how Advent of Code 2025 solutions scale with input size."""
+    if limit is None:
+        limit = config.section("scaling").get("limit", DEFAULT_LIMIT)
+    settings = dict(gen.parse_option(option) for option in options)
+    selected = list(days) or sorted(
+        set(discover_days()) & set(gen.discover_generators())
+    )
+
+    points: list[Point] = []
+    fits: list[Fit] = []
+    for day in selected:
+        day_points, day_fits = scale_day(
+            day, base, max_factor, seed, repeat, limit, memory, settings
+        )
+        points.extend(day_points)
+        fits.extend(day_fits)
+
+    path = csv_path or locations.SCALING_FILE
+    write_csv(points, path)
+    print(f"Wrote {path}")
+    over = [fit for fit in fits if fit.over_budget]
+    if over:
+        stages = ", ".join(
+            f"day {fit.day:02d} {stage_name(fit.part)}" for fit in over
+        )
+        print(f"Over the exponent budget: {stages}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
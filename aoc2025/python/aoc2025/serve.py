@@ -0,0 +1,289 @@
+"""Keep a warm interpreter that runs days on request.
+
+`start` runs a daemon that imports the heavy dependencies and every day
+module once, then listens on a Unix socket in data/cache. `run DAY
+[ARGS]...` passes a day's usual arguments (such as `--test --part 1`)
+to the daemon, which runs the day's command just as `python -m
+aoc2025.dayNN` would and streams its output back. `watch DAY [ARGS]...`
+does the same whenever a module or the day's input or example is saved,
+and `stop` shuts the daemon down.
+
+Before each run the daemon compares the source of the day module, and
+of every aoc2025 module it imports, with what it loaded, and reloads
+only the modules that changed. The harness and the other runner modules
+are not reloaded, so restart the daemon after changing those.
+
+The client only needs the standard library and click, so it starts far
+faster than a day with its dependencies. Messages are JSON, one per
+line: the client sends one request, and the daemon replies with any
+number of `output` messages and then an `exit` message.
+"""
+
+import importlib
+import io
+import json
+import socket
+import socketserver
+import sys
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any
+
+import click
+
+from aoc2025 import locations
+
+PACKAGE = "aoc2025"
+# Slow imports made once by the daemon rather than on every run
+PRELOAD = ("numpy", "z3")
+POLL_INTERVAL = 0.5
+
+
+def send(sock: socket.socket, message: dict[str, Any]) -> None:
+    sock.sendall((json.dumps(message) + "\n").encode())
+
+
+class SocketWriter(io.TextIOBase):
+    """A text stream that sends each write to the client.
+
+    Once the client goes away, writes are dropped so the run can finish.
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.connected = True
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text and self.connected:
+            try:
+                send(self.sock, {"output": text})
+            except OSError:
+                self.connected = False
+        return len(text)
+
+
+# Source of each package module as the daemon last loaded it
+loaded_sources: dict[str, bytes] = {}
+
+
+def refresh_day(day: int) -> Any:
+    """Import a day module, reloading it or its imports if they changed."""
+    from aoc2025.cache import module_sources
+
+    name = f"{PACKAGE}.day{day:02d}"
+    sources = module_sources(name)
+    changed = [
+        module
+        for module, source in sources.items()
+        if module in loaded_sources and loaded_sources[module] != source
+    ]
+    # Reload the helpers first, so the day module binds their new names
+    for module in sorted(changed, key=lambda module: module == name):
+        importlib.reload(sys.modules[module])
+    if changed and name not in changed:
+        importlib.reload(sys.modules[name])
+    loaded_sources.update(sources)
+    if changed:
+        print(f"Reloaded {', '.join(sorted(changed))}")
+    return importlib.import_module(name)
+
+
+def run_request(day: int, args: list[str], out: SocketWriter) -> int:
+    """Run a day's command with some arguments, writing to `out`.
+
+    Returns:
+        The exit code the command would have had
+    """
+    with redirect_stdout(out), redirect_stderr(out):
+        try:
+            module = refresh_day(day)
+            module.main.main(
+                args,
+                prog_name=f"{PACKAGE}.day{day:02d}",
+                standalone_mode=False,
+            )
+        except click.exceptions.Exit as e:
+            return e.exit_code
+        except click.ClickException as e:
+            e.show(file=out)
+            return e.exit_code
+        except click.Abort:
+            return 1
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else 1
+        except Exception:
+            traceback.print_exc()
+            return 1
+    return 0
+
+
+class Handler(socketserver.StreamRequestHandler):
+    """Handle one request from a client."""
+
+    server: "Daemon"
+
+    def handle(self) -> None:
+        request = json.loads(self.rfile.readline())
+        out = SocketWriter(self.request)
+        command = request.get("command")
+        if command == "run":
+            code = run_request(request["day"], request.get("args", []), out)
+        elif command == "stop":
+            self.server.stopping = True
+            out.write("Stopping\n")
+            code = 0
+        else:
+            out.write(f"Unknown command {command!r}\n")
+            code = 2
+        if out.connected:
+            send(self.request, {"exit": code})
+
+
+class Daemon(socketserver.UnixStreamServer):
+    """A server that handles one request at a time until stopped."""
+
+    stopping = False
+
+
+def preload() -> int:
+    """Import the slow dependencies and every day module.
+
+    Returns:
+        The number of day modules loaded
+    """
+    from aoc2025.harness import discover_days
+
+    for name in PRELOAD:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+    days = discover_days()
+    for day in days:
+        refresh_day(day)
+    return len(days)
+
+
+def connect() -> socket.socket | None:
+    """Connect to the daemon, or return None if none is listening."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(locations.SERVE_SOCKET))
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+    return sock
+
+
+def request(message: dict[str, Any]) -> int:
+    """Send a request to the daemon, printing its output as it arrives.
+
+    Returns:
+        The exit code sent by the daemon
+    """
+    sock = connect()
+    if sock is None:
+        raise click.ClickException(
+            f"No daemon is listening on {locations.SERVE_SOCKET}; "
+            f"start one with `python -m {PACKAGE}.serve start`"
+        )
+    with sock, sock.makefile("r") as replies:
+        send(sock, message)
+        for line in replies:
+            reply = json.loads(line)
+            if "output" in reply:
+                sys.stdout.write(reply["output"])
+                sys.stdout.flush()
+            elif "exit" in reply:
+                return reply["exit"]
+    print("The daemon closed the connection without finishing")
+    return 1
+
+
+def watched_paths(day: int) -> list[Path]:
+    """Get the files that a day's answers could depend on."""
+    package = Path(__file__).parent
+    return [
+        *package.rglob("*.py"),
+        locations.INPUTS_DIR / f"day{day:02d}.txt",
+        locations.EXAMPLES_DIR / f"day{day:02d}.txt",
+    ]
+
+
+def snapshot(paths: list[Path]) -> dict[Path, int]:
+    return {path: path.stat().st_mtime_ns for path in paths if path.exists()}
+
+
+@click.group()
+def main() -> None:
+    """Run Advent of Code 2025 days in a warm interpreter."""
+
+
+@main.command()
+def start() -> None:
+    """Start the daemon, and serve requests until it is stopped."""
+    path = locations.SERVE_SOCKET
+    if sock := connect():
+        sock.close()
+        raise click.ClickException(f"A daemon is already listening on {path}")
+    started = time.perf_counter()
+    days = preload()
+    elapsed = time.perf_counter() - started
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Nothing is listening, so any socket file left behind is stale
+    path.unlink(missing_ok=True)
+    with Daemon(str(path), Handler) as server:
+        print(f"Loaded {days} day(s) in {elapsed:.3f}s; listening on {path}")
+        try:
+            while not server.stopping:
+                server.handle_request()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            path.unlink(missing_ok=True)
+
+
+@main.command(context_settings={"ignore_unknown_options": True})
+@click.argument("day", type=int)
+@click.argument("args", nargs=-1, type=click.UNPROCESSED)
+def run(day: int, args: tuple[str, ...]) -> None:
+    """Run a day in the daemon, with the day's own options."""
+    sys.exit(request({"command": "run", "day": day, "args": list(args)}))
+
+
+@main.command(context_settings={"ignore_unknown_options": True})
+@click.argument("day", type=int)
+@click.argument("args", nargs=-1, type=click.UNPROCESSED)
+def watch(day: int, args: tuple[str, ...]) -> None:
+    """Run a day in the daemon, and again whenever a file it uses is saved."""
+    message = {"command": "run", "day": day, "args": list(args)}
+    paths = watched_paths(day)
+    seen = snapshot(paths)
+    request(message)
+    try:
+        while True:
+            time.sleep(POLL_INTERVAL)
+            # Pick up modules created since the last look, too
+            paths = watched_paths(day)
+            current = snapshot(paths)
+            if current != seen:
+                seen = current
+                print(f"--- Day {day:02d}: change detected, running again")
+                request(message)
+    except KeyboardInterrupt:
+        pass
+
+
+@main.command()
+def stop() -> None:
+    """Stop the daemon."""
+    sys.exit(request({"command": "stop"}))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,35 @@
+"""Set up the files for new days, downloading their inputs.
+
+Inputs are fetched concurrently through one pooled HTTP client, with at
+most `--concurrency` requests in flight. Requests that time out, fail to
+connect or are refused with a 429 or 5xx status are retried with
+exponential backoff. Inputs already on disk are never requested again,
+so re-running after a partial failure only fetches what is missing.
+Point `--base-url` (or AOC_BASE_URL) at a local server to run without
+network access.
+"""
+
+import asyncio
 import os
+from typing import TYPE_CHECKING
 
 import click
-import httpx
 
 from aoc2025 import locations
 
+if TYPE_CHECKING:
+    import httpx
+
+DEFAULT_BASE_URL = "https://adventofcode.com"
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RETRIES = 3
+# Seconds before the first retry, doubling after each one
+BACKOFF = 0.5
+TIMEOUT = 10.0
+# Responses worth retrying, as the server may recover
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+USER_AGENT = "github.com/hamedbh/advent-of-code setup_day"
+
 
 def get_session_cookie() -> str:
     """Get session cookie from environment (loaded by uv from .env)."""
@@ -18,92 +43,147 @@ def get_session_cookie() -> str:
     return session
 
 
-def download_input(year: int, day: int, session: str) -> str:
-    """Download input data from Advent of Code."""
-    url = f"https://adventofcode.com/{year}/day/{day}/input"
-    cookies = {"session": session}
+def parse_days(spec: str) -> list[int]:
+    """Parse a list of days and ranges, such as "1-25" or "1,3,5-7".
 
-    try:
-        response = httpx.get(url, cookies=cookies, timeout=10.0)
-        response.raise_for_status()
-        return response.text.strip()
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 404:
-            raise ValueError(
-                f"Day {day} input not available yet. "
-                "Check if the puzzle has been released."
-            ) from e
-        elif e.response.status_code == 400:
-            raise ValueError(
-                "Invalid session cookie. Please check your AOC_SESSION in .env"
-            ) from e
+    Raises:
+        ValueError: If the list is malformed or a day is not in 1-25
+    """
+    days: set[int] = set()
+    for item in spec.split(","):
+        first, sep, last = item.strip().partition("-")
+        try:
+            start = int(first)
+            end = int(last) if sep else start
+        except ValueError as e:
+            raise ValueError(f"Invalid day or range: {item!r}") from e
+        if start > end:
+            raise ValueError(f"Range runs backwards: {item!r}")
+        if not 1 <= start <= end <= 25:
+            raise ValueError(f"Days must be between 1 and 25: {item!r}")
+        days.update(range(start, end + 1))
+    return sorted(days)
+
+
+def status_error(day: int, status: int) -> ValueError:
+    """Explain an HTTP error status from the input endpoint."""
+    if status == 404:
+        return ValueError(
+            f"Day {day} input not available yet. "
+            "Check if the puzzle has been released."
+        )
+    if status == 400:
+        return ValueError(
+            "Invalid session cookie. Please check your AOC_SESSION in .env"
+        )
+    return ValueError(f"HTTP error: {status}")
+
+
+async def fetch_input(
+    client: "httpx.AsyncClient", year: int, day: int, retries: int
+) -> str:
+    """Download one day's input, retrying failures that may be temporary."""
+    import httpx
+
+    for attempt in range(retries + 1):
+        final = attempt == retries
+        try:
+            response = await client.get(f"/{year}/day/{day}/input")
+        except httpx.TimeoutException as e:
+            if final:
+                raise ValueError("Request timed out. Please try again.") from e
+        except httpx.TransportError as e:
+            if final:
+                raise ValueError(f"Failed to download input: {e}") from e
         else:
-            raise ValueError(f"HTTP error: {e.response.status_code}") from e
-    except httpx.TimeoutException as e:
-        raise ValueError("Request timed out. Please try again.") from e
-    except Exception as e:
-        raise ValueError(f"Failed to download input: {e}") from e
+            if response.is_success:
+                return response.text.strip()
+            if final or response.status_code not in RETRY_STATUSES:
+                raise status_error(day, response.status_code)
+        await asyncio.sleep(BACKOFF * 2**attempt)
+    raise AssertionError("unreachable")
+
+
+async def download_inputs(
+    year: int,
+    days: list[int],
+    session: str,
+    base_url: str = DEFAULT_BASE_URL,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    retries: int = DEFAULT_RETRIES,
+) -> dict[int, str | BaseException]:
+    """Download the inputs for several days concurrently.
+
+    Every request goes through one client, so connections (and their
+    TLS handshakes) are reused, and a semaphore bounds how many are in
+    flight at once.
+
+    Returns:
+        Each day's input, or the error that stopped it downloading
+    """
+    # Only needed when downloading, so keep it out of the import path
+    import httpx
+
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        cookies={"session": session},
+        headers={"User-Agent": USER_AGENT},
+        timeout=TIMEOUT,
+        limits=httpx.Limits(max_connections=max(concurrency, 1)),
+    ) as client:
+
+        async def fetch(day: int) -> str:
+            async with semaphore:
+                return await fetch_input(client, year, day, retries)
+
+        results = await asyncio.gather(
+            *(fetch(day) for day in days), return_exceptions=True
+        )
+    return dict(zip(days, results, strict=True))
+
+
+def download_input(
+    year: int, day: int, session: str, base_url: str = DEFAULT_BASE_URL
+) -> str:
+    """Download input data from Advent of Code."""
+    result = asyncio.run(download_inputs(year, [day], session, base_url))[day]
+    if isinstance(result, BaseException):
+        raise result
+    return result
 
 
 def create_python_template(day: int) -> str:
     """Create Python solution template."""
-    return f'''import time
-
-import click
+    return f'''import click
 
-from aoc2025.utils import load_lines, save_answer, save_timing
+from aoc2025.harness import day_options, run_day
 
 
-def parse_input(lines: list[str]):
+def parse(lines: list[str]) -> list[str]:
     """Parse the input lines."""
     # TODO: Implement input parsing
     return lines
 
 
-def solve_part1(lines: list[str]) -> int:
+def solve_part1(input_data: list[str]) -> int:
     """Solve part 1."""
-    # input_data = parse_input(lines)
     # TODO: Implement part 1 solution
     return 0
 
 
-def solve_part2(lines: list[str]) -> int:
+def solve_part2(input_data: list[str]) -> int:
     """Solve part 2."""
-    # input_data = parse_input(lines)
     # TODO: Implement part 2 solution
     return 0
 
 
 @click.command()
-@click.option("--test", is_flag=True, help="Run on example data")
-@click.option(
-    "--part",
-    type=click.Choice(["1", "2", "both"]),
-    default="both",
-    help="Which part to solve",
-)
-def main(test: bool, part: str) -> None:
+@day_options
+def main(**options) -> None:
     """Solve Advent of Code 2025 Day {day:02d}."""
-    day = {day}
-    lines = load_lines(day, use_example=test)
-
-    if part in ("1", "both"):
-        start = time.perf_counter()
-        answer1 = solve_part1(lines)
-        elapsed1 = time.perf_counter() - start
-        print(f"Part 1: {{answer1}} ({{elapsed1:.3f}}s)")
-        save_answer(day, 1, answer1, use_example=test)
-        if not test:
-            save_timing(day, 1, elapsed1)
-
-    if part in ("2", "both"):
-        start = time.perf_counter()
-        answer2 = solve_part2(lines)
-        elapsed2 = time.perf_counter() - start
-        print(f"Part 2: {{answer2}} ({{elapsed2:.3f}}s)")
-        save_answer(day, 2, answer2, use_example=test)
-        if not test:
-            save_timing(day, 2, elapsed2)
+    run_day({day}, **options)
 
 
 if __name__ == "__main__":
@@ -131,17 +211,12 @@ pub fn solve_part2(lines: &[String]) -> Result<i64> {
 """
 
 
-@click.command()
-@click.option("--day", type=int, required=True, help="Day number (1-25)")
-@click.option("--year", type=int, default=2025, help="Year (default: 2025)")
-def main(day: int, year: int) -> None:
-    """Set up files for a new Advent of Code day."""
-    if not 1 <= day <= 25:
-        click.echo("Error: Day must be between 1 and 25")
-        raise click.Abort()
-
-    # Define paths
-    input_file = locations.INPUTS_DIR / f"day{day:02d}.txt"
+def create_day_files(day: int) -> list[str]:
+    """Create the example, Python and Rust files for a day if missing.
+
+    Returns:
+        The paths of the files created
+    """
     example_file = locations.EXAMPLES_DIR / f"day{day:02d}.txt"
     python_file = (
         locations.PROJECT_ROOT / "python" / "aoc2025" / f"day{day:02d}.py"
@@ -149,20 +224,6 @@ def main(day: int, year: int) -> None:
 
     created_files = []
 
-    # Download input data
-    if input_file.exists():
-        click.echo(f"✓ Input file already exists: {input_file}")
-    else:
-        try:
-            session = get_session_cookie()
-            click.echo(f"Downloading input for day {day}...")
-            input_data = download_input(year, day, session)
-            input_file.write_text(input_data + "\n")
-            click.echo(f"✓ Created input file: {input_file}")
-            created_files.append(str(input_file))
-        except Exception as e:
-            click.echo(f"✗ Failed to download input: {e}", err=True)
-
     # Create blank example file
     if example_file.exists():
         click.echo(f"✓ Example file already exists: {example_file}")
@@ -180,11 +241,6 @@ def main(day: int, year: int) -> None:
         click.echo(f"✓ Created Python file: {python_file}")
         created_files.append(str(python_file))
 
-    if created_files:
-        click.echo(f"\nCreated {len(created_files)} new file(s)")
-    else:
-        click.echo("\nAll files already exist")
-
     # Create Rust module
     rust_file = locations.PROJECT_ROOT / "rust" / "src" / f"day{day:02d}.rs"
     if rust_file.exists():
@@ -194,16 +250,121 @@ def main(day: int, year: int) -> None:
         rust_file.write_text(template)
         click.echo(f"✓ Created Rust file: {rust_file}")
         created_files.append(str(rust_file))
-    # Always show the reminder for Rust updates
-    if not rust_file.exists() or True:  # Always show for new setups
         click.echo("\n⚠️  Remember to update rust/src/main.rs:")
         click.echo(f"1. Add: mod day{day:02d};")
         click.echo("2. Add to match statement:")
         click.echo(
-            f"  {day} => run_day(&lines, cli.day, &cli.part, cli.test,"
-            f" day{day:02d}::solve_part1, day{day:02d}::solve_part2)?,"
+            f"  {day} => run_day(&lines, &cli, day{day:02d}::solve_part1,"
+            f" day{day:02d}::solve_part2)?,"
         )
 
+    return created_files
+
+
+def download_missing(
+    year: int,
+    days: list[int],
+    base_url: str,
+    concurrency: int,
+    retries: int,
+) -> list[str]:
+    """Download the inputs that are not on disk yet.
+
+    Returns:
+        The paths of the input files created
+    """
+    missing = []
+    for day in days:
+        input_file = locations.INPUTS_DIR / f"day{day:02d}.txt"
+        if input_file.exists():
+            click.echo(f"✓ Input file already exists: {input_file}")
+        else:
+            missing.append(day)
+    if not missing:
+        return []
+
+    try:
+        session = get_session_cookie()
+    except ValueError as e:
+        click.echo(f"✗ Failed to download input: {e}", err=True)
+        return []
+
+    click.echo(f"Downloading input for {len(missing)} day(s)...")
+    results = asyncio.run(
+        download_inputs(year, missing, session, base_url, concurrency, retries)
+    )
+    created_files = []
+    for day, result in results.items():
+        if isinstance(result, BaseException):
+            click.echo(f"✗ Failed to download day {day}: {result}", err=True)
+            continue
+        input_file = locations.INPUTS_DIR / f"day{day:02d}.txt"
+        input_file.parent.mkdir(parents=True, exist_ok=True)
+        input_file.write_text(result + "\n")
+        click.echo(f"✓ Created input file: {input_file}")
+        created_files.append(str(input_file))
+    return created_files
+
+
+@click.command()
+@click.option("--day", type=int, default=None, help="Day number (1-25)")
+@click.option(
+    "--days",
+    "day_spec",
+    default=None,
+    help="Days to set up, as a list of days and ranges (e.g. 1-25 or 1,3,5-7)",
+)
+@click.option("--year", type=int, default=2025, help="Year (default: 2025)")
+@click.option(
+    "--base-url",
+    envvar="AOC_BASE_URL",
+    default=DEFAULT_BASE_URL,
+    show_default=True,
+    help="Server to download inputs from",
+)
+@click.option(
+    "--concurrency",
+    type=int,
+    default=DEFAULT_CONCURRENCY,
+    show_default=True,
+    help="Most downloads in flight at once",
+)
+@click.option(
+    "--retries",
+    type=int,
+    default=DEFAULT_RETRIES,
+    show_default=True,
+    help="Retries for each download that fails temporarily",
+)
+def main(
+    day: int | None,
+    day_spec: str | None,
+    year: int,
+    base_url: str,
+    concurrency: int,
+    retries: int,
+) -> None:
+    """Set up files for new Advent of Code days."""
+    try:
+        if day_spec is not None:
+            days = parse_days(day_spec)
+        elif day is not None:
+            days = parse_days(str(day))
+        else:
+            raise ValueError("Give a day with --day, or several with --days")
+    except ValueError as e:
+        click.echo(f"Error: {e}")
+        raise click.Abort() from e
+
+    created_files = download_missing(year, days, base_url, concurrency, retries)
+    for current in days:
+        created_files.extend(create_day_files(current))
+
+    if created_files:
+        click.echo(f"\nCreated {len(created_files)} new file(s)")
+    else:
+        click.echo("\nAll files already exist")
+
 
 if __name__ == "__main__":
     main()
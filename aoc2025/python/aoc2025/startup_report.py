@@ -0,0 +1,157 @@
+"""Report how long each day module takes to import.
+
+Each day is imported in a fresh interpreter with `python -X importtime`,
+so the figures are for a cold start, which is what running a single day
+pays. The best of a few runs is reported along with the modules that
+cost the most, by their own import time excluding their imports.
+
+A budget in pyproject.toml makes the report fail when any day's import
+is slower:
+
+    [tool.aoc2025.startup]
+    budget = 0.1
+"""
+
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+import click
+
+from aoc2025 import config
+from aoc2025.harness import discover_days
+
+DEFAULT_REPEAT = 3
+DEFAULT_TOP = 5
+IMPORT_TIME_PATTERN = re.compile(
+    r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$"
+)
+
+
+@dataclass
+class ModuleCost:
+    """The import time of one module, in seconds."""
+
+    name: str
+    self_seconds: float
+    cumulative_seconds: float
+    depth: int
+
+
+@dataclass
+class StartupCost:
+    """The cost of starting an interpreter and importing a day module."""
+
+    day: int
+    import_seconds: float
+    process_seconds: float
+    modules: list[ModuleCost]
+
+
+def parse_import_times(output: str) -> list[ModuleCost]:
+    """Parse the lines written to stderr by `-X importtime`."""
+    modules = []
+    for line in output.splitlines():
+        if match := IMPORT_TIME_PATTERN.match(line):
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append(
+                ModuleCost(
+                    name,
+                    int(self_us) / 1e6,
+                    int(cumulative_us) / 1e6,
+                    len(indent) // 2,
+                )
+            )
+    return modules
+
+
+def measure_startup(day: int) -> StartupCost:
+    """Import a day module in a new interpreter and time it."""
+    name = f"aoc2025.day{day:02d}"
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {name}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - start
+    modules = parse_import_times(result.stderr)
+    # A module is listed after everything it imports, so walk back from
+    # the day module to the end of the previous top-level import
+    last = next(i for i, m in enumerate(modules) if m.name == name)
+    first = last
+    while first > 0 and modules[first - 1].depth > 0:
+        first -= 1
+    total = modules[last].cumulative_seconds
+    return StartupCost(day, total, elapsed, modules[first : last + 1])
+
+
+def best_startup(day: int, repeat: int) -> StartupCost:
+    """Measure a day's start up several times, keeping the fastest."""
+    runs = [measure_startup(day) for _ in range(max(repeat, 1))]
+    return min(runs, key=lambda run: run.import_seconds)
+
+
+def format_cost(cost: StartupCost, top: int) -> str:
+    lines = [
+        f"{cost.day:>3}  {cost.import_seconds * 1000:>11.1f}"
+        f"  {cost.process_seconds * 1000:>12.1f}"
+    ]
+    heaviest = sorted(cost.modules, key=lambda m: -m.self_seconds)[:top]
+    lines.extend(
+        f"       {m.self_seconds * 1000:>7.1f}ms  {m.name}" for m in heaviest
+    )
+    return "\n".join(lines)
+
+
+@click.command()
+@click.option(
+    "--day",
+    "days",
+    type=int,
+    multiple=True,
+    help="Day to report; repeat for several (default: all)",
+)
+@click.option(
+    "--repeat",
+    type=int,
+    default=DEFAULT_REPEAT,
+    show_default=True,
+    help="Interpreter starts per day; the fastest is reported",
+)
+@click.option(
+    "--top",
+    type=int,
+    default=DEFAULT_TOP,
+    show_default=True,
+    help="Slowest modules listed for each day",
+)
+@click.option(
+    "--budget",
+    type=float,
+    default=None,
+    help="Fail if any day takes longer than this many seconds to import",
+)
+def main(
+    days: tuple[int, ...], repeat: int, top: int, budget: float | None
+) -> None:
+    """Report the import time of Advent of Code 2025 day modules."""
+    if budget is None:
+        budget = config.section("startup").get("budget")
+    print("Day  Import (ms)  Process (ms)")
+    over_budget = []
+    for day in list(days) or discover_days():
+        cost = best_startup(day, repeat)
+        print(format_cost(cost, top))
+        if budget is not None and cost.import_seconds > budget:
+            over_budget.append(day)
+    if over_budget:
+        print(f"Over the {budget:g}s budget: day(s) {over_budget}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""Report how each part's timings have moved over its history.
+
+For every day, part and language in the timings store the report gives
+the best and latest times, a rolling median, a sparkline of the history,
+and the change points: runs where the median of the runs after differs
+from the median of the runs before by more than the threshold. A part
+whose latest time has drifted well above its best is flagged, which
+shows when a later change quietly undid an earlier speedup.
+
+The report is printed as text, or written as a standalone HTML page
+with `--html`. Defaults can be set in pyproject.toml:
+
+    [tool.aoc2025.trends]
+    window = 5
+    threshold = 1.25
+"""
+
+import html
+import math
+import statistics
+from dataclasses import dataclass
+from pathlib import Path
+
+import click
+
+from aoc2025 import config
+from aoc2025.harness import PARSE_PART
+from aoc2025.timings import timing_history
+
+DEFAULT_WINDOW = 5
+DEFAULT_THRESHOLD = 1.25
+SPARK_BARS = "▁▂▃▄▅▆▇█"
+# Points shown in a sparkline, most recent last
+SPARK_POINTS = 30
+
+
+@dataclass
+class ChangePoint:
+    """A run where a part's typical time moved."""
+
+    index: int
+    timestamp: str
+    before: float
+    after: float
+
+    @property
+    def ratio(self) -> float:
+        return self.after / self.before
+
+
+@dataclass
+class Trend:
+    """The timing history of one part in one language, in seconds."""
+
+    day: int
+    part: int
+    language: str
+    timestamps: list[str]
+    seconds: list[float]
+    rolling: list[float]
+    changes: list[ChangePoint]
+
+    @property
+    def best(self) -> float:
+        return min(self.seconds)
+
+    @property
+    def best_timestamp(self) -> str:
+        return self.timestamps[self.seconds.index(self.best)]
+
+    @property
+    def latest(self) -> float:
+        return self.seconds[-1]
+
+    def lost_ground(self, threshold: float) -> bool:
+        """Whether the typical time is now well above the best."""
+        return self.rolling[-1] > self.best * threshold
+
+
+def rolling_median(values: list[float], window: int) -> list[float]:
+    """Median of each value and up to `window - 1` values before it."""
+    return [
+        statistics.median(values[max(i - window + 1, 0) : i + 1])
+        for i in range(len(values))
+    ]
+
+
+def change_points(
+    timestamps: list[str], values: list[float], window: int, threshold: float
+) -> list[ChangePoint]:
+    """Find the runs where the typical time shifted by over `threshold`.
+
+    Each run is scored by the ratio of the median of the `window` runs
+    from it onwards to the median of the `window` runs before it. Runs
+    scoring past the threshold (either way) are change points, keeping
+    only the strongest of any that are within a window of each other.
+    The medians shift at several neighbouring runs, so ties are broken
+    by the ratio of the means, which peaks where the shift happened.
+    """
+    candidates = []
+    for i in range(window, len(values) - window + 1):
+        before = statistics.median(values[i - window : i])
+        after = statistics.median(values[i : i + window])
+        if before > 0 and after > 0:
+            score = abs(math.log(after / before))
+            if score > math.log(threshold):
+                means = statistics.fmean(values[i : i + window]) / (
+                    statistics.fmean(values[i - window : i])
+                )
+                tiebreak = abs(math.log(means))
+                candidates.append((score, tiebreak, i, before, after))
+
+    chosen: list[ChangePoint] = []
+    for _, _, i, before, after in sorted(candidates, reverse=True):
+        if all(abs(i - point.index) >= window for point in chosen):
+            chosen.append(ChangePoint(i, timestamps[i], before, after))
+    return sorted(chosen, key=lambda point: point.index)
+
+
+def sparkline(values: list[float], points: int = SPARK_POINTS) -> str:
+    """Draw the last `points` values as a line of block characters.
+
+    Taller bars are slower runs. Fewer than two values draw nothing.
+    """
+    recent = values[-points:]
+    if len(recent) < 2:
+        return ""
+    low, high = min(recent), max(recent)
+    if high == low:
+        return SPARK_BARS[0] * len(recent)
+    top = len(SPARK_BARS) - 1
+    return "".join(
+        SPARK_BARS[round((value - low) / (high - low) * top)]
+        for value in recent
+    )
+
+
+def trends(
+    days: list[int] | None, language: str | None, window: int, threshold: float
+) -> list[Trend]:
+    """Build the trend of every part with a timing history."""
+    results = []
+    history = timing_history(days, language)
+    for (day, part, lang), rows in sorted(history.items()):
+        timestamps = [timestamp for timestamp, _ in rows]
+        seconds = [value for _, value in rows]
+        results.append(
+            Trend(
+                day,
+                part,
+                lang,
+                timestamps,
+                seconds,
+                rolling_median(seconds, window),
+                change_points(timestamps, seconds, window, threshold),
+            )
+        )
+    return results
+
+
+def part_name(part: int) -> str:
+    return "parse" if part == PARSE_PART else f"part {part}"
+
+
+def format_trend(trend: Trend, window: int, threshold: float) -> str:
+    lines = [
+        f"Day {trend.day:02d} {part_name(trend.part)} ({trend.language}):"
+        f" {len(trend.seconds)} run(s)",
+        f"  best {trend.best:.6f} ({trend.best_timestamp[:10]})"
+        f"  latest {trend.latest:.6f}"
+        f"  median({window}) {trend.rolling[-1]:.6f}"
+        f"  {sparkline(trend.seconds)}",
+    ]
+    lines.extend(
+        f"  change {point.timestamp[:10]}: {point.before:.6f} ->"
+        f" {point.after:.6f} ({point.ratio:.2f}x)"
+        for point in trend.changes
+    )
+    if trend.lost_ground(threshold):
+        ratio = trend.rolling[-1] / trend.best
+        lines.append(f"  ! typical time is {ratio:.2f}x the best")
+    return "\n".join(lines)
+
+
+def svg_sparkline(
+    values: list[float], width: int = 240, height: int = 40
+) -> str:
+    """Draw a history as an inline SVG line, slower runs higher."""
+    if len(values) < 2:
+        return ""
+    low, high = min(values), max(values)
+    spread = (high - low) or 1.0
+    step = width / (len(values) - 1)
+    points = " ".join(
+        f"{i * step:.1f},{height - (value - low) / spread * height:.1f}"
+        for i, value in enumerate(values)
+    )
+    return (
+        f'<svg width="{width}" height="{height}" viewBox="-2 -2 '
+        f'{width + 4} {height + 4}"><polyline fill="none" stroke="#36c" '
+        f'stroke-width="1.5" points="{points}"/></svg>'
+    )
+
+
+def render_html(items: list[Trend], window: int, threshold: float) -> str:
+    """Render the trends as a standalone HTML page."""
+    rows = []
+    for trend in items:
+        changes = "<br>".join(
+            f"{html.escape(point.timestamp[:10])}: {point.ratio:.2f}x"
+            for point in trend.changes
+        )
+        flag = ' class="lost"' if trend.lost_ground(threshold) else ""
+        rows.append(
+            f"<tr{flag}><td>{trend.day:02d}</td>"
+            f"<td>{part_name(trend.part)}</td>"
+            f"<td>{html.escape(trend.language)}</td>"
+            f"<td>{len(trend.seconds)}</td>"
+            f"<td>{trend.best:.6f}</td><td>{trend.latest:.6f}</td>"
+            f"<td>{trend.rolling[-1]:.6f}</td>"
+            f"<td>{svg_sparkline(trend.seconds)}</td><td>{changes}</td></tr>"
+        )
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Advent of Code 2025 timing trends</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border-bottom: 1px solid #ddd; padding: 4px 8px; text-align: left; }}
+tr.lost td {{ background: #fee; }}
+</style>
+</head>
+<body>
+<h1>Advent of Code 2025 timing trends</h1>
+<p>Times in seconds. Rolling median over {window} runs; change points
+shift the median by more than {threshold:g}x. Highlighted rows are more
+than {threshold:g}x slower than their best.</p>
+<table>
+<tr><th>Day</th><th>Part</th><th>Language</th><th>Runs</th><th>Best</th>
+<th>Latest</th><th>Median</th><th>History</th><th>Changes</th></tr>
+{chr(10).join(rows)}
+</table>
+</body>
+</html>
+"""
+
+
+@click.command()
+@click.option(
+    "--day",
+    "days",
+    type=int,
+    multiple=True,
+    help="Day to report; repeat for several (default: all)",
+)
+@click.option(
+    "--language",
+    default=None,
+    help="Only report this language (default: all)",
+)
+@click.option(
+    "--window",
+    type=int,
+    default=None,
+    help=f"Runs in each rolling median [default: {DEFAULT_WINDOW}]",
+)
+@click.option(
+    "--threshold",
+    type=float,
+    default=None,
+    help="Ratio between medians that counts as a change "
+    f"[default: {DEFAULT_THRESHOLD}]",
+)
+@click.option(
+    "--html",
+    "html_path",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Write an HTML report here instead of printing text",
+)
+def main(
+    days: tuple[int, ...],
+    language: str | None,
+    window: int | None,
+    threshold: float | None,
+    html_path: Path | None,
+) -> None:
+    """Report the timing history of Advent of Code 2025 solutions."""
+    settings = config.section("trends")
+    if window is None:
+        window = settings.get("window", DEFAULT_WINDOW)
+    if threshold is None:
+        threshold = settings.get("threshold", DEFAULT_THRESHOLD)
+    items = trends(list(days) or None, language, window, threshold)
+    if html_path:
+        html_path.write_text(render_html(items, window, threshold))
+        print(f"Wrote {html_path}")
+        return
+    for trend in items:
+        print(format_trend(trend, window, threshold))
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,18 @@ struct Cli {
     /// Which part to solve (1, 2, or both)
     #[arg(short, long, default_value = "both")]
     part: String,
+
+    /// Untimed runs of each part before it is timed
+    #[arg(long, default_value_t = 0)]
+    warmup: u32,
+
+    /// Timed runs of each part; the median is reported
+    #[arg(long, default_value_t = 1)]
+    repeat: u32,
+
+    /// Print each part's answer and timed runs as JSON, saving nothing
+    #[arg(long)]
+    json: bool,
 }
 
 fn main() -> Result<()> {
@@ -28,52 +40,66 @@ fn main() -> Result<()> {
     let lines = input::load_lines(cli.day, cli.test)?;
 
     match cli.day {
-        1 => run_day(
-            &lines,
-            cli.day,
-            &cli.part,
-            cli.test,
-            day01::solve_part1,
-            day01::solve_part2,
-        )?,
+        1 => run_day(&lines, &cli, day01::solve_part1, day01::solve_part2)?,
         _ => println!("Day {} not implemented yet", cli.day),
     }
 
     Ok(())
 }
 
-fn run_day<F1, F2>(
-    lines: &[String],
-    day: u8,
-    part: &str,
-    test: bool,
-    solve1: F1,
-    solve2: F2,
-) -> Result<()>
+fn run_day<F1, F2>(lines: &[String], cli: &Cli, solve1: F1, solve2: F2) -> Result<()>
 where
     F1: Fn(&[String]) -> Result<i64>,
     F2: Fn(&[String]) -> Result<i64>,
 {
-    if part == "1" || part == "both" {
-        let start = Instant::now();
-        let answer = solve1(lines)?;
-        let elapsed = start.elapsed();
-        println!("Part 1: {} ({:.3}s)", answer, elapsed.as_secs_f64());
-        input::save_answer(day, 1, answer, test)?;
-        if !test {
-            input::save_timing(day, 1, elapsed)?;
-        }
+    if cli.part == "1" || cli.part == "both" {
+        run_part(lines, cli, 1, solve1)?;
+    }
+
+    if cli.part == "2" || cli.part == "both" {
+        run_part(lines, cli, 2, solve2)?;
     }
 
-    if part == "2" || part == "both" {
+    Ok(())
+}
+
+fn run_part<F>(lines: &[String], cli: &Cli, part: u8, solve: F) -> Result<()>
+where
+    F: Fn(&[String]) -> Result<i64>,
+{
+    for _ in 0..cli.warmup {
+        solve(lines)?;
+    }
+
+    let mut answer = 0;
+    let mut samples = Vec::new();
+    for _ in 0..cli.repeat.max(1) {
         let start = Instant::now();
-        let answer = solve2(lines)?;
-        let elapsed = start.elapsed();
-        println!("Part 2: {} ({:.3}s)", answer, elapsed.as_secs_f64());
-        input::save_answer(day, 2, answer, test)?;
-        if !test {
-            input::save_timing(day, 2, elapsed)?;
-        }
+        answer = solve(lines)?;
+        samples.push(start.elapsed());
+    }
+
+    if cli.json {
+        // One line per part, read by `python -m aoc2025.compare`
+        let seconds: Vec<String> = samples
+            .iter()
+            .map(|sample| format!("{:.9}", sample.as_secs_f64()))
+            .collect();
+        println!(
+            "{{\"part\": {}, \"answer\": \"{}\", \"samples\": [{}]}}",
+            part,
+            answer,
+            seconds.join(", ")
+        );
+        return Ok(());
+    }
+
+    samples.sort();
+    let elapsed = samples[samples.len() / 2];
+    println!("Part {}: {} ({:.3}s)", part, answer, elapsed.as_secs_f64());
+    input::save_answer(cli.day, part, answer, cli.test)?;
+    if !cli.test {
+        input::save_timing(cli.day, part, elapsed)?;
     }
 
     Ok(())
@@ -0,0 +1,103 @@
+"""Check polygon rasterising and compressed-grid queries by brute force.
+
+Every tile of a small polygon is tested for being inside it, and every
+rectangle query is answered again by looking at each tile it covers.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from aoc2025.compress import Axis, CompressedGrid
+from aoc2025.gen import day09 as gen_day09
+from aoc2025.grid import polygon_mask
+
+EXTENT = 20
+
+
+def polygon(seed: int) -> list[tuple[int, int]]:
+    """Make a small rectilinear polygon as (row, column) corners.
+
+    The generator makes skylines, so some are turned on their side or
+    have their winding reversed.
+    """
+    rng = random.Random(seed)
+    lines = gen_day09.generate(rng.randrange(4, 12), rng, extent=EXTENT)
+    corners = [tuple(map(int, line.split(","))) for line in lines.split()]
+    for _ in range(seed % 4):
+        corners = [(col, EXTENT - row) for row, col in corners]
+    if seed % 8 >= 4:
+        corners.reverse()
+    return corners
+
+
+def inside(point: tuple[int, int], corners: list[tuple[int, int]]) -> bool:
+    """Whether a tile is inside or on the edge of a rectilinear polygon."""
+    row, col = point
+    crossings = 0
+    edges = zip(corners, corners[1:] + corners[:1], strict=True)
+    for (r1, c1), (r2, c2) in edges:
+        on_rows = min(r1, r2) <= row <= max(r1, r2)
+        if on_rows and min(c1, c2) <= col <= max(c1, c2):
+            return True
+        # Count the vertical edges to the left, half-open in rows
+        if c1 == c2 and c1 < col and min(r1, r2) <= row < max(r1, r2):
+            crossings += 1
+    return crossings % 2 == 1
+
+
+@pytest.mark.parametrize("seed", range(24))
+def test_polygon_mask(seed: int) -> None:
+    corners = polygon(seed)
+    shape = (EXTENT + 2, EXTENT + 2)
+    expected = np.array(
+        [
+            [inside((row, col), corners) for col in range(shape[1])]
+            for row in range(shape[0])
+        ]
+    )
+    assert np.array_equal(polygon_mask(shape, corners), expected)
+
+
+def test_polygon_mask_needs_straight_edges() -> None:
+    with pytest.raises(ValueError):
+        polygon_mask((4, 4), [(0, 0), (2, 2), (0, 2)])
+
+
+def test_axis() -> None:
+    axis = Axis([10, 3, 7, 3])
+    # Cells for 3, 4-6, 7, 8-9 and 10
+    assert len(axis) == 5
+    assert axis.sizes.tolist() == [1, 3, 1, 2, 1]
+    coords = [2, 3, 4, 6, 7, 9, 10, 11]
+    assert axis.index(coords).tolist() == [-1, 0, 1, 1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize("seed", range(24))
+def test_rectangle_queries(seed: int) -> None:
+    corners = polygon(seed)
+    grid = CompressedGrid.from_points(corners)
+    grid.cells[:] = polygon_mask(grid.shape, grid.index(corners).tolist())
+
+    # Any rectangle of tiles in range, not only those between corners
+    rng = np.random.default_rng(seed)
+    rows = np.sort(rng.integers(0, EXTENT + 1, size=(200, 2)), axis=1)
+    cols = np.sort(rng.integers(0, EXTENT + 1, size=(200, 2)), axis=1)
+    top, bottom = rows.T
+    left, right = cols.T
+    low = grid.index(np.stack([top, left], axis=1))
+    high = grid.index(np.stack([bottom, right], axis=1))
+    in_range = (low >= 0).all(axis=1) & (high < grid.shape).all(axis=1)
+    low, high = low[in_range], high[in_range]
+
+    counts = grid.count(low[:, 0], low[:, 1], high[:, 0], high[:, 1])
+    filled = grid.filled(low[:, 0], low[:, 1], high[:, 0], high[:, 1])
+    rectangles = np.stack([top, left, bottom, right], axis=1)[in_range]
+    for i, (r1, c1, r2, c2) in enumerate(rectangles.tolist()):
+        cells = grid.cells[
+            low[i, 0] : high[i, 0] + 1, low[i, 1] : high[i, 1] + 1
+        ]
+        assert counts[i] == cells.sum()
+        tiles = [(r, c) for r in range(r1, r2 + 1) for c in range(c1, c2 + 1)]
+        assert filled[i] == all(inside(tile, corners) for tile in tiles)
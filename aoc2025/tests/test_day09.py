@@ -0,0 +1,82 @@
+"""Check day 9 part 2 against a brute force over every tile.
+
+The compressed grid must keep a cell for each gap between neighbouring
+coordinates: without them, a rectangle whose edge crosses a notch in a
+concave polygon looked enclosed, and part 2 answered too high.
+"""
+
+import random
+from itertools import combinations
+
+import pytest
+
+from aoc2025 import day09
+from aoc2025.gen import day09 as gen_day09
+
+# A base with a notch cut into its top, two steps deep
+NOTCHED = [
+    (1, 0),
+    (1, 16),
+    (8, 16),
+    (8, 13),
+    (13, 13),
+    (13, 10),
+    (16, 10),
+    (16, 16),
+    (24, 16),
+    (24, 0),
+]
+
+
+def tiles(corners: list[tuple[int, int]]) -> set[tuple[int, int]]:
+    """Find every tile inside or on the edge of the polygon."""
+    xs, ys = zip(*corners, strict=True)
+    edges = list(zip(corners, corners[1:] + corners[:1], strict=True))
+    inside = set()
+    for x in range(min(xs), max(xs) + 1):
+        for y in range(min(ys), max(ys) + 1):
+            on_edge, crossings = False, 0
+            for (x1, y1), (x2, y2) in edges:
+                if min(x1, x2) <= x <= max(x1, x2) and (
+                    min(y1, y2) <= y <= max(y1, y2)
+                ):
+                    on_edge = True
+                if x1 == x2 and x1 < x and min(y1, y2) <= y < max(y1, y2):
+                    crossings += 1
+            if on_edge or crossings % 2:
+                inside.add((x, y))
+    return inside
+
+
+def brute_force(corners: list[tuple[int, int]]) -> int:
+    inside = tiles(corners)
+    return max(
+        day09.calculate_area(first, second)
+        for first, second in combinations(corners, 2)
+        if all(
+            (x, y) in inside
+            for x in range(
+                min(first[0], second[0]), max(first[0], second[0]) + 1
+            )
+            for y in range(
+                min(first[1], second[1]), max(first[1], second[1]) + 1
+            )
+        )
+    )
+
+
+def test_notched_polygon() -> None:
+    assert day09.solve_part2(NOTCHED) == brute_force(NOTCHED) == 182
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_synthetic_polygons(seed: int) -> None:
+    rng = random.Random(seed)
+    lines = gen_day09.generate(rng.randrange(4, 16), rng, extent=25)
+    corners = day09.parse(lines.splitlines())
+    # Turn some of the skylines on their side, or reverse their winding
+    for _ in range(seed % 4):
+        corners = [(y, 30 - x) for x, y in corners]
+    if seed % 8 >= 4:
+        corners.reverse()
+    assert day09.solve_part2(corners) == brute_force(corners)
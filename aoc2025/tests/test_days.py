@@ -0,0 +1,92 @@
+"""Check every day's example answers and runtime budgets.
+
+A test is generated for each part of each dayNN module. Example answers
+are checked against data/examples/answers.toml, and parts without an
+expected answer (or days without an example) are skipped. Parts with a
+budget in [tool.aoc2025.perfcheck.budgets] are timed on the real input
+and fail if their median time is over it; those tests are marked
+`perf`, so `pytest -m "not perf"` leaves them out.
+"""
+
+import statistics
+import tomllib
+from functools import cache
+from typing import Any
+
+import pytest
+
+from aoc2025 import config, locations
+from aoc2025.bench import DEFAULT_WARMUP, measure
+from aoc2025.harness import (
+    PARSE_PART,
+    PARTS,
+    discover_days,
+    load_day,
+    solver_call,
+)
+from aoc2025.utils import input_path, load_lines
+
+DEFAULT_REPEAT = 5
+STAGES = [(day, part) for day in discover_days() for part in PARTS]
+
+
+def stage_id(stage: tuple[int, int]) -> str:
+    day, part = stage
+    return f"day{day:02d}-" + ("parse" if part == PARSE_PART else f"part{part}")
+
+
+@cache
+def expected_answers() -> dict[str, dict[str, Any]]:
+    path = locations.EXAMPLE_ANSWERS
+    if not path.exists():
+        return {}
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+@cache
+def parsed(day: int, test: bool) -> Any:
+    """Parse a day's example or real input once for all its tests."""
+    module = load_day(day)
+    lines = load_lines(day, use_example=test)
+    parser = getattr(module, "parse", None)
+    return parser(lines) if parser else lines
+
+
+@pytest.mark.parametrize("stage", STAGES, ids=stage_id)
+def test_example_answer(stage: tuple[int, int]) -> None:
+    day, part = stage
+    expected = expected_answers().get(f"day{day:02d}", {}).get(f"part{part}")
+    if expected is None:
+        pytest.skip("no expected answer")
+    if not input_path(day, use_example=True).exists():
+        pytest.skip("no example")
+    solver, args = solver_call(load_day(day), part, parsed(day, True), True)
+    assert str(solver(*args)) == str(expected)
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize(
+    "stage",
+    [(day, PARSE_PART) for day in discover_days()] + STAGES,
+    ids=stage_id,
+)
+def test_budget(stage: tuple[int, int]) -> None:
+    day, part = stage
+    budget = config.part_budget("perfcheck", day, part)
+    if budget is None:
+        pytest.skip("no budget")
+    if not input_path(day).exists():
+        pytest.skip("no input")
+    repeat = config.section("perfcheck").get("repeat", DEFAULT_REPEAT)
+    module = load_day(day)
+    if part == PARSE_PART:
+        parser = getattr(module, "parse", None)
+        if parser is None:
+            pytest.skip("no parser")
+        func, args = parser, [load_lines(day)]
+    else:
+        func, args = solver_call(module, part, parsed(day, False), False)
+    _, samples = measure(func, *args, warmup=DEFAULT_WARMUP, repeat=repeat)
+    median = statistics.median(sample.wall for sample in samples)
+    assert median <= budget, f"median {median:.6f}s is over {budget}s"
@@ -0,0 +1,215 @@
+"""Check the grid helpers and bitboards against naive loops over cells."""
+
+import random
+from collections import deque
+
+import numpy as np
+import pytest
+
+from aoc2025.grid import OFFSETS, BitGrid, Grid, flood_fill, label_regions
+
+
+def random_cells(seed: int, values: int = 2) -> np.ndarray:
+    """Make a small grid of random values, sometimes a single row or column."""
+    rng = random.Random(seed)
+    size = rng.randrange(2, 12), rng.randrange(2, 12)
+    rows, cols = rng.choice([(1, 9), (9, 1), size, size])
+    return np.array(
+        [[rng.randrange(values) for _ in range(cols)] for _ in range(rows)],
+        dtype=np.uint8,
+    )
+
+
+def naive_counts(
+    cells: np.ndarray, connectivity: int, fill: int, value: int | None
+) -> np.ndarray:
+    rows, cols = cells.shape
+    counts = np.zeros(cells.shape, dtype=np.int64)
+    for row in range(rows):
+        for col in range(cols):
+            for d_row, d_col in OFFSETS[connectivity]:
+                r, c = row + d_row, col + d_col
+                inside = 0 <= r < rows and 0 <= c < cols
+                neighbour = int(cells[r, c]) if inside else fill
+                if value is None:
+                    counts[row, col] += neighbour
+                else:
+                    counts[row, col] += neighbour == value
+    return counts
+
+
+def naive_regions(
+    mask: np.ndarray, connectivity: int
+) -> tuple[np.ndarray, int]:
+    """Label regions by a breadth-first search from each cell in turn."""
+    rows, cols = mask.shape
+    labels = np.zeros(mask.shape, dtype=np.int32)
+    count = 0
+    for start in np.ndindex(mask.shape):
+        if not mask[start] or labels[start]:
+            continue
+        count += 1
+        labels[start] = count
+        queue = deque([start])
+        while queue:
+            row, col = queue.popleft()
+            for d_row, d_col in OFFSETS[connectivity]:
+                r, c = row + d_row, col + d_col
+                if 0 <= r < rows and 0 <= c < cols:
+                    if mask[r, c] and not labels[r, c]:
+                        labels[r, c] = count
+                        queue.append((r, c))
+    return labels, count
+
+
+def test_from_lines() -> None:
+    grid = Grid.from_lines(["@.x", ".@@"], {"@": 1, "x": 2}, fill=3)
+    assert grid.cells.tolist() == [[1, 0, 2], [0, 1, 1]]
+    assert grid.shape == (2, 3)
+    assert grid.fill == 3
+    with pytest.raises(ValueError):
+        Grid.from_lines(["@.", "@"], {"@": 1})
+
+
+@pytest.mark.parametrize("fill", [0, 1])
+@pytest.mark.parametrize("connectivity", [4, 8])
+@pytest.mark.parametrize("seed", range(12))
+def test_neighbour_counts(seed: int, connectivity: int, fill: int) -> None:
+    cells = random_cells(seed, values=4)
+    grid = Grid(cells, fill)
+    assert np.array_equal(
+        grid.neighbour_counts(connectivity),
+        naive_counts(cells, connectivity, fill, None),
+    )
+    assert np.array_equal(
+        grid.neighbour_counts(connectivity, value=1),
+        naive_counts(cells, connectivity, fill, 1),
+    )
+
+
+def test_neighbour_counts_do_not_wrap() -> None:
+    # A cell on the left edge must not count for the end of the row above
+    grid = Grid(np.zeros((3, 4), dtype=np.uint8))
+    grid[1, 0] = 1
+    counts = grid.neighbour_counts(8)
+    assert counts[:, -1].tolist() == [0, 0, 0]
+    assert counts[:, 1].tolist() == [1, 1, 1]
+    assert counts[:, 0].tolist() == [1, 0, 1]
+
+
+def test_diagonals_only_count_with_eight() -> None:
+    grid = Grid(np.eye(3, dtype=np.uint8))
+    assert grid.neighbour_counts(4)[1, 1] == 0
+    assert grid.neighbour_counts(8)[1, 1] == 2
+    with pytest.raises(ValueError):
+        grid.neighbour_counts(6)
+
+
+def test_shifted_fills_past_the_edge() -> None:
+    grid = Grid(np.arange(6, dtype=np.uint8).reshape(2, 3), fill=9)
+    assert grid.shifted(0, 1).tolist() == [[1, 2, 9], [4, 5, 9]]
+    assert grid.shifted(-1, -1).tolist() == [[9, 9, 9], [9, 0, 1]]
+
+
+def test_where() -> None:
+    grid = Grid(np.array([[1, 0], [1, 1]], dtype=np.uint8))
+    assert grid.where(grid.cells == 1, 2) == 3
+    assert grid.cells.tolist() == [[2, 0], [2, 2]]
+    assert grid.count(2) == 3
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_flood_fill(seed: int) -> None:
+    cells = random_cells(seed)
+    start = divmod(random.Random(seed).randrange(cells.size), cells.shape[1])
+    labels, _ = naive_regions(cells == cells[start], connectivity=4)
+    expected = np.where(labels == labels[start], 5, cells)
+    assert flood_fill(cells, start, 5) == np.count_nonzero(expected == 5)
+    assert np.array_equal(cells, expected)
+    # Filling a region with its own value changes nothing
+    assert flood_fill(cells, start, 5) == 0
+
+
+@pytest.mark.parametrize("connectivity", [4, 8])
+@pytest.mark.parametrize("seed", range(20))
+def test_label_regions(seed: int, connectivity: int) -> None:
+    mask = random_cells(seed).astype(bool)
+    labels, count = label_regions(mask, connectivity)
+    expected, expected_count = naive_regions(mask, connectivity)
+    assert count == expected_count
+    assert np.array_equal(labels, expected)
+
+
+def test_label_regions_of_an_empty_mask() -> None:
+    labels, count = label_regions(np.zeros((3, 4), dtype=bool))
+    assert count == 0
+    assert not labels.any()
+
+
+def random_board(seed: int) -> Grid:
+    """Make a random board whose width is not a multiple of 64."""
+    rng = random.Random(seed)
+    cols = rng.choice([1, 7, 63, 65, 100, 129])
+    rows = rng.randrange(1, 9)
+    cells = np.array(
+        [[rng.random() < 0.6 for _ in range(cols)] for _ in range(rows)],
+        dtype=np.uint8,
+    )
+    return Grid(cells)
+
+
+def unpack(board: BitGrid, bits: int) -> np.ndarray:
+    return board.with_bits(bits).to_array()
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_bit_grid_round_trip(seed: int) -> None:
+    grid = random_board(seed)
+    board = BitGrid.from_grid(grid)
+    assert np.array_equal(board.to_array(), grid.cells == 1)
+    assert board.count() == grid.count(1)
+    # The spare bit after each row is never on
+    assert board.bits & ~board.mask == 0
+    assert board.mask.bit_count() == grid.rows * grid.cols
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_bit_grid_masks(seed: int) -> None:
+    board = BitGrid.from_grid(random_board(seed))
+    row, col = seed % board.rows, seed % board.cols
+    expected = np.zeros((board.rows, board.cols), dtype=bool)
+    expected[row] = True
+    assert np.array_equal(unpack(board, board.row_mask(row)), expected)
+    expected[:] = False
+    expected[:, col] = True
+    assert np.array_equal(unpack(board, board.col_mask(col)), expected)
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_bit_grid_shifted(seed: int) -> None:
+    grid = random_board(seed)
+    board = BitGrid.from_grid(grid)
+    for d_row, d_col in OFFSETS[8]:
+        shifted = board.shifted(d_row, d_col)
+        assert shifted & ~board.mask == 0
+        assert np.array_equal(
+            unpack(board, shifted), grid.shifted(d_row, d_col) == 1
+        )
+
+
+@pytest.mark.parametrize("connectivity", [4, 8])
+@pytest.mark.parametrize("seed", range(12))
+def test_bit_grid_neighbour_counts(seed: int, connectivity: int) -> None:
+    grid = random_board(seed)
+    board = BitGrid.from_grid(grid)
+    slices = board.neighbour_counts(connectivity)
+    counts = sum(
+        unpack(board, s).astype(int) << i for i, s in enumerate(slices)
+    )
+    expected = naive_counts(grid.cells, connectivity, 0, None)
+    assert np.array_equal(counts, expected)
+    for threshold in range(connectivity + 2):
+        assert np.array_equal(
+            unpack(board, board.at_least(slices, threshold)),
+            expected >= threshold,
+        )
@@ -0,0 +1,52 @@
+"""Check the input loaders, and the timings saved through `utils`."""
+
+from pathlib import Path
+
+import pytest
+
+from aoc2025 import locations, utils
+from aoc2025.generate_readme import get_all_timings
+from aoc2025.timings import latest_samples
+
+TEXTS = [
+    "",
+    "\n\n",
+    "one line",
+    "  first\nsecond\r\nthird  \n\n",
+    "\n".join(f"line {i}" for i in range(100)) + "\n",
+    "a much longer line than fits in one chunk\nshort\n",
+]
+
+
+@pytest.fixture
+def inputs_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(locations, "INPUTS_DIR", tmp_path)
+    return tmp_path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, utils.CHUNK_SIZE])
+@pytest.mark.parametrize("text", TEXTS)
+def test_iter_lines_matches_load_lines(
+    inputs_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    text: str,
+    chunk_size: int,
+) -> None:
+    (inputs_dir / "day01.txt").write_text(text, newline="")
+    monkeypatch.setattr(utils, "CHUNK_SIZE", chunk_size)
+    expected = utils.load_lines(1)
+    assert list(utils.iter_lines(1)) == expected
+    # InputLines streams them again on every pass
+    lines = utils.InputLines(1)
+    assert list(lines) == list(lines) == expected
+
+
+def test_saved_timings_reach_the_store(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for name in ("TIMINGS_DB", "TIMINGS_FILE", "BENCHMARKS_FILE"):
+        monkeypatch.setattr(locations, name, tmp_path / name.lower())
+    utils.save_timing(1, 1, 0.125)
+    utils.save_samples(1, 2, [(0.25, 0.2), (0.75, 0.7)], warmup=1)
+    assert get_all_timings() == {(1, 1, "python"): 0.125}
+    assert latest_samples(1, 2) == [(0.25, 0.2), (0.75, 0.7)]
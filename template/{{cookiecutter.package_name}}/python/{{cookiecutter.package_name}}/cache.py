@@ -0,0 +1,169 @@
+"""A cache of answers, keyed on everything that can change them.
+
+A day's key is a SHA-256 hash of its input bytes, the source of the day
+module and of every {{ cookiecutter.package_name }} module it imports (directly or through
+other modules), the Python version, and the versions of the project's
+dependencies. Any change to one of those gives a new key, so a cached
+answer is never stale. Touching or checking out a file changes nothing.
+
+The harness is not followed when collecting imports, because it only
+runs a day and cannot change its answers. Each entry is a small JSON
+file in data/cache named after its key.
+"""
+
+import ast
+import hashlib
+import importlib.metadata
+import importlib.util
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any
+
+from {{ cookiecutter.package_name }} import locations
+from {{ cookiecutter.package_name }}.utils import input_path
+
+PACKAGE = "{{ cookiecutter.package_name }}"
+# Modules that run days rather than solve them
+RUNNER_MODULES = frozenset({f"{PACKAGE}.harness"})
+REQUIREMENT_NAME = re.compile(r"^[A-Za-z0-9._-]+")
+
+
+def module_path(name: str) -> Path | None:
+    """Find the source file of a module in the package, if it has one."""
+    try:
+        spec = importlib.util.find_spec(name)
+    except ModuleNotFoundError:
+        return None
+    if spec is None or spec.origin is None:
+        return None
+    return Path(spec.origin)
+
+
+def imported_modules(source: str) -> set[str]:
+    """Find the package modules imported anywhere in some source code.
+
+    Imports inside functions count too, since some days defer theirs.
+    """
+    names = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.add(node.module)
+            # `from {{ cookiecutter.package_name }} import grid` imports a module, not a name
+            names.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return {
+        name
+        for name in names
+        if name.split(".")[0] == PACKAGE and module_path(name) is not None
+    }
+
+
+def module_sources(name: str) -> dict[str, bytes]:
+    """Collect the source of a module and everything it imports from the
+    package, skipping the runner modules.
+
+    Returns:
+        Source bytes keyed by module name
+    """
+    sources: dict[str, bytes] = {}
+    pending = [name]
+    while pending:
+        current = pending.pop()
+        if current in sources or current in RUNNER_MODULES:
+            continue
+        path = module_path(current)
+        if path is None:
+            continue
+        sources[current] = path.read_bytes()
+        pending.extend(imported_modules(sources[current].decode()))
+    return sources
+
+
+def dependency_versions() -> list[str]:
+    """List the installed version of each of the project's dependencies."""
+    try:
+        requirements = importlib.metadata.requires(PACKAGE) or []
+    except importlib.metadata.PackageNotFoundError:
+        return []
+    versions = []
+    for requirement in requirements:
+        if match := REQUIREMENT_NAME.match(requirement):
+            name = match.group()
+            try:
+                version = importlib.metadata.version(name)
+            except importlib.metadata.PackageNotFoundError:
+                version = "missing"
+            versions.append(f"{name}=={version}")
+    return sorted(versions)
+
+
+def answer_key(
+    day: int, test: bool = False, synthetic: str | None = None
+) -> str | None:
+    """Hash everything that a day's answers depend on.
+
+    Args:
+        day: Day number (1-25)
+        test: Whether the example data is used (which some solvers
+            also treat differently)
+        synthetic: Name of an input in data/synthetic to use instead
+
+    Returns:
+        The key as a hex digest, or None if the input does not exist
+    """
+    path = input_path(day, test, synthetic)
+    if not path.exists():
+        return None
+    digest = hashlib.sha256()
+
+    def add(label: str, content: bytes) -> None:
+        # Lengths keep the boundaries between parts unambiguous
+        digest.update(f"{label}:{len(content)}:".encode())
+        digest.update(content)
+
+    add("input", path.read_bytes())
+    add("test", str(test).encode())
+    sources = module_sources(f"{PACKAGE}.day{day:02d}")
+    for name in sorted(sources):
+        add(name, sources[name])
+    add("python", sys.version.encode())
+    add("dependencies", "\n".join(dependency_versions()).encode())
+    return digest.hexdigest()
+
+
+def entry_path(key: str) -> Path:
+    return locations.CACHE_DIR / f"{key}.json"
+
+
+def load_answers(key: str) -> dict[int, str]:
+    """Get the cached answers for a key, by part, if there are any."""
+    path = entry_path(key)
+    if not path.exists():
+        return {}
+    try:
+        answers = json.loads(path.read_text())["answers"]
+    except (ValueError, KeyError):
+        # A damaged entry is a miss, and is replaced on the next store
+        return {}
+    return {int(part): answer for part, answer in answers.items()}
+
+
+def store_answers(key: str, day: int, answers: dict[int, Any]) -> None:
+    """Add answers to the cache entry for a key.
+
+    Answers are stored as the text that `save_answer` writes, and any
+    already cached for other parts are kept.
+    """
+    merged = load_answers(key) | {
+        part: str(answer) for part, answer in answers.items()
+    }
+    path = entry_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    entry = {"day": day, "answers": {str(p): a for p, a in merged.items()}}
+    # Write then rename, so a concurrent reader never sees half an entry
+    partial = path.with_suffix(".tmp")
+    partial.write_text(json.dumps(entry, indent=2, sort_keys=True))
+    partial.replace(path)
@@ -0,0 +1,40 @@
+"""Settings from the [tool.{{ cookiecutter.package_name }}] table in pyproject.toml."""
+
+import tomllib
+from functools import cache
+from typing import Any
+
+from {{ cookiecutter.package_name }} import locations
+
+
+@cache
+def tool_config() -> dict[str, Any]:
+    """Load the [tool.{{ cookiecutter.package_name }}] table, or an empty dict if there is none."""
+    pyproject = locations.PROJECT_ROOT / "pyproject.toml"
+    if not pyproject.exists():
+        return {}
+    with open(pyproject, "rb") as f:
+        return tomllib.load(f).get("tool", {}).get("{{ cookiecutter.package_name }}", {})
+
+
+def section(name: str) -> dict[str, Any]:
+    """Get one sub-table of the tool config, e.g. "perfcheck"."""
+    return tool_config().get(name, {})
+
+
+def part_budget(
+    name: str, day: int, part: int, table: str = "budgets"
+) -> float | None:
+    """Look up a per-part budget from a section's `budgets` table.
+
+    Budgets are keyed by day and part, with `parse` for part 0:
+
+        [tool.{{ cookiecutter.package_name }}.perfcheck.budgets]
+        day04 = { parse = 0.01, part1 = 0.05, part2 = 1.0 }
+
+    Sections with more than one kind of budget keep the others in tables
+    named by `table`.
+    """
+    budgets = section(name).get(table, {})
+    key = "parse" if part == 0 else f"part{part}"
+    return budgets.get(f"day{day:02d}", {}).get(key)
@@ -0,0 +1,482 @@
+"""Shared machinery for running day modules in-process.
+
+A day module provides `parse(lines)`, which turns the input lines into
+whatever the solvers need, and `solve_part1`/`solve_part2`, which each
+take the parsed data. The input is parsed once per run and the result
+is shared by both parts (and by every repeat when benchmarking), so
+solvers must not modify it. Modules without `parse` are given the lines.
+A parser that reads its lines in one pass can set `STREAM_LINES = True`
+to have them streamed from the input file, rather than loaded as a list.
+
+Parse time is reported and stored as its own row, using part number 0.
+
+With `--memory` each stage is run once more under tracemalloc, and its
+traced peak and RSS high-water mark are stored with its timing. With
+`--profile` each part is run once more under a profiler, which writes
+its results to `data/profiles` (see `{{ cookiecutter.package_name }}.profiling`).
+
+With `--synthetic NAME` a day runs on `data/synthetic/dayNN_NAME.txt`
+instead, such as an input written by a generator. Nothing is saved from
+those runs, so they never replace real answers or timings.
+
+Each stage runs under the time and memory limits of `{{ cookiecutter.package_name }}.watchdog`,
+in a child process. A stage that overruns is reported (and stored) as
+TIMEOUT or OOM, and the run carries on with the next part or day; the
+parts of a day whose parse overran are not run. `--timeout` and
+`--max-memory` override the configured limits, and 0 turns one off.
+
+Plain runs look up their answers in the cache first (see
+`{{ cookiecutter.package_name }}.cache`) and only solve the day on a miss. `--no-cache` always
+solves it. Benchmarking, `--memory` and `--profile` never use the cache,
+as the point of those runs is to solve the day.
+"""
+
+import importlib
+import inspect
+import pkgutil
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+import click
+
+import {{ cookiecutter.package_name }}
+from {{ cookiecutter.package_name }}.bench import (
+    DEFAULT_REPEAT,
+    DEFAULT_WARMUP,
+    Memory,
+    Sample,
+    describe,
+    format_bytes,
+    measure,
+    measure_memory,
+)
+from {{ cookiecutter.package_name }}.profiling import DEFAULT_TOP, PROFILERS, profile
+from {{ cookiecutter.package_name }}.utils import InputLines, input_path, load_lines, save_answer
+
+# The answer cache, timings store and watchdog are imported where they
+# are used, as importing them would double the start up of every day
+if TYPE_CHECKING:
+    from {{ cookiecutter.package_name }}.watchdog import Limits, Overrun
+
+PARTS = (1, 2)
+PARSE_PART = 0
+# Options that ask for a day to be solved, so its answers are not cached
+UNCACHED_OPTIONS = ("bench", "memory", "profiler")
+DAY_MODULE_PATTERN = re.compile(r"^day(\d{2})$")
+
+
+@dataclass
+class PartResult:
+    """The outcome of solving a single part."""
+
+    part: int
+    answer: Any
+    samples: list[Sample]
+    warmup: int = 0
+    memory: Memory | None = None
+    profiles: list[Path] = field(default_factory=list)
+    # TIMEOUT or OOM if the stage overran its limits, leaving no answer
+    status: str | None = None
+
+    @property
+    def elapsed(self) -> float:
+        """Median wall-clock time across all samples."""
+        import statistics
+
+        return statistics.median(sample.wall for sample in self.samples)
+
+
+def discover_days() -> list[int]:
+    """Find the day number of every dayNN module in the package.
+
+    Returns:
+        Sorted list of day numbers
+    """
+    return sorted(
+        int(match.group(1))
+        for module in pkgutil.iter_modules({{ cookiecutter.package_name }}.__path__)
+        if (match := DAY_MODULE_PATTERN.match(module.name))
+    )
+
+
+def available_days(
+    use_example: bool = False, synthetic: str | None = None
+) -> list[int]:
+    """Find every day that has both a module and an input file."""
+    return [
+        day
+        for day in discover_days()
+        if input_path(day, use_example, synthetic).exists()
+    ]
+
+
+def load_day(day: int) -> ModuleType:
+    """Import the module for a given day."""
+    return importlib.import_module(f"{{ cookiecutter.package_name }}.day{day:02d}")
+
+
+def selected_parts(part: str) -> tuple[int, ...]:
+    """Convert a --part choice into the part numbers to run."""
+    return PARTS if part == "both" else (int(part),)
+
+
+def input_lines(
+    module: ModuleType,
+    day: int,
+    use_example: bool = False,
+    synthetic: str | None = None,
+) -> Iterable[str]:
+    """Load the input lines for a day's parser.
+
+    A day whose parser makes a single pass over its lines can set
+    `STREAM_LINES = True`, to be given them straight from a memory map
+    (see `{{ cookiecutter.package_name }}.utils.InputLines`) instead of as a list. Its parse
+    time then includes reading the input.
+    """
+    if getattr(module, "STREAM_LINES", False):
+        return InputLines(day, use_example, synthetic)
+    return load_lines(day, use_example, synthetic)
+
+
+def parse_input(
+    module: ModuleType,
+    lines: Iterable[str],
+    warmup: int = 0,
+    repeat: int = 1,
+    memory: bool = False,
+) -> tuple[Any, PartResult | None]:
+    """Time calls to a day's parser, and measure its memory if asked.
+
+    Returns:
+        The parsed data, and the parse timing if the module has a parser
+    """
+    parser = getattr(module, "parse", None)
+    if parser is None:
+        return lines, None
+    data, samples = measure(parser, lines, warmup=warmup, repeat=repeat)
+    usage = measure_memory(parser, lines)[1] if memory else None
+    return data, PartResult(PARSE_PART, None, samples, warmup, usage)
+
+
+def solver_call(
+    module: ModuleType, part: int, data: Any, test: bool
+) -> tuple[Callable[..., Any], list[Any]]:
+    """Find a part's solver and the arguments to call it with.
+
+    Solvers that take a `test` argument (e.g. day 8, which behaves
+    differently on the example) are passed the flag as well.
+    """
+    solver = getattr(module, f"solve_part{part}")
+    args = [data]
+    if "test" in inspect.signature(solver).parameters:
+        args.append(test)
+    return solver, args
+
+
+def solve_part(
+    module: ModuleType,
+    part: int,
+    data: Any,
+    test: bool,
+    warmup: int = 0,
+    repeat: int = 1,
+    memory: bool = False,
+) -> PartResult:
+    """Time calls to a day's solver, and measure its memory if asked."""
+    solver, args = solver_call(module, part, data, test)
+    answer, samples = measure(solver, *args, warmup=warmup, repeat=repeat)
+    usage = measure_memory(solver, *args)[1] if memory else None
+    return PartResult(part, answer, samples, warmup, usage)
+
+
+def overrun_result(part: int, overrun: "Overrun") -> PartResult:
+    """Record a stage that was stopped by the watchdog."""
+    sample = Sample(overrun.elapsed, overrun.elapsed)
+    return PartResult(part, None, [sample], status=overrun.status)
+
+
+def solve_day(
+    day: int,
+    part: str = "both",
+    test: bool = False,
+    bench: bool = False,
+    warmup: int = DEFAULT_WARMUP,
+    repeat: int = DEFAULT_REPEAT,
+    memory: bool = False,
+    profiler: str | None = None,
+    top: int = DEFAULT_TOP,
+    synthetic: str | None = None,
+    timeout: float | None = None,
+    max_memory: int | None = None,
+) -> list[PartResult]:
+    """Solve the selected parts of a day without saving anything.
+
+    This is safe to call from worker processes, leaving the caller to
+    report and save the results. Unless `bench` is set each part is
+    timed once with no warmup. Each stage runs within its watchdog
+    limits (see `{{ cookiecutter.package_name }}.watchdog`), with `timeout` (seconds per run)
+    and `max_memory` (MiB) overriding the configured ones.
+
+    Returns:
+        The parse result (if the day has a parser) then each part's result
+    """
+    from {{ cookiecutter.package_name }}.watchdog import Overrun, call_limited, stage_limits
+
+    if not bench:
+        warmup, repeat = 0, 1
+    module = load_day(day)
+    lines = input_lines(module, day, use_example=test, synthetic=synthetic)
+    runs = warmup + repeat + int(memory)
+
+    def limits(p: int) -> "Limits":
+        return stage_limits(day, p, timeout, max_memory).for_runs(
+            runs + bool(profiler and p != PARSE_PART)
+        )
+
+    def run_part(p: int) -> PartResult:
+        result = solve_part(module, p, data, test, warmup, repeat, memory)
+        if profiler:
+            solver, args = solver_call(module, p, data, test)
+            result.profiles = profile(profiler, day, p, solver, *args, top=top)
+        return result
+
+    try:
+        data, parsed = call_limited(
+            limits(PARSE_PART),
+            parse_input,
+            module,
+            lines,
+            warmup,
+            repeat,
+            memory,
+        )
+    except Overrun as e:
+        return [overrun_result(PARSE_PART, e)]
+    results = []
+    for p in selected_parts(part):
+        try:
+            results.append(call_limited(limits(p), run_part, p))
+        except Overrun as e:
+            results.append(overrun_result(p, e))
+    return [parsed, *results] if parsed else results
+
+
+def report(
+    day: int,
+    results: list[PartResult],
+    test: bool = False,
+    synthetic: str | None = None,
+) -> None:
+    """Print results and save answers and timings.
+
+    Benchmarked parts also have their full sample set saved, and the
+    median is recorded as the part's timing. All timings for the day
+    are written to the store in one transaction. Nothing is saved for
+    synthetic inputs.
+    """
+    from {{ cookiecutter.package_name }}.timings import record, sample_set, timing
+
+    timings = []
+    sample_sets = []
+    for result in results:
+        if len(result.samples) > 1:
+            summary = describe(result.samples)
+            sample_sets.append(
+                sample_set(day, result.part, result.samples, result.warmup)
+            )
+        else:
+            summary = f"{result.elapsed:.3f}s"
+        if result.status:
+            summary = f"{result.status} after {result.elapsed:.3f}s"
+            name = (
+                "Parse" if result.part == PARSE_PART else f"Part {result.part}"
+            )
+            print(f"{name}: {summary}")
+            timings.append(
+                timing(day, result.part, result.elapsed, status=result.status)
+            )
+            continue
+        peak_bytes = rss_bytes = None
+        if result.memory:
+            peak_bytes, rss_bytes = result.memory
+            summary += (
+                f", peak {format_bytes(peak_bytes)},"
+                f" rss {format_bytes(rss_bytes)}"
+            )
+        if result.part == PARSE_PART:
+            print(f"Parse: ({summary})")
+        else:
+            print(f"Part {result.part}: {result.answer} ({summary})")
+            if not synthetic:
+                save_answer(day, result.part, result.answer, use_example=test)
+        for path in result.profiles:
+            print(f"  Profile written to {path}")
+        timings.append(
+            timing(
+                day,
+                result.part,
+                result.elapsed,
+                peak_bytes=peak_bytes,
+                rss_bytes=rss_bytes,
+            )
+        )
+    if not test and not synthetic:
+        record(timings, sample_sets)
+
+
+def cache_key(day: int, cache: bool = True, **options: Any) -> str | None:
+    """Get the answer cache key for a run, or None if it is not cached."""
+    if not cache or any(options.get(name) for name in UNCACHED_OPTIONS):
+        return None
+    from {{ cookiecutter.package_name }}.cache import answer_key
+
+    return answer_key(day, options.get("test", False), options.get("synthetic"))
+
+
+def cached_answers(
+    key: str | None, part: str = "both"
+) -> dict[int, str] | None:
+    """Get the cached answers for a run, if every selected part has one."""
+    if key is None:
+        return None
+    from {{ cookiecutter.package_name }}.cache import load_answers
+
+    answers = load_answers(key)
+    parts = selected_parts(part)
+    if any(p not in answers for p in parts):
+        return None
+    return {p: answers[p] for p in parts}
+
+
+def report_cached(
+    day: int,
+    answers: dict[int, str],
+    test: bool = False,
+    synthetic: str | None = None,
+) -> None:
+    """Print and save cached answers, which have no timings to record."""
+    for part, answer in answers.items():
+        print(f"Part {part}: {answer} (cached)")
+        if not synthetic:
+            save_answer(day, part, answer, use_example=test)
+
+
+def cache_results(day: int, key: str | None, results: list[PartResult]) -> None:
+    """Store the answers from a run under its cache key."""
+    if key is not None:
+        from {{ cookiecutter.package_name }}.cache import store_answers
+
+        answers = {
+            r.part: r.answer
+            for r in results
+            if r.part != PARSE_PART and not r.status
+        }
+        store_answers(key, day, answers)
+
+
+def run_day(day: int, cache: bool = True, **options: Any) -> None:
+    """Solve, print and save the selected parts of a day.
+
+    Args:
+        day: Day number (1-25)
+        cache: If True, use cached answers where they are still valid
+        **options: Keyword arguments accepted by `solve_day`
+    """
+    test, synthetic = options.get("test", False), options.get("synthetic")
+    key = cache_key(day, cache, **options)
+    if answers := cached_answers(key, options.get("part", "both")):
+        report_cached(day, answers, test, synthetic)
+        return
+    results = solve_day(day, **options)
+    report(day, results, test, synthetic)
+    cache_results(day, key, results)
+
+
+DAY_OPTIONS = [
+    click.option("--test", is_flag=True, help="Run on example data"),
+    click.option(
+        "--part",
+        type=click.Choice(["1", "2", "both"]),
+        default="both",
+        help="Which part to solve",
+    ),
+    click.option(
+        "--bench",
+        is_flag=True,
+        help="Time repeated runs and report summary statistics",
+    ),
+    click.option(
+        "--warmup",
+        type=int,
+        default=DEFAULT_WARMUP,
+        show_default=True,
+        help="Untimed runs before sampling (with --bench)",
+    ),
+    click.option(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        show_default=True,
+        help="Timed runs per part (with --bench)",
+    ),
+    click.option(
+        "--memory",
+        is_flag=True,
+        help="Record peak traced memory and RSS for each part",
+    ),
+    click.option(
+        "--profile",
+        "profiler",
+        type=click.Choice(PROFILERS),
+        is_flag=False,
+        flag_value="cprofile",
+        default=None,
+        help="Profile each part with cProfile, or by sampling with "
+        "'--profile sample'",
+    ),
+    click.option(
+        "--top",
+        type=int,
+        default=DEFAULT_TOP,
+        show_default=True,
+        help="Functions listed in the cProfile summary (with --profile)",
+    ),
+    click.option(
+        "--synthetic",
+        metavar="NAME",
+        default=None,
+        help="Run on data/synthetic/dayNN_NAME.txt instead of the input",
+    ),
+    click.option(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Seconds each run of a stage may take before it is stopped "
+        "(default: from the config; 0 for no limit)",
+    ),
+    click.option(
+        "--max-memory",
+        type=int,
+        default=None,
+        metavar="MIB",
+        help="Address space each stage may use, in MiB "
+        "(default: from the config; 0 for no limit)",
+    ),
+    click.option(
+        "--cache/--no-cache",
+        default=True,
+        show_default=True,
+        help="Use cached answers when nothing they depend on has changed",
+    ),
+]
+
+
+def day_options[F](func: F) -> F:
+    """Add the options shared by every day's command line."""
+    for option in reversed(DAY_OPTIONS):
+        func = option(func)
+    return func
@@ -0,0 +1,230 @@
+"""Check for performance regressions against pinned baselines.
+
+Baselines are pinned from the timings history with `--pin`, which takes
+the median of each part's most recent timings. A check then benchmarks
+the selected days and flags any part that is slower than the baseline
+by more than the configured ratio or absolute threshold, or that is over
+its budget. Parts without a pinned baseline are compared with the median
+of their recent history instead.
+
+Defaults and per-part budgets are read from pyproject.toml:
+
+    [tool.{{ cookiecutter.package_name }}.perfcheck]
+    ratio = 1.5
+    threshold = 0.05
+
+    [tool.{{ cookiecutter.package_name }}.perfcheck.budgets]
+    day04 = { part1 = 0.05, part2 = 1.0 }
+"""
+
+import sys
+from dataclasses import dataclass
+
+import click
+
+from {{ cookiecutter.package_name }} import config
+from {{ cookiecutter.package_name }}.bench import DEFAULT_WARMUP
+from {{ cookiecutter.package_name }}.harness import PARSE_PART, PARTS, available_days, solve_day
+from {{ cookiecutter.package_name }}.timings import (
+    median_of_last,
+    pin_baselines,
+    pinned_baselines,
+    timing,
+)
+
+DEFAULT_RATIO = 1.5
+DEFAULT_REPEAT = 5
+DEFAULT_HISTORY = 5
+
+
+@dataclass
+class Check:
+    """The comparison of one part's timing against its baseline."""
+
+    day: int
+    part: int
+    current: float
+    baseline: float | None
+    pinned: bool
+    budget: float | None
+    failures: list[str]
+
+    @property
+    def ratio(self) -> float | None:
+        if not self.baseline:
+            return None
+        return self.current / self.baseline
+
+
+def compare(
+    day: int,
+    part: int,
+    current: float,
+    baseline: float | None,
+    pinned: bool,
+    ratio: float | None,
+    threshold: float | None,
+) -> Check:
+    """Compare a timing with its baseline and budget."""
+    budget = config.part_budget("perfcheck", day, part)
+    failures = []
+    if baseline is not None:
+        if ratio is not None and current > baseline * ratio:
+            failures.append(f"over {ratio:g}x baseline")
+        if threshold is not None and current - baseline > threshold:
+            failures.append(f"over baseline + {threshold:g}s")
+    if budget is not None and current > budget:
+        failures.append(f"over {budget:g}s budget")
+    return Check(day, part, current, baseline, pinned, budget, failures)
+
+
+def setting[T](value: T | None, key: str, default: T) -> T:
+    """Prefer a command-line value, then pyproject.toml, then the default."""
+    if value is not None:
+        return value
+    return config.section("perfcheck").get(key, default)
+
+
+def format_check(check: Check) -> str:
+    baseline = "-" if check.baseline is None else f"{check.baseline:.6f}"
+    if not check.pinned and check.baseline is not None:
+        baseline += "*"
+    ratio = "-" if check.ratio is None else f"{check.ratio:.2f}x"
+    budget = "-" if check.budget is None else f"{check.budget:g}"
+    status = "; ".join(check.failures) or "ok"
+    part = "parse" if check.part == PARSE_PART else check.part
+    return (
+        f"{check.day:>3}  {part:>5}  {baseline:>10}  "
+        f"{check.current:>10.6f}  {ratio:>7}  {budget:>7}  {status}"
+    )
+
+
+def pin_from_history(days: list[int], history: int) -> None:
+    """Pin the median of recent history as each part's baseline.
+
+    Parse time is pinned alongside the parts, as part number 0.
+    """
+    rows = []
+    for day in days:
+        for part in (PARSE_PART, *PARTS):
+            median = median_of_last(day, part, n=history)
+            if median is None:
+                continue
+            rows.append(timing(day, part, median))
+            label = "parse" if part == PARSE_PART else f"part {part}"
+            print(f"Pinned day {day:02d} {label}: {median:.6f}s")
+    pin_baselines(rows)
+
+
+def run_checks(
+    days: list[int],
+    ratio: float | None,
+    threshold: float | None,
+    warmup: int,
+    repeat: int,
+    history: int,
+) -> list[Check]:
+    """Benchmark the days and compare each part with its baseline."""
+    pinned = pinned_baselines()
+    checks = []
+    print("Day   Part    Baseline     Current    Ratio   Budget  Status")
+    for day in days:
+        results = solve_day(day, bench=True, warmup=warmup, repeat=repeat)
+        for result in results:
+            baseline = pinned.get((day, result.part, "python"))
+            is_pinned = baseline is not None
+            if not is_pinned:
+                baseline = median_of_last(day, result.part, n=history)
+            item = compare(
+                day,
+                result.part,
+                result.elapsed,
+                baseline,
+                is_pinned,
+                ratio,
+                threshold,
+            )
+            print(format_check(item))
+            checks.append(item)
+    return checks
+
+
+@click.command()
+@click.option(
+    "--day",
+    "days",
+    type=int,
+    multiple=True,
+    help="Day to check; repeat for several (default: all with input)",
+)
+@click.option(
+    "--ratio",
+    type=float,
+    default=None,
+    help=f"Slowdown ratio that counts as a regression [default: "
+    f"{DEFAULT_RATIO}]",
+)
+@click.option(
+    "--threshold",
+    type=float,
+    default=None,
+    help="Absolute slowdown in seconds that counts as a regression",
+)
+@click.option(
+    "--warmup",
+    type=int,
+    default=None,
+    help=f"Untimed runs before sampling [default: {DEFAULT_WARMUP}]",
+)
+@click.option(
+    "--repeat",
+    type=int,
+    default=None,
+    help=f"Timed runs per part [default: {DEFAULT_REPEAT}]",
+)
+@click.option(
+    "--history",
+    type=int,
+    default=DEFAULT_HISTORY,
+    show_default=True,
+    help="Recent timings used for a baseline",
+)
+@click.option(
+    "--pin",
+    is_flag=True,
+    help="Pin baselines from the timings history instead of checking",
+)
+def main(
+    days: tuple[int, ...],
+    ratio: float | None,
+    threshold: float | None,
+    warmup: int | None,
+    repeat: int | None,
+    history: int,
+    pin: bool,
+) -> None:
+    """Check Advent of Code {{ cookiecutter.year }} solutions for performance regressions."""
+    selected = list(days) or available_days()
+    if pin:
+        pin_from_history(selected, history)
+        return
+
+    checks = run_checks(
+        selected,
+        ratio=setting(ratio, "ratio", DEFAULT_RATIO),
+        threshold=setting(threshold, "threshold", None),
+        warmup=setting(warmup, "warmup", DEFAULT_WARMUP),
+        repeat=setting(repeat, "repeat", DEFAULT_REPEAT),
+        history=history,
+    )
+    if any(not c.pinned and c.baseline is not None for c in checks):
+        print("* no pinned baseline; compared with recent history")
+    regressions = [item for item in checks if item.failures]
+    if regressions:
+        print(f"{len(regressions)} part(s) regressed")
+        sys.exit(1)
+    print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
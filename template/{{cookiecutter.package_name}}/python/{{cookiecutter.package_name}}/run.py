@@ -0,0 +1,145 @@
+"""Run many days in a single interpreter.
+
+Each day is solved by calling its `solve_part1`/`solve_part2` directly
+rather than starting a new process per day. With `--jobs N` the days are
+fanned out over a pool, slowest first, so a full sweep takes about as
+long as its slowest day. Days whose answers are cached are reported
+straight away and never reach the pool.
+
+The pool is of processes unless `--executor thread` is given, which
+scales on the free-threaded build without pickling any results (see
+`{{ cookiecutter.package_name }}.parallel`). Forking a process with threads running is unsafe,
+so the watchdog is off for days run in a thread pool.
+"""
+
+import time
+from concurrent.futures import as_completed
+from typing import Any
+
+import click
+
+from {{ cookiecutter.package_name }}.generate_readme import get_all_timings
+from {{ cookiecutter.package_name }}.harness import (
+    PartResult,
+    available_days,
+    cache_key,
+    cache_results,
+    cached_answers,
+    day_options,
+    report,
+    report_cached,
+    solve_day,
+)
+from {{ cookiecutter.package_name }}.parallel import EXECUTORS, make_executor
+
+
+def schedule(days: list[int]) -> list[int]:
+    """Order days so the historically slowest ones start first.
+
+    Days with no recorded timings are treated as the slowest, since
+    there is nothing to say they will finish quickly.
+    """
+    totals: dict[int, float] = {}
+    for (day, _, language), seconds in get_all_timings().items():
+        if language == "python":
+            totals[day] = totals.get(day, 0.0) + seconds
+    return sorted(days, key=lambda day: -totals.get(day, float("inf")))
+
+
+def run_days(
+    days: list[int],
+    jobs: int = 1,
+    cache: bool = True,
+    executor: str = "process",
+    **options: Any,
+) -> None:
+    """Solve each day, printing and saving results as they complete.
+
+    Results are always reported from this process, so worker processes
+    never write to the outputs or timings files concurrently.
+
+    Args:
+        days: Day numbers to run
+        jobs: Number of workers; 1 runs everything in-process
+        cache: If True, use cached answers where they are still valid
+        executor: "process" or "thread", the kind of pool to use
+        **options: Keyword arguments accepted by `solve_day`
+    """
+
+    keys = {day: cache_key(day, cache, **options) for day in days}
+
+    def finish(day: int, results: list[PartResult]) -> None:
+        print(f"Day {day:02d}")
+        report(
+            day, results, options.get("test", False), options.get("synthetic")
+        )
+        cache_results(day, keys[day], results)
+
+    unsolved = []
+    for day in days:
+        if answers := cached_answers(keys[day], options.get("part", "both")):
+            print(f"Day {day:02d}")
+            report_cached(
+                day,
+                answers,
+                options.get("test", False),
+                options.get("synthetic"),
+            )
+        else:
+            unsolved.append(day)
+
+    if jobs <= 1:
+        for day in unsolved:
+            finish(day, solve_day(day, **options))
+        return
+
+    if executor == "thread":
+        options.update(timeout=0, max_memory=0)
+    with make_executor(executor, jobs) as pool:
+        futures = {
+            pool.submit(solve_day, day, **options): day
+            for day in schedule(unsolved)
+        }
+        for future in as_completed(futures):
+            finish(futures[future], future.result())
+
+
+@click.command()
+@click.option(
+    "--day",
+    "days",
+    type=int,
+    multiple=True,
+    help="Day to run; repeat for several (default: all with input)",
+)
+@day_options
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of workers",
+)
+@click.option(
+    "--executor",
+    type=click.Choice(EXECUTORS),
+    default="process",
+    show_default=True,
+    help="Run days in a pool of processes or of threads (with --jobs)",
+)
+def main(
+    days: tuple[int, ...], jobs: int, executor: str, **options: Any
+) -> None:
+    """Run Advent of Code {{ cookiecutter.year }} solutions in one interpreter."""
+    selected = list(days) or available_days(
+        use_example=options["test"], synthetic=options["synthetic"]
+    )
+    start = time.perf_counter()
+    run_days(selected, jobs=jobs, executor=executor, **options)
+    elapsed = time.perf_counter() - start
+    print(f"Ran {len(selected)} day(s) in {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""Run a stage of a day in a child process under time and memory limits.
+
+Each stage (the parse or one part) is forked into a child, which caps
+its address space with RLIMIT_AS and sends its result back through a
+pipe. The parent kills the child once the stage runs past its time
+limit. Either overrun is raised as `Overrun`, which the harness reports
+as TIMEOUT or OOM before carrying on with the rest of the run. Any other
+error in the stage is raised again in the parent, as if it had run
+in-process.
+
+The limits are for one run of a stage, so the time limit is multiplied
+by the number of runs when benchmarking. Defaults and per-part budgets
+are set in pyproject.toml, with times in seconds and memory in MiB:
+
+    [tool.{{ cookiecutter.package_name }}.watchdog]
+    timeout = 60.0
+    memory_mb = 4096
+
+    [tool.{{ cookiecutter.package_name }}.watchdog.budgets]
+    day02 = { part2 = 120.0 }
+
+    [tool.{{ cookiecutter.package_name }}.watchdog.memory]
+    day10 = { part1 = 512 }
+
+A stage with no limits at all runs in-process as before, and so does
+every stage where `os.fork` is missing, such as on Windows. Without the
+`resource` module (or RLIMIT_AS) the memory limit is not enforced.
+"""
+
+import os
+import pickle
+import select
+import signal
+import sys
+import time
+import traceback
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from typing import Any
+
+from {{ cookiecutter.package_name }} import config
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+TIMEOUT = "TIMEOUT"
+OOM = "OOM"
+MIB = 1024**2
+READ_SIZE = 1 << 16
+
+
+@dataclass(frozen=True)
+class Limits:
+    """What one call of a stage may use, where None is no limit."""
+
+    seconds: float | None = None
+    memory_bytes: int | None = None
+
+    @property
+    def unlimited(self) -> bool:
+        return self.seconds is None and self.memory_bytes is None
+
+    def for_runs(self, runs: int) -> "Limits":
+        """Scale the time limit to cover several runs of the stage."""
+        if self.seconds is None:
+            return self
+        return replace(self, seconds=self.seconds * max(runs, 1))
+
+
+class Overrun(Exception):
+    """A stage went over its time or memory limit."""
+
+    def __init__(self, status: str, elapsed: float) -> None:
+        super().__init__(f"{status} after {elapsed:.3f}s")
+        self.status = status
+        self.elapsed = elapsed
+
+
+def stage_limits(
+    day: int,
+    part: int,
+    timeout: float | None = None,
+    max_memory: int | None = None,
+) -> Limits:
+    """Find the limits for one stage of a day.
+
+    Args:
+        day: Day number (1-25)
+        part: Part number, or 0 for the parse
+        timeout: Seconds per run, overriding the config (0 for no limit)
+        max_memory: MiB, overriding the config (0 for no limit)
+    """
+    settings = config.section("watchdog")
+    if timeout is None:
+        timeout = config.part_budget("watchdog", day, part)
+        if timeout is None:
+            timeout = settings.get("timeout")
+    if max_memory is None:
+        max_memory = config.part_budget("watchdog", day, part, "memory")
+        if max_memory is None:
+            max_memory = settings.get("memory_mb")
+    return Limits(
+        timeout or None, int(max_memory * MIB) if max_memory else None
+    )
+
+
+def enforceable(limits: Limits) -> Limits:
+    """Drop any limits this platform cannot enforce."""
+    if not hasattr(os, "fork"):
+        return Limits()
+    if resource is None or not hasattr(resource, "RLIMIT_AS"):
+        return replace(limits, memory_bytes=None)
+    return limits
+
+
+def limit_memory(limit: int) -> None:
+    """Cap this process's address space, keeping any lower hard limit."""
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def child_outcome(
+    limits: Limits, func: Callable[..., Any], args: tuple[Any, ...]
+) -> bytes:
+    """Call the stage in the child and pickle what happened."""
+    if limits.memory_bytes is not None:
+        limit_memory(limits.memory_bytes)
+    try:
+        return pickle.dumps(("ok", func(*args)))
+    except MemoryError:
+        return pickle.dumps((OOM, None))
+    except BaseException as e:
+        try:
+            return pickle.dumps(("error", e))
+        except Exception:
+            # The error itself cannot be sent back, so send its traceback
+            error = RuntimeError(traceback.format_exc())
+            return pickle.dumps(("error", error))
+
+
+def read_result(pipe: int, deadline: float | None) -> bytes | None:
+    """Read everything from a pipe, or None if the deadline passes."""
+    chunks = []
+    while True:
+        remaining = None
+        if deadline is not None:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return None
+        ready, _, _ = select.select([pipe], [], [], remaining)
+        if not ready:
+            return None
+        chunk = os.read(pipe, READ_SIZE)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def call_limited(limits: Limits, func: Callable[..., Any], *args: Any) -> Any:
+    """Call a function in a child process, within some limits.
+
+    The function and its arguments are inherited by the forked child,
+    so only the result has to be picklable. Where no limit can be
+    enforced the function is called in-process instead.
+
+    Raises:
+        Overrun: If the call takes too long or runs out of memory
+    """
+    limits = enforceable(limits)
+    if limits.unlimited:
+        return func(*args)
+    # Anything still buffered would otherwise be written by both processes
+    sys.stdout.flush()
+    sys.stderr.flush()
+    read_fd, write_fd = os.pipe()
+    start = time.perf_counter()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        try:
+            payload = child_outcome(limits, func, args)
+            with os.fdopen(write_fd, "wb") as pipe:
+                pipe.write(payload)
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    deadline = None if limits.seconds is None else start + limits.seconds
+    payload = None
+    try:
+        payload = read_result(read_fd, deadline)
+    finally:
+        os.close(read_fd)
+        if payload is None:
+            # Out of time, or the parent was interrupted
+            os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+    elapsed = time.perf_counter() - start
+
+    if payload is None:
+        raise Overrun(TIMEOUT, elapsed)
+    if not payload:
+        # Killed without a word, such as by a failed allocation in C code
+        if limits.memory_bytes is not None:
+            raise Overrun(OOM, elapsed)
+        raise RuntimeError("stage exited without a result")
+    kind, value = pickle.loads(payload)
+    if kind == OOM:
+        raise Overrun(OOM, elapsed)
+    if kind == "error":
+        raise value
+    return value
@@ -0,0 +1,154 @@
+"""Check the input downloader against a local stand-in for the site.
+
+A threaded `http.server` serves each day's input at the same path as
+Advent of Code. It can be told to fail a day's first few requests with
+a 503, or every request with a 404, to check the retries, and it counts
+the requests in flight, to check that `--concurrency` bounds them.
+"""
+
+import asyncio
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from {{ cookiecutter.package_name }} import locations, setup_day
+
+YEAR = {{ cookiecutter.year }}
+SESSION = "test-session"
+# Long enough for concurrent requests to overlap at the server
+DELAY = 0.05
+
+
+class StandIn(ThreadingHTTPServer):
+    """A server for day inputs that records how it was used."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.lock = threading.Lock()
+        self.requests: Counter[int] = Counter()
+        self.failures: dict[int, int] = {}
+        self.unreleased: set[int] = set()
+        self.cookies: set[str] = set()
+        self.in_flight = 0
+        self.most_in_flight = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class Handler(BaseHTTPRequestHandler):
+    server: StandIn
+
+    def do_GET(self) -> None:
+        parts = self.path.strip("/").split("/")
+        if len(parts) != 4 or parts[0] != str(YEAR) or parts[3] != "input":
+            self.send_error(404)
+            return
+        day = int(parts[2])
+        server = self.server
+        with server.lock:
+            server.requests[day] += 1
+            server.cookies.add(self.headers.get("Cookie", ""))
+            server.in_flight += 1
+            server.most_in_flight = max(server.most_in_flight, server.in_flight)
+            failing = server.requests[day] <= server.failures.get(day, 0)
+        time.sleep(DELAY)
+        with server.lock:
+            server.in_flight -= 1
+        if day in server.unreleased:
+            self.send_error(404)
+            return
+        if failing:
+            self.send_error(503)
+            return
+        body = f"input for day {day}\n".encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[StandIn]:
+    stand_in = StandIn()
+    thread = threading.Thread(target=stand_in.serve_forever, daemon=True)
+    thread.start()
+    yield stand_in
+    stand_in.shutdown()
+    stand_in.server_close()
+
+
+@pytest.fixture
+def inputs_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Write inputs to a temporary directory, without waiting to retry."""
+    monkeypatch.setattr(locations, "INPUTS_DIR", tmp_path)
+    monkeypatch.setattr(setup_day, "BACKOFF", 0.0)
+    monkeypatch.setenv("AOC_SESSION", SESSION)
+    return tmp_path
+
+
+def test_downloads_missing_inputs(server: StandIn, inputs_dir: Path) -> None:
+    (inputs_dir / "day02.txt").write_text("already here\n")
+    created = setup_day.download_missing(YEAR, [1, 2, 3], server.url, 4, 0)
+    assert sorted(Path(path).name for path in created) == [
+        "day01.txt",
+        "day03.txt",
+    ]
+    assert (inputs_dir / "day01.txt").read_text() == "input for day 1\n"
+    assert (inputs_dir / "day02.txt").read_text() == "already here\n"
+    assert set(server.requests) == {1, 3}
+    assert server.cookies == {f"session={SESSION}"}
+
+
+def test_retries_server_errors(server: StandIn, inputs_dir: Path) -> None:
+    server.failures = {1: 2, 2: 5}
+    created = setup_day.download_missing(YEAR, [1, 2], server.url, 4, 2)
+    assert [Path(path).name for path in created] == ["day01.txt"]
+    # Day 1 succeeds on its last retry; day 2 runs out of them
+    assert server.requests == {1: 3, 2: 3}
+    assert not (inputs_dir / "day02.txt").exists()
+
+
+def test_does_not_retry_unreleased_days(server: StandIn) -> None:
+    server.unreleased = {6}
+    results = asyncio.run(
+        setup_day.download_inputs(YEAR, [6], SESSION, server.url, retries=3)
+    )
+    assert isinstance(results[6], ValueError)
+    assert "not available yet" in str(results[6])
+    assert server.requests == {6: 1}
+
+
+def test_concurrency_is_bounded(server: StandIn, inputs_dir: Path) -> None:
+    days = list(range(1, 9))
+    created = setup_day.download_missing(YEAR, days, server.url, 2, 0)
+    assert len(created) == len(days)
+    assert server.most_in_flight == 2
+
+
+def test_base_url_from_environment(
+    server: StandIn, inputs_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Only the download is under test, so leave the day's files alone
+    monkeypatch.setattr(setup_day, "create_day_files", lambda day: [])
+    result = CliRunner().invoke(
+        setup_day.main,
+        ["--days", "4-5"],
+        env={"AOC_BASE_URL": server.url},
+    )
+    assert result.exit_code == 0, result.output
+    assert (inputs_dir / "day04.txt").read_text() == "input for day 4\n"
+    assert set(server.requests) == {4, 5}